@@ -0,0 +1,134 @@
+"""
+Benchmark JSON, MessagePack i CBOR kodiranja odgovora
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Za stranicu od 100 ticketa, detalje jednog ticketa i statistike mjeri
+kodiranje na serveru (JSON put kakav koriste endpointovi naspram
+``model_dump`` + binarni encoder) i dekodiranje na klijentu, te veličinu
+tijela. Formati čiji paketi nisu instalirani se preskaču.
+
+Pokretanje: python -m benchmarks.bench_formats
+"""
+
+import json
+import timeit
+
+from src.api.formats import BINARY_ENCODERS, CBOR_MEDIA_TYPE, MSGPACK_MEDIA_TYPE
+from src.models.record import TicketRecord
+from src.models.ticket import (
+    PaginatedResponse,
+    StatsResponse,
+    TicketDetail,
+    TicketListItem,
+)
+from src.services.fragment_cache import list_item_data
+
+from .bench_models import make_page
+
+REPEAT = 200
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+
+def make_payloads():
+    """(ime, JSON kodiranje kao u endpointu, JSON-kompatibilni podaci za binarno)"""
+    tickets = make_page()
+    facets = {"status": {"open": 500, "closed": 500}}
+    page = PaginatedResponse.model_construct(
+        items=[TicketListItem.from_trusted(ticket) for ticket in tickets],
+        total=1000,
+        page=1,
+        per_page=len(tickets),
+        pages=10,
+        facets=facets,
+    )
+    detail = TicketDetail.from_trusted(
+        TicketRecord.from_todo(
+            {"id": 7, "todo": "Ticket number 7", "completed": False, "userId": 3},
+            status="open",
+            priority="medium",
+            assignee="user_3",
+        )
+    )
+    stats = StatsResponse(
+        total_tickets=1000,
+        open_tickets=500,
+        closed_tickets=500,
+        priority_breakdown={"low": 333, "medium": 334, "high": 333},
+    )
+    return (
+        (
+            "page",
+            lambda: page.model_dump_json(exclude_none=True).encode(),
+            lambda: {
+                "items": [list_item_data(ticket) for ticket in tickets],
+                "total": 1000,
+                "page": 1,
+                "per_page": len(tickets),
+                "pages": 10,
+                "facets": facets,
+            },
+        ),
+        (
+            "detail",
+            lambda: detail.model_dump_json().encode(),
+            lambda: detail.model_dump(mode="json"),
+        ),
+        (
+            "stats",
+            lambda: stats.model_dump_json().encode(),
+            lambda: stats.model_dump(mode="json"),
+        ),
+    )
+
+
+def codecs():
+    """(ime, encoder, decoder) za instalirane binarne formate"""
+    result = []
+    binary_decoders = (
+        (MSGPACK_MEDIA_TYPE, "msgpack", msgpack and msgpack.unpackb),
+        (CBOR_MEDIA_TYPE, "cbor", cbor2 and cbor2.loads),
+    )
+    for media_type, name, decode in binary_decoders:
+        encode = BINARY_ENCODERS.get(media_type)
+        if encode is None:
+            print(f"{name}: paket nije instaliran, preskačem")
+            continue
+        result.append((name, encode, decode))
+    return result
+
+
+def _report(name, encode, decode):
+    body = encode()
+    encode_s = min(timeit.repeat(encode, number=REPEAT, repeat=5))
+    decode_s = min(timeit.repeat(lambda: decode(body), number=REPEAT, repeat=5))
+    print(
+        f"{name:>10}: kodiranje {encode_s / REPEAT * 1e6:8.1f} µs, "
+        f"dekodiranje {decode_s / REPEAT * 1e6:8.1f} µs, "
+        f"{len(body):6d} B"
+    )
+    return decode(body)
+
+
+def main():
+    binary = codecs()
+    for payload_name, encode_json, build_data in make_payloads():
+        print(f"{payload_name}:")
+        expected = _report("json", encode_json, json.loads)
+        for name, encode, decode in binary:
+            decoded = _report(name, lambda: encode(build_data()), decode)
+            assert decoded == expected
+
+
+if __name__ == "__main__":
+    main()
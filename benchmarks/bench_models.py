@@ -0,0 +1,107 @@
+"""
+Benchmark konstrukcije i serijalizacije modela za stranicu od 100 ticketa
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Uspoređuje stari put (validacija pri konstrukciji, pa FastAPI ponovno validira
+kroz response_model i enkodira preko jsonable_encoder + json) s brzim putem
+(``from_trusted`` + ``model_construct`` + ``model_dump_json``) i sa slaganjem
+stranice iz toplog cachea JSON fragmenata.
+
+Pokretanje: python -m benchmarks.bench_models
+"""
+
+import json
+import timeit
+
+from fastapi.encoders import jsonable_encoder
+
+from src.models.record import TicketRecord
+from src.models.ticket import PaginatedResponse, TicketListItem
+from src.services.fragment_cache import FragmentCache, assemble_page
+
+PAGE_SIZE = 100
+REPEAT = 200
+
+
+def make_page():
+    return [
+        TicketRecord(
+            ticket_id,
+            f"Ticket number {ticket_id} " + "x" * (ticket_id % 120),
+            "closed" if ticket_id % 2 else "open",
+            ("low", "medium", "high")[ticket_id % 3],
+            f"user_{ticket_id % 7}",
+        )
+        for ticket_id in range(1, PAGE_SIZE + 1)
+    ]
+
+
+def validated_path(tickets_data):
+    """Stari put: validacija, FastAPI re-validacija i jsonable_encoder"""
+    page = PaginatedResponse(
+        items=[
+            TicketListItem(
+                id=ticket.id,
+                title=ticket.title,
+                status=ticket.status.value,
+                priority=ticket.priority.value,
+            )
+            for ticket in tickets_data
+        ],
+        total=1000,
+        page=1,
+        per_page=PAGE_SIZE,
+        pages=10,
+    )
+    revalidated = PaginatedResponse.model_validate(page.model_dump())
+    return json.dumps(jsonable_encoder(revalidated, exclude_none=True)).encode()
+
+
+def trusted_path(tickets_data):
+    """Novi put: konstrukcija bez validacije i direktna serijalizacija"""
+    page = PaginatedResponse.model_construct(
+        items=[
+            TicketListItem.from_trusted(ticket_data) for ticket_data in tickets_data
+        ],
+        total=1000,
+        page=1,
+        per_page=PAGE_SIZE,
+        pages=10,
+        facets=None,
+    )
+    return page.model_dump_json(exclude_none=True).encode()
+
+
+_fragment_cache = FragmentCache()
+
+
+def fragment_path(tickets_data):
+    """Stranica iz cachea fragmenata (isti sadržaj stavki = topli cache)"""
+    fragments = _fragment_cache.fragments(tickets_data)
+    return assemble_page(fragments, 1000, 1, PAGE_SIZE, 10)
+
+
+def main():
+    tickets_data = make_page()
+    assert json.loads(validated_path(tickets_data)) == json.loads(
+        trusted_path(tickets_data)
+    )
+    assert fragment_path(tickets_data) == trusted_path(tickets_data)
+
+    paths = (
+        ("validated", validated_path),
+        ("trusted", trusted_path),
+        ("fragments", fragment_path),
+    )
+    for name, path in paths:
+        seconds = min(
+            timeit.repeat(lambda: path(tickets_data), number=REPEAT, repeat=5)
+        )
+        per_item_us = seconds / (REPEAT * PAGE_SIZE) * 1e6
+        print(f"{name:>10}: {per_item_us:6.2f} µs po ticketu")
+
+
+if __name__ == "__main__":
+    main()
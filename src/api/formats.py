@@ -0,0 +1,86 @@
+"""
+Pregovaranje formata odgovora (JSON, MessagePack, CBOR) prema Accept headeru
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Binarni formati kodiraju iste podatke kao JSON odgovor (``model_dump`` u
+``mode="json"``), pa je shema odgovora ista - mijenja se samo kodiranje.
+MessagePack (paket ``msgpack``) i CBOR (paket ``cbor2``) su opcionalni; ako
+paket nije instaliran, format se ne nudi i odgovor ostaje JSON.
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import Request, Response
+
+try:
+    import msgpack  # type: ignore[import]
+except ImportError:  # pragma: no cover - opcionalna ovisnost
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover - opcionalna ovisnost
+    cbor2 = None  # type: ignore[assignment]
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+CBOR_MEDIA_TYPE = "application/cbor"
+
+
+def _binary_encoders() -> Dict[str, Callable[[Any], bytes]]:
+    """Media type -> encoder, samo za instalirane pakete"""
+    encoders: Dict[str, Callable[[Any], bytes]] = {}
+    if msgpack is not None:
+        encoders[MSGPACK_MEDIA_TYPE] = msgpack.packb
+        encoders["application/x-msgpack"] = msgpack.packb
+    if cbor2 is not None:
+        encoders[CBOR_MEDIA_TYPE] = cbor2.dumps
+    return encoders
+
+
+BINARY_ENCODERS = _binary_encoders()
+
+
+def choose_format(accept: str) -> Optional[str]:
+    """Binarni media type s najvećom q-vrijednošću, ili None za JSON
+
+    JSON ima prednost kod jednakih q-vrijednosti i kod ``*/*``, pa klijenti
+    koji ništa ne traže eksplicitno dobivaju JSON kao i dosad.
+    """
+    best, best_quality = None, 0.0
+    json_quality = 0.0
+    for part in accept.split(","):
+        media_type, _, params = part.strip().partition(";")
+        media_type = media_type.strip().lower()
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if media_type in BINARY_ENCODERS:
+            if quality > best_quality:
+                best, best_quality = media_type, quality
+        elif media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            json_quality = max(json_quality, quality)
+    return best if best_quality > json_quality else None
+
+
+async def get_response_format(request: Request) -> Optional[str]:
+    """Dependency: binarni format odgovora iz Accept headera ili None za JSON"""
+    return choose_format(request.headers.get("accept", ""))
+
+
+def encoded_response(
+    data: Any, media_type: str, sub_response: Optional[Response] = None
+) -> Response:
+    """Kodiraj JSON-kompatibilne podatke u traženi binarni format"""
+    headers = dict(sub_response.headers) if sub_response is not None else {}
+    return Response(
+        content=BINARY_ENCODERS[media_type](data),
+        media_type=media_type,
+        headers=headers,
+    )
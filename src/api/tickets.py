@@ -9,21 +9,71 @@ Razlog: Standardni FastAPI router pattern s async endpointovima i vanjskim API i
 Prompt: "Kreiraj FastAPI router za ticket endpointove s validacijom, error handling, paginacijom i DummyJSON integracijom"
 """
 
-from typing import Optional
-from fastapi import APIRouter, HTTPException, Query, Depends
+from typing import AsyncIterator, List, Optional, Tuple
+from fastapi import APIRouter, Header, HTTPException, Query, Depends, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+import asyncio
 import math
 
+from ..config import settings
 from ..models.ticket import (
-    Ticket,
     TicketDetail,
-    TicketListItem,
+    BatchTicketRequest,
+    BatchTicketResponse,
     PaginatedResponse,
     TicketFilters,
     StatsResponse,
+    StatsHistoryResponse,
+    GroupedStatsResponse,
     StatusEnum,
     PriorityEnum,
+    SORT_PATTERN,
+    FACETS_PATTERN,
+    LIST_FIELDS,
+    LIST_FIELDS_PATTERN,
+    DETAIL_FIELDS,
+    DETAIL_FIELDS_PATTERN,
+    parse_fields,
 )
+from .formats import encoded_response, get_response_format
+from ..services import json_codec
 from ..services.external_api import ticket_transform_service, dummy_json_service
+from ..services.ticket_store import ticket_store
+from ..services.fragment_cache import assemble_page, fragment_cache, list_item_data
+from ..services.batch_lookup import batch_lookup
+from ..services.export import (
+    EXPORT_FORMATS,
+    prefetch_first,
+    store_batches,
+    stream_export,
+    upstream_batches,
+)
+from ..services.metrics import metrics
+from ..services.prefetch import PagePrefetcher
+from ..services.single_flight import SingleFlight
+from ..services.sse import KEEPALIVE, SSE_HEADERS, SSE_MEDIA_TYPE, format_event
+from ..services.change_feed import change_feed
+from ..services.store_sync import store_sync
+from ..services.stats_history import WINDOW_PATTERN, parse_window, stats_history
+from ..services.stats_engine import (
+    GROUP_BY_PATTERN,
+    SUMMARY_GROUP_BY,
+    GroupByAccumulator,
+)
+from ..services.filter_expression import (
+    MAX_EXPRESSION_LENGTH,
+    FilterExpressionError,
+    compile_filter,
+)
+from ..services.query_planner import (
+    PLAN_HEADER,
+    PlanSource,
+    QueryPlan,
+    page_cache,
+    page_cache_key,
+    query_planner,
+)
 
 router = APIRouter()
 
@@ -38,17 +88,202 @@ async def get_ticket_filters(
     ),
     page: int = Query(1, ge=1, description="Broj stranice"),
     per_page: int = Query(30, ge=1, le=100, description="Broj stavki po stranici"),
+    sort: Optional[str] = Query(
+        None,
+        pattern=SORT_PATTERN,
+        description="Sortiraj po id/title/status/priority/assignee, '-' za silazno",
+    ),
+    facets: Optional[str] = Query(
+        None,
+        pattern=FACETS_PATTERN,
+        description="Facet brojevi za polja, npr. status,priority,assignee",
+    ),
+    filter_expression: Optional[str] = Query(
+        None,
+        alias="filter",
+        max_length=MAX_EXPRESSION_LENGTH,
+        description="Filter izraz, npr. (status:open AND priority:high) OR assignee:emilys",
+    ),
+    fields: Optional[str] = Query(
+        None,
+        pattern=LIST_FIELDS_PATTERN,
+        description="Polja stavki u odgovoru, npr. id,title",
+    ),
 ) -> TicketFilters:
     """Dependency za parsiranje query parametara"""
+    _validate_filter_expression(filter_expression)
+
     return TicketFilters(
-        status=status, priority=priority, search=q, page=page, per_page=per_page
+        status=status,
+        priority=priority,
+        search=q,
+        page=page,
+        per_page=per_page,
+        sort=sort,
+        facets=_parse_facets(facets),
+        filter_expression=filter_expression,
+        fields=parse_fields(fields, LIST_FIELDS),
+    )
+
+
+def _validate_filter_expression(filter_expression: Optional[str]) -> None:
+    """Kompajliraj izraz odmah da neispravan vrati 422; rezultat je cachiran"""
+    if not filter_expression:
+        return
+    try:
+        compile_filter(filter_expression)
+    except FilterExpressionError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid filter: {e}")
+
+
+def _parse_facets(facets: Optional[str]) -> List[str]:
+    """Razdvoji facets parametar u listu polja bez duplikata"""
+    if not facets:
+        return []
+    return list(dict.fromkeys(facets.split(",")))
+
+
+def _model_response(
+    model: BaseModel,
+    sub_response: Response,
+    exclude_none: bool = False,
+    fields: Optional[Tuple[str, ...]] = None,
+    media_type: Optional[str] = None,
+) -> Response:
+    """Serijaliziraj model direktno u JSON (ili binarni) odgovor
+
+    FastAPI bi vraćeni model pretvorio u dict i ponovno validirao kroz
+    ``response_model``; modeli iz ``from_trusted`` su već ispravni pa se to
+    preskače. ``response_model`` na ruti ostaje za OpenAPI dokumentaciju.
+    ``fields`` ograničava serijalizaciju na tražena polja, a ``media_type``
+    bira binarni format iz ``get_response_format``.
+    """
+    include = set(fields) if fields is not None else None
+    if media_type is not None:
+        data = model.model_dump(mode="json", exclude_none=exclude_none, include=include)
+        return encoded_response(data, media_type, sub_response)
+    return Response(
+        content=model.model_dump_json(exclude_none=exclude_none, include=include),
+        media_type="application/json",
+        headers=dict(sub_response.headers),
+    )
+
+
+# Redoslijed polja u TicketDetail JSON-u, oko kojeg se umeće source_data
+_DETAIL_ORDER = tuple(TicketDetail.model_fields)
+_SOURCE_INDEX = _DETAIL_ORDER.index("source_data")
+
+
+def _raw_source_response(
+    ticket_data,
+    raw_source: bytes,
+    sub_response: Response,
+    fields: Optional[Tuple[str, ...]] = None,
+) -> Response:
+    """``TicketDetail`` JSON s izvornim upstream bajtovima kao ``source_data``
+
+    Serijaliziraju se samo izvedena polja (prije i poslije ``source_data``,
+    istim redoslijedom kao model), a izvorni todo se umeće bez parsiranja i
+    ponovnog kodiranja.
+    """
+    include = set(fields) if fields is not None else set(_DETAIL_ORDER)
+    model = TicketDetail.from_trusted(ticket_data, with_source=False)
+
+    parts = []
+    head = include.intersection(_DETAIL_ORDER[:_SOURCE_INDEX])
+    if head:
+        parts.append(model.model_dump_json(include=head)[1:-1].encode())
+    if "source_data" in include:
+        parts.append(b'"source_data":' + raw_source.strip())
+    tail = include.intersection(_DETAIL_ORDER[_SOURCE_INDEX + 1 :])
+    if tail:
+        parts.append(model.model_dump_json(include=tail)[1:-1].encode())
+
+    return Response(
+        content=b"{" + b",".join(parts) + b"}",
+        media_type="application/json",
+        headers=dict(sub_response.headers),
     )
 
 
+def _page_data(
+    tickets_data, total: int, filters: TicketFilters, pages: int, facets
+) -> dict:
+    """``PaginatedResponse`` kao JSON-kompatibilan dict (za binarne formate)"""
+    data = {
+        "items": [list_item_data(ticket, filters.fields) for ticket in tickets_data],
+        "total": total,
+        "page": filters.page,
+        "per_page": filters.per_page,
+        "pages": pages,
+    }
+    if facets is not None:
+        data["facets"] = facets
+    return data
+
+
+async def _fetch_upstream_page(filters: TicketFilters):
+    """Dohvati jednu stranicu iz DummyJSON-a i filtriraj je po statusu/prioritetu"""
+    # Izračunaj skip i limit za paginaciju
+    skip = (filters.page - 1) * filters.per_page
+
+    # Ako imamo search query, koristi search endpoint
+    if filters.search:
+        data = await dummy_json_service.search_todos(
+            query=filters.search, limit=filters.per_page, skip=skip
+        )
+    else:
+        # Inače dohvati sve todos
+        data = await dummy_json_service.get_todos(limit=filters.per_page, skip=skip)
+
+    # Transformiraj todos u tickete; stavke liste ne sadrže assigneeja pa se
+    # korisnici ne dohvaćaju
+    todos = data.get("todos", [])
+    tickets_data = await ticket_transform_service.transform_todos_to_tickets(
+        todos, resolve_assignee=False
+    )
+
+    # Filtriraj po statusu i prioritetu ako je potrebno
+    if filters.status or filters.priority:
+        filtered_tickets = []
+        for ticket_data in tickets_data:
+            if filters.status and ticket_data.status != filters.status:
+                continue
+            if filters.priority and ticket_data.priority != filters.priority:
+                continue
+            filtered_tickets.append(ticket_data)
+        tickets_data = filtered_tickets
+
+    return tickets_data, data.get("total", len(tickets_data))
+
+
+async def _prefetch_page(filters: TicketFilters):
+    """Stranica za cache unaprijed, uz dohvat assigneeja za detalje ticketa"""
+    tickets_data, total = await _fetch_upstream_page(filters)
+    await ticket_transform_service.resolve_users(
+        ticket.user_id for ticket in tickets_data
+    )
+    return tickets_data, total
+
+
+# Dohvat sljedeće stranice unaprijed kod sekvencijalnog listanja
+page_prefetcher = PagePrefetcher(
+    page_cache, _prefetch_page, max_inflight=settings.prefetch_concurrency
+)
+metrics.register_gauge("prefetch.hit_rate", page_prefetcher.hit_rate)
+
+
 @router.get(
-    "/", response_model=PaginatedResponse, summary="Dohvati paginiranu listu ticketa"
+    "/",
+    response_model=PaginatedResponse,
+    response_model_exclude_none=True,
+    summary="Dohvati paginiranu listu ticketa",
 )
-async def get_tickets(filters: TicketFilters = Depends(get_ticket_filters)):
+async def get_tickets(
+    response: Response,
+    filters: TicketFilters = Depends(get_ticket_filters),
+    response_format: Optional[str] = Depends(get_response_format),
+):
     """
     Dohvaća paginiranu listu ticketa s opcionalnim filtriranjem.
 
@@ -57,48 +292,59 @@ async def get_tickets(filters: TicketFilters = Depends(get_ticket_filters)):
     - **q**: Pretraži po nazivu ticketa
     - **page**: Broj stranice (default: 1)
     - **per_page**: Broj stavki po stranici (default: 30, max: 100)
+    - **sort**: Sortiraj po id/title/status/priority/assignee (npr. `-priority`)
+    - **facets**: Dodaj broj pogodaka po statusu/prioritetu/assigneeju
+    - **filter**: Filter izraz s AND/OR/NOT i zagradama nad poljima status,
+      priority, assignee, title i id (npr. `id:1..50 AND NOT status:closed`)
+    - **fields**: Vrati samo tražena polja stavki (npr. `id,title`)
+
+    Uz `Accept: application/msgpack` ili `application/cbor` odgovor je u tom
+    binarnom formatu, s istom shemom.
     """
     try:
-        # Izračunaj skip i limit za paginaciju
-        skip = (filters.page - 1) * filters.per_page
-
-        # Ako imamo search query, koristi search endpoint
-        if filters.search:
-            data = await dummy_json_service.search_todos(
-                query=filters.search, limit=filters.per_page, skip=skip
-            )
+        response.headers["Vary"] = "Accept"
+
+        # Planer bira izvor: lokalni store, cache stranica ili DummyJSON
+        plan = query_planner.plan_list(filters)
+        response.headers[PLAN_HEADER] = plan.header_value()
+
+        facets = None
+        if plan.source is PlanSource.STORE:
+            await ticket_store.ensure_fresh()
+            tickets_data, total = ticket_store.query(filters)
+            if filters.facets:
+                facets = ticket_store.facet_counts(filters)
+        elif plan.source is PlanSource.CACHE:
+            tickets_data, total = plan.cached
         else:
-            # Inače dohvati sve todos
-            data = await dummy_json_service.get_todos(limit=filters.per_page, skip=skip)
-
-        # Transformiraj todos u tickete
-        todos = data.get("todos", [])
-        tickets_data = await ticket_transform_service.transform_todos_to_tickets(todos)
-
-        # Filtriraj po statusu i prioritetu ako je potrebno
-        if filters.status or filters.priority:
-            filtered_tickets = []
-            for ticket_data in tickets_data:
-                if filters.status and ticket_data["status"] != filters.status:
-                    continue
-                if filters.priority and ticket_data["priority"] != filters.priority:
-                    continue
-                filtered_tickets.append(ticket_data)
-            tickets_data = filtered_tickets
-
-        # Kreiraj TicketListItem objekte
-        tickets = [TicketListItem(**ticket_data) for ticket_data in tickets_data]
+            # Stranica koja se već dohvaća unaprijed se čeka, ne dohvaća ponovno
+            pending = page_prefetcher.inflight(filters)
+            page = await asyncio.shield(pending) if pending is not None else None
+            if page is None:
+                page = await _fetch_upstream_page(filters)
+                page_cache.set(page_cache_key(filters), page)
+            tickets_data, total = page
+
+        if plan.source is not PlanSource.STORE and settings.prefetch_enabled:
+            page_prefetcher.served(filters, from_cache=plan.source is PlanSource.CACHE)
 
         # Izračunaj ukupan broj stranica
-        total = data.get("total", len(tickets))
         pages = math.ceil(total / filters.per_page) if total > 0 else 0
 
-        return PaginatedResponse(
-            items=tickets,
-            total=total,
-            page=filters.page,
-            per_page=filters.per_page,
-            pages=pages,
+        if response_format is not None:
+            data = _page_data(tickets_data, total, filters, pages, facets)
+            return encoded_response(data, response_format, response)
+
+        # JSON stavki dolazi iz cachea fragmenata, ključanog po sadržaju zapisa
+        fragments = fragment_cache.fragments(tickets_data, filters.fields)
+
+        body = assemble_page(
+            fragments, total, filters.page, filters.per_page, pages, facets
+        )
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers=dict(response.headers),
         )
 
     except HTTPException:
@@ -107,11 +353,28 @@ async def get_tickets(filters: TicketFilters = Depends(get_ticket_filters)):
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-@router.get("/search", response_model=PaginatedResponse, summary="Pretraži tickete")
+@router.get(
+    "/search",
+    response_model=PaginatedResponse,
+    response_model_exclude_none=True,
+    summary="Pretraži tickete",
+)
 async def search_tickets(
+    response: Response,
     q: str = Query(..., min_length=1, max_length=100, description="Search query"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(30, ge=1, le=100, description="Items per page"),
+    fuzzy: bool = Query(False, description="Typo-tolerant trigram search"),
+    threshold: Optional[float] = Query(
+        None, ge=0, le=1, description="Minimum similarity for fuzzy search"
+    ),
+    facets: Optional[str] = Query(
+        None, pattern=FACETS_PATTERN, description="Facet counts, e.g. status,priority"
+    ),
+    fields: Optional[str] = Query(
+        None, pattern=LIST_FIELDS_PATTERN, description="Item fields, e.g. id,title"
+    ),
+    response_format: Optional[str] = Depends(get_response_format),
 ):
     """
     Pretraži tickete po nazivu.
@@ -119,9 +382,65 @@ async def search_tickets(
     - **q**: Search query string (obavezno)
     - **page**: Broj stranice
     - **per_page**: Broj stavki po stranici
+    - **fuzzy**: Fuzzy pretraga preko lokalnog trigram indeksa, rangirano po sličnosti
+    - **threshold**: Minimalna sličnost 0-1 (default iz `FUZZY_THRESHOLD`)
+    - **facets**: Dodaj broj pogodaka po statusu/prioritetu/assigneeju
+    - **fields**: Vrati samo tražena polja stavki (npr. `id,title`)
+    """
+    filters = TicketFilters(
+        search=q,
+        page=page,
+        per_page=per_page,
+        fuzzy=fuzzy,
+        fuzzy_threshold=threshold,
+        facets=_parse_facets(facets),
+        fields=parse_fields(fields, LIST_FIELDS),
+    )
+    return await get_tickets(response, filters, response_format)
+
+
+async def _compute_stats_summary() -> Tuple[StatsResponse, QueryPlan]:
+    """Statistike iz izvora koji izabere planer, uz plan koji ih je dao"""
+    plan = query_planner.plan_stats()
+    if plan.source is PlanSource.STORE:
+        await ticket_store.ensure_fresh()
+        return StatsResponse(**ticket_store.stats()), plan
+    return await _compute_upstream_stats(), plan
+
+
+# Zajednički, memoizirani izračun za /stats/summary
+stats_summary = SingleFlight(
+    "stats_summary",
+    _compute_stats_summary,
+    ttl=settings.stats_cache_ttl,
+    refresh_ahead=settings.stats_refresh_ahead,
+)
+
+
+async def sample_stats_summary() -> dict:
+    """Trenutne statistike za povijest (dijeli memoizirani izračun)"""
+    stats, _ = await stats_summary.get()
+    return stats.model_dump()
+
+
+async def warm_caches(pages: int) -> None:
+    """Zagrij cacheove za prve zahtjeve nakon starta
+
+    Svi korisnici se učitaju jednim pozivom, pa store (polazišna
+    sinkronizacija) ne dohvaća korisnike jednog po jednog. Zatim se unaprijed
+    pripremi prvih ``pages`` stranica zadane liste i statistike.
     """
-    filters = TicketFilters(search=q, page=page, per_page=per_page)
-    return await get_tickets(filters)
+    await ticket_transform_service.preload_users()
+    await store_sync.run()
+    for page in range(1, pages + 1):
+        filters = TicketFilters(page=page)
+        plan = query_planner.plan_list(filters)
+        if plan.source is PlanSource.STORE:
+            tickets_data, _ = ticket_store.query(filters)
+            fragment_cache.fragments(tickets_data)
+        elif plan.source is PlanSource.UPSTREAM:
+            page_cache.set(page_cache_key(filters), await _fetch_upstream_page(filters))
+    await stats_summary.get()
 
 
 @router.get(
@@ -129,7 +448,9 @@ async def search_tickets(
     response_model=StatsResponse,
     summary="Statistike svih ticketa",
 )
-async def get_ticket_stats():
+async def get_ticket_stats(
+    response: Response, response_format: Optional[str] = Depends(get_response_format)
+):
     """
     Dohvaća agregirane statistike svih dostupnih ticketa.
 
@@ -138,56 +459,372 @@ async def get_ticket_stats():
     - Broj otvorenih/zatvorenih ticketa
     - Raspodjelu po prioritetima
 
-    Napomena: Koristi se maksimalno 1000 ticketa zbog API ograničenja, izvršavanje može potrajati par sekundi
+    Napomena: Iz svježeg lokalnog storea brojevi dolaze iz indeksa; inače se broje
+    sve DummyJSON stranice redom, izvršavanje može potrajati par sekundi.
+    Rezultat se pamti `STATS_CACHE_TTL` sekundi, a istovremeni zahtjevi dijele
+    jedan izračun. `X-Query-Plan` opisuje izračun iz kojeg rezultat potječe.
+    """
+    try:
+        stats, plan = await stats_summary.get()
+        response.headers[PLAN_HEADER] = plan.header_value()
+        response.headers["Vary"] = "Accept"
+
+        if response_format is not None:
+            return _model_response(stats, response, media_type=response_format)
+        return stats
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.get(
+    "/stats/history",
+    response_model=StatsHistoryResponse,
+    response_model_exclude_none=True,
+    summary="Povijest statistika za praćenje trenda",
+)
+async def get_stats_history(
+    window: Optional[str] = Query(
+        None,
+        pattern=WINDOW_PATTERN,
+        description="Prozor unatrag, npr. 900, 15m, 6h ili 1d (default: sve)",
+    ),
+):
+    """
+    Vraća snapshotove statistika iz zadnjeg prozora, najstarije prve.
+
+    - **window**: Sekunde ili broj s jedinicom `s`/`m`/`h`/`d`
+
+    Snapshotovi se uzimaju u pozadini svakih `STATS_HISTORY_INTERVAL` sekundi
+    (najviše `STATS_HISTORY_SIZE` zadnjih), pa ovaj upit ništa ne računa.
+    `trend` je promjena brojeva od prvog do zadnjeg snapshota u prozoru.
+    Uz `STATS_HISTORY_INTERVAL=0` uzorkovanje je isključeno pa vraća 503.
+    """
+    if settings.stats_history_interval <= 0:
+        raise HTTPException(
+            status_code=503,
+            detail="Stats history is disabled (STATS_HISTORY_INTERVAL=0)",
+        )
+    window_seconds = parse_window(window) if window else None
+    snapshots = stats_history.window(window_seconds)
+    return StatsHistoryResponse.model_validate(
+        {
+            "window_seconds": window_seconds,
+            "interval_seconds": settings.stats_history_interval,
+            "snapshots": snapshots,
+            "trend": stats_history.trend(snapshots),
+        }
+    )
+
+
+@router.get(
+    "/stats",
+    response_model=GroupedStatsResponse,
+    response_model_exclude_none=True,
+    summary="Statistike grupirane po statusu, prioritetu i assigneeju",
+)
+async def get_grouped_stats(
+    response: Response,
+    group_by: str = Query(
+        "status",
+        pattern=GROUP_BY_PATTERN,
+        description="Polja grupiranja, npr. status,priority,assignee",
+    ),
+    top_assignees: int = Query(
+        0, ge=0, le=100, description="Broj assigneeja s najviše otvorenih ticketa"
+    ),
+    response_format: Optional[str] = Depends(get_response_format),
+):
+    """
+    Broj ticketa po svakoj kombinaciji traženih polja.
+
+    - **group_by**: Bilo koja kombinacija `status`, `priority` i `assignee`
+    - **top_assignees**: Dodaj K assigneeja s najviše otvorenih ticketa
+
+    Računa se u jednom prolazu kroz lokalni store ili kroz sve DummyJSON
+    stranice redom (bez ograničenja na 1000 ticketa).
+    """
+    accumulator = GroupByAccumulator(
+        tuple(dict.fromkeys(group_by.split(","))), top_assignees
+    )
+    try:
+        plan = query_planner.plan_stats(needs_assignee=accumulator.needs_assignee)
+        response.headers[PLAN_HEADER] = plan.header_value()
+        response.headers["Vary"] = "Accept"
+
+        if plan.source is PlanSource.STORE:
+            await ticket_store.ensure_fresh()
+            accumulator.add(ticket_store.snapshot())
+        else:
+            await accumulator.add_batches(
+                upstream_batches(
+                    TicketFilters(),
+                    settings.stats_page_size,
+                    resolve_assignee=accumulator.needs_assignee,
+                    prefetch=settings.upstream_prefetch_pages,
+                )
+            )
+
+        result = GroupedStatsResponse.model_validate(accumulator.result())
+        return _model_response(
+            result, response, exclude_none=True, media_type=response_format
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+async def _compute_upstream_stats() -> StatsResponse:
+    """Izračunaj statistike nad svim ticketima iz DummyJSON-a
+
+    Stranice se dohvaćaju redom (nekoliko unaprijed), prebroje i odbace, pa
+    memorija ne ovisi o ukupnom broju ticketa. Assigneeji nisu potrebni.
+    """
+    accumulator = GroupByAccumulator(SUMMARY_GROUP_BY)
+    await accumulator.add_batches(
+        upstream_batches(
+            TicketFilters(),
+            settings.stats_page_size,
+            resolve_assignee=False,
+            prefetch=settings.upstream_prefetch_pages,
+        )
+    )
+    return StatsResponse(**accumulator.summary())
+
+
+async def _stats_events(batches) -> AsyncIterator[bytes]:
+    """SSE događaji: ``partial`` nakon svake stranice, pa ``final`` s ukupnim"""
+    accumulator = GroupByAccumulator(SUMMARY_GROUP_BY)
+    try:
+        async for summary in accumulator.summaries(batches):
+            yield format_event(summary, event="partial")
+    except Exception as e:
+        # Status je već poslan - grešku javi kao događaj i zatvori stream
+        yield format_event({"detail": f"Upstream error: {str(e)}"}, event="error")
+        return
+    yield format_event(accumulator.summary(), event="final")
+
+
+@router.get(
+    "/stats/stream",
+    response_class=StreamingResponse,
+    summary="Statistike koje stižu progresivno (Server-Sent Events)",
+)
+async def stream_ticket_stats():
+    """
+    Streama djelomične statistike kao Server-Sent Events.
+
+    Nakon svake obrađene DummyJSON stranice šalje događaj `partial` s
+    trenutnim brojevima (ista shema kao `/tickets/stats/summary`), a na kraju
+    događaj `final` s ukupnim. Iz svježeg lokalnog storea odmah stiže samo
+    `final`; zastarjeli store se ne učitava nego se streamaju DummyJSON
+    stranice. Greška nakon početka streama dolazi kao događaj `error`.
     """
     try:
-        # Prvo dohvati osnovne info da vidimo ukupan broj
-        initial_data = await dummy_json_service.get_todos(limit=1, skip=0)
-        total_available = initial_data.get("total", 0)
-
-        # Dohvati sve dostupne todos za točne statistike
-        # DummyJSON ograničava na max ~1000, ali pokušajmo dohvatiti sve
-        limit = min(total_available, 1000)  # Ne više od 1000 odjednom
-        data = await dummy_json_service.get_todos(limit=limit, skip=0)
-        todos = data.get("todos", [])
-
-        # Ako nema todos, vrati prazne statistike
-        if not todos:
-            return StatsResponse(
-                total_tickets=0,
-                open_tickets=0,
-                closed_tickets=0,
-                priority_breakdown={"low": 0, "medium": 0, "high": 0},
+        plan = query_planner.plan_stats(allow_reload=False)
+        if plan.source is PlanSource.STORE:
+            events = iter([format_event(ticket_store.stats(), event="final")])
+        else:
+            batches = await prefetch_first(
+                upstream_batches(
+                    TicketFilters(),
+                    settings.stats_page_size,
+                    resolve_assignee=False,
+                    prefetch=settings.upstream_prefetch_pages,
+                )
             )
+            events = _stats_events(batches)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
-        # Transformiraj u tickete
-        tickets_data = await ticket_transform_service.transform_todos_to_tickets(todos)
+    return StreamingResponse(
+        events,
+        media_type=SSE_MEDIA_TYPE,
+        headers={PLAN_HEADER: plan.header_value(), **SSE_HEADERS},
+    )
 
-        # Izračunaj statistike
-        total_tickets = len(tickets_data)
-        open_tickets = sum(1 for t in tickets_data if t["status"] == "open")
-        closed_tickets = total_tickets - open_tickets
 
-        # Raspodjela po prioritetima
-        priority_breakdown = {"low": 0, "medium": 0, "high": 0}
-        for ticket_data in tickets_data:
-            priority = ticket_data["priority"]
-            if priority in priority_breakdown:
-                priority_breakdown[priority] += 1
-
-        return StatsResponse(
-            total_tickets=total_tickets,
-            open_tickets=open_tickets,
-            closed_tickets=closed_tickets,
-            priority_breakdown=priority_breakdown,
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Streaming export svih ticketa (NDJSON ili CSV)",
+)
+async def export_tickets(
+    export_format: str = Query(
+        "ndjson", alias="format", pattern="^(ndjson|csv)$", description="ndjson ili csv"
+    ),
+    status: Optional[StatusEnum] = Query(None, description="Filtriraj po statusu"),
+    priority: Optional[PriorityEnum] = Query(
+        None, description="Filtriraj po prioritetu"
+    ),
+    q: Optional[str] = Query(
+        None, min_length=1, max_length=100, description="Pretraži po nazivu"
+    ),
+    sort: Optional[str] = Query(
+        None,
+        pattern=SORT_PATTERN,
+        description="Sortiraj po id/title/status/priority/assignee, '-' za silazno",
+    ),
+    filter_expression: Optional[str] = Query(
+        None,
+        alias="filter",
+        max_length=MAX_EXPRESSION_LENGTH,
+        description="Filter izraz, isti kao na GET /tickets",
+    ),
+):
+    """
+    Streama sve tickete koji zadovoljavaju filtere u jednom odgovoru.
+
+    - **format**: `ndjson` (jedan JSON objekt po liniji) ili `csv` (sa zaglavljem)
+    - **status**, **priority**, **q**, **sort**, **filter**: kao na `GET /tickets`
+
+    Tickete čita iz lokalnog storea ili stranicu po stranicu iz DummyJSON-a;
+    u memoriji je u svakom trenutku samo nekoliko stranica.
+    """
+    _validate_filter_expression(filter_expression)
+    filters = TicketFilters(
+        status=status,
+        priority=priority,
+        search=q,
+        sort=sort,
+        filter_expression=filter_expression,
+    )
+
+    try:
+        plan = query_planner.plan_export(filters)
+        batch_size = settings.export_batch_size
+        if plan.source is PlanSource.STORE:
+            await ticket_store.ensure_fresh()
+            batches = store_batches(ticket_store, filters, batch_size)
+        else:
+            batches = await prefetch_first(
+                upstream_batches(
+                    filters, batch_size, prefetch=settings.upstream_prefetch_pages
+                )
+            )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+    media_type, extension, _, _ = EXPORT_FORMATS[export_format]
+    return StreamingResponse(
+        stream_export(batches, export_format),
+        media_type=media_type,
+        headers={
+            PLAN_HEADER: plan.header_value(),
+            "Content-Disposition": f'attachment; filename="tickets.{extension}"',
+        },
+    )
+
+
+@router.post(
+    "/batch",
+    response_model=BatchTicketResponse,
+    summary="Dohvati više ticketa po ID-u",
+)
+async def get_tickets_batch(
+    request: BatchTicketRequest,
+    response: Response,
+    response_format: Optional[str] = Depends(get_response_format),
+):
+    """
+    Dohvaća detalje više ticketa u jednom zahtjevu.
+
+    - **ids**: Lista ID-eva (najviše `BATCH_MAX_IDS`, duplikati se zanemaruju)
+
+    Ticketi se uzimaju iz lokalnog storea, a ostali se dohvaćaju iz DummyJSON-a
+    paralelno (najviše `BATCH_CONCURRENCY` poziva odjednom) uz zajednički
+    dohvat assigneeja. Nepostojeći ID-evi vraćaju se u `not_found`.
+    """
+    if len(request.ids) > settings.batch_max_ids:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Too many ids: max {settings.batch_max_ids} per request",
         )
 
+    try:
+        response.headers["Vary"] = "Accept"
+        tickets, not_found = await batch_lookup.lookup(
+            request.ids, settings.batch_concurrency
+        )
+        result = BatchTicketResponse.model_construct(
+            tickets={
+                ticket_id: TicketDetail.from_trusted(record)
+                for ticket_id, record in tickets.items()
+            },
+            not_found=not_found,
+        )
+        return _model_response(result, response, media_type=response_format)
+
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+async def _change_events(offset: Optional[int], follow: bool) -> AsyncIterator[bytes]:
+    """SSE događaji feeda; ``id`` je offset za nastavak (Last-Event-ID)"""
+    async for event in change_feed.subscribe(
+        offset, follow=follow, keepalive=settings.change_feed_keepalive
+    ):
+        if event is None:
+            yield KEEPALIVE
+        else:
+            yield format_event(
+                event, event=event["type"], event_id=str(event["offset"])
+            )
+
+
+@router.get(
+    "/changes",
+    response_class=StreamingResponse,
+    summary="Feed promjena ticketa (Server-Sent Events)",
+)
+async def stream_ticket_changes(
+    since: Optional[int] = Query(
+        None, ge=0, description="Nastavi nakon ovog offseta (default: samo nove)"
+    ),
+    follow: bool = Query(True, description="Ostani spojen i čekaj nove promjene"),
+    last_event_id: Optional[str] = Header(None),
+):
+    """
+    Streama promjene ticketa kao Server-Sent Events umjesto pollanja liste.
+
+    - **since**: Offset zadnjeg primljenog događaja; bez njega stižu samo nove promjene
+    - **follow**: `false` pošalje zaostale događaje i zatvori vezu
+
+    Događaji su `created`, `updated` i `deleted` (`ticket` je stavka liste,
+    `null` za obrisane), a SSE `id` je offset. `EventSource` nakon prekida
+    sam šalje `Last-Event-ID` i nastavlja gdje je stao. Ako je offset prestar,
+    stiže `reset` i listu treba ponovno učitati. Uz `CHANGE_FEED_INTERVAL=0`
+    sinkronizacija ne radi pa novih događaja nikad ne bi bilo - vraća 503.
+    """
+    if settings.change_feed_interval <= 0:
+        raise HTTPException(
+            status_code=503,
+            detail="Change feed is disabled (CHANGE_FEED_INTERVAL=0)",
+        )
+    if since is None and last_event_id is not None:
+        if not last_event_id.isdigit():
+            raise HTTPException(status_code=400, detail="Invalid Last-Event-ID")
+        since = int(last_event_id)
+
+    return StreamingResponse(
+        _change_events(since, follow),
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS,
+    )
+
+
 @router.get("/test", summary="Test endpoint bez vanjskih poziva")
 async def test_endpoint():
     """Jednostavan test endpoint da testiram routing"""
@@ -218,21 +855,56 @@ async def mock_tickets():
 @router.get(
     "/{ticket_id}", response_model=TicketDetail, summary="Dohvati detalje ticketa"
 )
-async def get_ticket_by_id(ticket_id: int):
+async def get_ticket_by_id(
+    ticket_id: int,
+    response: Response,
+    fields: Optional[str] = Query(
+        None,
+        pattern=DETAIL_FIELDS_PATTERN,
+        description="Polja u odgovoru, npr. id,title,assignee",
+    ),
+    response_format: Optional[str] = Depends(get_response_format),
+):
     """
     Dohvaća detalje specifičnog ticketa uključujući puni JSON iz izvora.
 
     - **ticket_id**: Jedinstveni identifikator ticketa
+    - **fields**: Vrati samo tražena polja (npr. `id,title`); bez `assignee`
+      se korisnik iz DummyJSON-a ne dohvaća
     """
+    selected = parse_fields(fields, DETAIL_FIELDS)
     try:
-        # Dohvati todo iz DummyJSON
-        todo_data = await dummy_json_service.get_todo_by_id(ticket_id)
+        response.headers["Vary"] = "Accept"
+        plan = query_planner.plan_detail(ticket_id)
+        response.headers[PLAN_HEADER] = plan.header_value()
+
+        raw_source = None
+        if plan.source is PlanSource.STORE:
+            # plan_detail bira store samo ako sadrži ticket
+            stored = ticket_store.get(ticket_id)
+            assert stored is not None
+            ticket_data = stored
+        else:
+            # Dohvati todo iz DummyJSON; izvorni bajtovi idu u source_data
+            # neizmijenjeni, parsiraju se samo za izvedena polja
+            raw_source = await dummy_json_service.get_todo_raw(ticket_id)
+            todo_data = json_codec.loads(raw_source)
+
+            # Transformiraj u ticket
+            ticket_data = await ticket_transform_service.transform_todo_to_ticket(
+                todo_data, resolve_assignee=selected is None or "assignee" in selected
+            )
 
-        # Transformiraj u ticket
-        ticket_data = await ticket_transform_service.transform_todo_to_ticket(todo_data)
+        if raw_source is not None and response_format is None:
+            return _raw_source_response(ticket_data, raw_source, response, selected)
 
         # Kreiraj TicketDetail objekt
-        return TicketDetail(**ticket_data)
+        return _model_response(
+            TicketDetail.from_trusted(ticket_data),
+            response,
+            fields=selected,
+            media_type=response_format,
+        )
 
     except HTTPException as e:
         if e.status_code == 404:
@@ -9,7 +9,6 @@ Razlog: Pydantic-based konfiguracija s environment varijablama za FastAPI aplika
 Prompt: "Kreiraj pydantic settings klasu za konfiguraciju FastAPI aplikacije s environment varijablama"
 """
 
-import os
 from typing import Optional
 
 from pydantic_settings import BaseSettings
@@ -29,6 +28,67 @@ class Settings(BaseSettings):
     # Cache
     redis_url: Optional[str] = None
     cache_ttl: int = 300  # 5 minuta
+    page_cache_size: int = 1024  # max broj stranica u cacheu
+    fragment_cache_size: int = 10000  # max broj serijaliziranih ticketa
+
+    # Dohvat sljedeće stranice unaprijed kod sekvencijalnog listanja
+    prefetch_enabled: bool = True
+    prefetch_concurrency: int = 4  # max istovremenih dohvata unaprijed
+
+    # Lokalni store ticketa (sortiranje, indeksi)
+    store_ttl: int = 300  # sekunde do ponovnog učitavanja iz DummyJSON-a
+    user_preload_threshold: int = 10  # više nepoznatih korisnika -> /users jednom
+
+    # Fuzzy pretraga (trigram indeks)
+    fuzzy_threshold: float = 0.3  # minimalni udio trigrama upita u naslovu
+    fuzzy_max_candidates: int = 1000  # gornja granica kandidata po upitu
+
+    # Memoizacija /tickets/stats/summary (single-flight)
+    stats_cache_ttl: float = 30  # sekunde
+    stats_refresh_ahead: float = 5  # osvježi u pozadini ovoliko prije isteka
+
+    # Povijest statistika (GET /tickets/stats/history)
+    stats_history_interval: float = (
+        0  # sekunde između snapshotova (npr. 60), 0 isključuje
+    )
+    stats_history_size: int = 1440  # broj snapshotova u bufferu (24h po minuti)
+    stats_history_path: Optional[str] = None  # JSON datoteka za trajnu povijest
+
+    # Feed promjena (GET /tickets/changes) i pozadinska sinkronizacija storea
+    change_feed_interval: float = (
+        0  # sekunde između sinkronizacija (npr. 30), 0 isključuje
+    )
+    change_feed_size: int = 10000  # broj događaja dostupnih za nastavak
+    change_feed_keepalive: float = 15  # sekunde do SSE keep-alive komentara
+    sync_chunk_size: int = 50  # ID-eva po hashiranom rasponu (inkrementalni sync)
+
+    # Batch dohvat (POST /tickets/batch)
+    batch_max_ids: int = 100  # max broj ID-eva po zahtjevu
+    batch_concurrency: int = 10  # max istovremenih upstream poziva
+
+    # JSON codec: auto (orjson ako je instaliran), orjson ili json
+    json_codec: str = "auto"
+
+    # Bulk export (GET /tickets/export)
+    export_batch_size: int = 100  # ticketa po upstream stranici / chunku odgovora
+
+    # Streaming statistike nad upstreamom
+    stats_page_size: int = 250  # todoa po upstream stranici
+    upstream_prefetch_pages: int = 2  # stranica u letu dok se trenutna obrađuje
+
+    # Kompresija odgovora (gzip, te brotli/zstd ako su paketi instalirani)
+    compression_enabled: bool = True
+    compression_min_size: int = 1024  # bajtovi; manji odgovori idu nekomprimirani
+    compression_level: int = 6  # ograničava se na raspon svakog kodeka
+
+    # Zagrijavanje cacheova pri startu (korisnici, prve stranice, statistike)
+    warmup_enabled: bool = False
+    warmup_pages: int = 3  # broj stranica zadane liste
+    warmup_timeout: float = 30  # sekunde; nakon toga instanca je spremna i hladna
+
+    # Snapshot korisnika i storea na disku za brzi hladni start
+    snapshot_path: Optional[str] = None  # bez putanje snapshot je isključen
+    snapshot_interval: float = 300  # sekunde između zapisa (i pri gašenju)
 
     # Logiranje
     log_level: str = "INFO"
@@ -15,6 +15,9 @@ from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 
 from .config import settings
+from .middleware.compression import CompressionMiddleware
+from .services.json_codec import FastJSONResponse
+from .services.warmup import WARM, warmup
 
 
 @asynccontextmanager
@@ -22,11 +25,32 @@ async def lifespan(app: FastAPI):
     """Lifecycle manager za startup i shutdown događaje"""
     # Startup
     print("Starting TicketHub API...")
+    from .api.tickets import sample_stats_summary, warm_caches
+    from .services.change_feed import change_feed, sync_store
+    from .services.disk_snapshot import disk_snapshot
+    from .services.stats_history import stats_history
+
+    disk_snapshot.restore()
+    if settings.snapshot_path and settings.snapshot_interval > 0:
+        disk_snapshot.start(settings.snapshot_interval)
+    stats_history.load()
+    if settings.warmup_enabled:
+        warmup.start(
+            lambda: warm_caches(settings.warmup_pages), settings.warmup_timeout
+        )
+    if settings.stats_history_interval > 0:
+        stats_history.start(sample_stats_summary, settings.stats_history_interval)
+    if settings.change_feed_interval > 0:
+        change_feed.start(sync_store, settings.change_feed_interval)
 
     yield
 
     # Shutdown
     print("Shutting down TicketHub API...")
+    await warmup.stop()
+    await stats_history.stop()
+    await change_feed.stop()
+    await disk_snapshot.stop()
     # Zatvori HTTP klijente
     from .services.external_api import dummy_json_service, ticket_transform_service
 
@@ -43,18 +67,27 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=FastJSONResponse,
     lifespan=lifespan,
 )
 
-# CORS middleware
+# CORS middleware (mypy 1.5 ne razrješava ParamSpec u ``add_middleware``)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # U produkciji ograničiti na specifične domene
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=["*"],  # type: ignore[arg-type]  # U produkciji ograničiti
+    allow_credentials=True,  # type: ignore[arg-type]
+    allow_methods=["*"],  # type: ignore[arg-type]
+    allow_headers=["*"],  # type: ignore[arg-type]
 )
 
+# Kompresija odgovora prema Accept-Encoding
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_min_size,  # type: ignore[arg-type]
+        level=settings.compression_level,  # type: ignore[arg-type]
+    )
+
 
 @app.get("/")
 async def root():
@@ -69,12 +102,34 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint za monitoring i container orchestration"""
-    return {"status": "healthy", "service": "tickethub-api", "version": "0.1.0"}
+    """Health check endpoint za monitoring i container orchestration (liveness)"""
+    return {
+        "status": "healthy",
+        "service": "tickethub-api",
+        "version": "0.1.0",
+        "live": True,
+        "warm": warmup.state == WARM,
+        "cache_state": warmup.state,
+    }
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness: 503 dok se cacheovi zagrijavaju, da orkestrator ne šalje promet"""
+    content = {"ready": warmup.ready, "cache_state": warmup.state}
+    return JSONResponse(status_code=200 if warmup.ready else 503, content=content)
+
+
+@app.get("/metrics")
+async def get_metrics():
+    """Interni brojači i mjerači (cache, single-flight, prefetch...)"""
+    from .services.metrics import metrics
+
+    return metrics.snapshot()
 
 
 # Uključi ticket routes
-from .api import tickets
+from .api import tickets  # noqa: E402
 
 app.include_router(tickets.router, prefix="/tickets", tags=["tickets"])
 
@@ -0,0 +1,257 @@
+"""
+Middleware za kompresiju odgovora (gzip/brotli/zstd) prema Accept-Encoding
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Kodek se bira prema q-vrijednostima iz ``Accept-Encoding``; kod jednakih
+vrijednosti prednost ima zstd, pa brotli, pa gzip. Brotli i zstd su opcionalni
+(paketi ``brotli`` i ``zstandard``) - ako nisu instalirani koristi se gzip.
+
+Odgovori manji od ``minimum_size`` se ne komprimiraju. Streaming odgovori se
+komprimiraju po chunkovima uz flush.
+"""
+
+import gzip
+import zlib
+from typing import Callable, Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli  # type: ignore[import]
+except ImportError:  # pragma: no cover - opcionalna ovisnost
+    brotli = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - opcionalna ovisnost
+    zstandard = None  # type: ignore[assignment]
+
+# Content-type prefiksi koji se isplati komprimirati
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/xml",
+    "application/javascript",
+    "application/msgpack",
+    "application/cbor",
+)
+
+# SSE mora stizati odmah, bez bufferiranja u kompresoru
+EXCLUDED_TYPES = ("text/event-stream",)
+
+
+class _StreamCompressor:
+    """Zajedničko sučelje za inkrementalnu kompresiju s flushom po chunku"""
+
+    def __init__(self, compress: Callable[[bytes], bytes], flush: Callable[[], bytes]):
+        self.compress = compress
+        self.flush = flush
+
+
+def _gzip_stream(level: int) -> _StreamCompressor:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    return _StreamCompressor(
+        lambda chunk: compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH),
+        compressor.flush,
+    )
+
+
+def _brotli_stream(level: int) -> _StreamCompressor:
+    compressor = brotli.Compressor(quality=level)
+    return _StreamCompressor(
+        lambda chunk: compressor.process(chunk) + compressor.flush(),
+        compressor.finish,
+    )
+
+
+def _zstd_stream(level: int) -> _StreamCompressor:
+    compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    return _StreamCompressor(
+        lambda chunk: compressor.compress(chunk)
+        + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+        compressor.flush,
+    )
+
+
+class Codec:
+    """Jedan kodek: ime za Content-Encoding, raspon razina i funkcije"""
+
+    def __init__(self, name: str, max_level: int, compress, stream):
+        self.name = name
+        self.max_level = max_level
+        self._compress = compress
+        self._stream = stream
+
+    def level(self, level: int) -> int:
+        return max(1, min(level, self.max_level))
+
+    def compress(self, body: bytes, level: int) -> bytes:
+        return self._compress(body, self.level(level))
+
+    def stream(self, level: int) -> _StreamCompressor:
+        return self._stream(self.level(level))
+
+
+def available_codecs() -> Dict[str, Codec]:
+    """Kodeci po redoslijedu prednosti (samo oni čiji su paketi instalirani)"""
+    codecs: Dict[str, Codec] = {}
+    if zstandard is not None:
+        codecs["zstd"] = Codec(
+            "zstd",
+            22,
+            lambda body, level: zstandard.ZstdCompressor(level=level).compress(body),
+            _zstd_stream,
+        )
+    if brotli is not None:
+        codecs["br"] = Codec(
+            "br",
+            11,
+            lambda body, level: brotli.compress(body, quality=level),
+            _brotli_stream,
+        )
+    codecs["gzip"] = Codec(
+        "gzip",
+        9,
+        lambda body, level: gzip.compress(body, compresslevel=level, mtime=0),
+        _gzip_stream,
+    )
+    return codecs
+
+
+def choose_encoding(accept_encoding: str, codecs: Dict[str, Codec]) -> Optional[str]:
+    """Izaberi kodek s najvećom q-vrijednošću; ``*`` pokriva ostale kodeke"""
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name] = quality
+
+    best, best_quality = None, 0.0
+    for name in codecs:  # redoslijed prednosti razrješava izjednačenja
+        quality = weights.get(name, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+class CompressionMiddleware:
+    """ASGI middleware koji komprimira odgovore prema Accept-Encoding headeru"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        level: int = 6,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+        self.codecs = available_codecs()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        encoding = choose_encoding(accept_encoding, self.codecs)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, self.codecs[encoding], send)
+        await self.app(scope, receive, responder)
+
+
+class _CompressionResponder:
+    """Presreće poruke odgovora jednog zahtjeva i komprimira tijelo"""
+
+    def __init__(self, middleware: CompressionMiddleware, codec: Codec, send: Send):
+        self.middleware = middleware
+        self.codec = codec
+        self.send = send
+        self.start_message: Optional[Message] = None
+        self.stream: Optional[_StreamCompressor] = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Zadrži start poruku dok ne vidimo tijelo i odlučimo o kompresiji
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.stream is not None:
+            chunk = self.stream.compress(body)
+            if not more_body:
+                chunk += self.stream.flush()
+            await self.send(
+                {"type": "http.response.body", "body": chunk, "more_body": more_body}
+            )
+            return
+
+        start_message = self.start_message
+        assert start_message is not None, "tijelo prije http.response.start"
+        headers = MutableHeaders(scope=start_message)
+        if not self._should_compress(
+            start_message["status"], headers, len(body), more_body
+        ):
+            self.passthrough = True
+            await self.send(start_message)
+            await self.send(message)
+            return
+
+        headers["Content-Encoding"] = self.codec.name
+        headers.add_vary_header("Accept-Encoding")
+
+        if not more_body:
+            compressed = self.codec.compress(body, self.middleware.level)
+            headers["Content-Length"] = str(len(compressed))
+            await self.send(start_message)
+            await self.send({"type": "http.response.body", "body": compressed})
+            return
+
+        # Streaming odgovor - duljina nije poznata unaprijed
+        del headers["Content-Length"]
+        self.stream = self.codec.stream(self.middleware.level)
+        await self.send(start_message)
+        await self.send(
+            {
+                "type": "http.response.body",
+                "body": self.stream.compress(body),
+                "more_body": True,
+            }
+        )
+
+    def _should_compress(
+        self, status: int, headers: MutableHeaders, size: int, more_body: bool
+    ) -> bool:
+        if status < 200 or status in (204, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        if content_type.startswith(EXCLUDED_TYPES):
+            return False
+        if not content_type.startswith(COMPRESSIBLE_TYPES):
+            return False
+        # Za streaming veličina nije poznata - komprimira se uvijek
+        return more_body or size >= self.middleware.minimum_size
@@ -0,0 +1,111 @@
+"""
+Kompaktan interni zapis ticketa za servisni sloj
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+``TicketRecord`` je ``__slots__`` klasa bez ``__dict__``-a i bez reference na
+izvorni todo dict. Status i prioritet su dijeljene enum instance, a skraćeni
+naslov je isti objekt kao naslov kad skraćivanje nije potrebno. Pydantic
+modeli (``TicketListItem``, ``TicketDetail``) grade se iz zapisa tek na
+granici odgovora.
+"""
+
+from typing import Any, Dict, Optional
+
+from .ticket import PriorityEnum, StatusEnum, truncate_title
+
+# Polja koja DummyJSON todo uvijek ima; ostala se čuvaju u ``extra``
+_TODO_FIELDS = frozenset(("id", "todo", "completed", "userId"))
+
+
+class TicketRecord:
+    """Interni ticket: polja API modela + ono što treba za ``source_data``
+
+    ``assignee`` je None kad dohvat korisnika nije bio potreban (npr. upstream
+    stranica liste, koja assigneeja ne prikazuje).
+    """
+
+    __slots__ = (
+        "id",
+        "title",
+        "list_title",
+        "status",
+        "priority",
+        "assignee",
+        "user_id",
+        "completed",
+        "extra",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        title: str,
+        status: StatusEnum,
+        priority: PriorityEnum,
+        assignee: Optional[str],
+        user_id: Optional[int] = None,
+        completed: Optional[bool] = None,
+        list_title: Optional[str] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ):
+        self.id = id
+        self.title = title
+        self.list_title = truncate_title(title) if list_title is None else list_title
+        self.status = StatusEnum(status)
+        self.priority = PriorityEnum(priority)
+        self.assignee = assignee
+        self.user_id = user_id
+        self.completed = (
+            (status == StatusEnum.CLOSED) if completed is None else completed
+        )
+        self.extra = extra
+
+    @classmethod
+    def from_todo(
+        cls,
+        todo_data: Dict[str, Any],
+        status: StatusEnum,
+        priority: PriorityEnum,
+        assignee: Optional[str],
+    ) -> "TicketRecord":
+        """Zapis iz DummyJSON todo objekta; nepoznata polja idu u ``extra``"""
+        extra = None
+        if len(todo_data) > len(_TODO_FIELDS) or not _TODO_FIELDS.issuperset(todo_data):
+            extra = {k: v for k, v in todo_data.items() if k not in _TODO_FIELDS}
+        return cls(
+            id=todo_data["id"],
+            title=todo_data["todo"],
+            status=status,
+            priority=priority,
+            assignee=assignee,
+            user_id=todo_data["userId"],
+            completed=todo_data["completed"],
+            extra=extra or None,
+        )
+
+    def source_data(self) -> Dict[str, Any]:
+        """Rekonstruiraj izvorni DummyJSON todo (isti redoslijed polja)"""
+        data: Dict[str, Any] = {
+            "id": self.id,
+            "todo": self.title,
+            "completed": self.completed,
+            "userId": self.user_id,
+        }
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TicketRecord):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"TicketRecord(id={self.id}, status={self.status.value}, "
+            f"priority={self.priority.value}, assignee={self.assignee!r})"
+        )
@@ -11,8 +11,14 @@ Prompt: "Kreiraj kompletne pydantic modele za ticket management s validacijom, e
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List
-from pydantic import BaseModel, Field, validator
+from typing import TYPE_CHECKING, Any, Dict, Optional, List, Tuple
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+if TYPE_CHECKING:
+    from .record import TicketRecord
+
+# Najveća duljina filter izraza (?filter=...)
+MAX_EXPRESSION_LENGTH = 500
 
 
 class PriorityEnum(str, Enum):
@@ -30,6 +36,58 @@ class StatusEnum(str, Enum):
     CLOSED = "closed"
 
 
+_PRIORITY_BY_REMAINDER = {
+    0: PriorityEnum.LOW,
+    1: PriorityEnum.MEDIUM,
+    2: PriorityEnum.HIGH,
+}
+
+
+# Maksimalna duljina naslova u listi ticketa
+LIST_TITLE_MAX_LENGTH = 100
+
+
+def truncate_title(title: str) -> str:
+    """Ograniči naslov na maksimalno 100 znakova (s "..." na kraju)"""
+    if len(title) > LIST_TITLE_MAX_LENGTH:
+        return title[: LIST_TITLE_MAX_LENGTH - 3] + "..."
+    return title
+
+
+def calculate_priority(ticket_id: int) -> "PriorityEnum":
+    """Izračunaj prioritet na osnovu ID-a (id % 3 -> low/medium/high)"""
+    return _PRIORITY_BY_REMAINDER[ticket_id % 3]
+
+
+# Polja po kojima se lista ticketa može sortirati; "-" ispred znači silazno
+SORT_FIELDS = ("id", "title", "status", "priority", "assignee")
+SORT_PATTERN = r"^-?(" + "|".join(SORT_FIELDS) + r")$"
+
+# Polja za koja se mogu tražiti facet brojevi (?facets=status,priority)
+FACET_FIELDS = ("status", "priority", "assignee")
+FACETS_PATTERN = r"^({0})(,({0}))*$".format("|".join(FACET_FIELDS))
+
+# Polja za sparse fieldsets (?fields=id,title) na listi i detaljima ticketa
+LIST_FIELDS = ("id", "title", "status", "priority")
+DETAIL_FIELDS = LIST_FIELDS + ("assignee", "source_data", "created_at", "updated_at")
+LIST_FIELDS_PATTERN = r"^({0})(,({0}))*$".format("|".join(LIST_FIELDS))
+DETAIL_FIELDS_PATTERN = r"^({0})(,({0}))*$".format("|".join(DETAIL_FIELDS))
+
+
+def parse_fields(
+    fields: Optional[str], allowed: Tuple[str, ...]
+) -> Optional[Tuple[str, ...]]:
+    """Pretvori ``fields`` parametar u tuple polja u kanonskom redoslijedu
+
+    Isti skup polja uvijek daje isti tuple (bez obzira na redoslijed i
+    duplikate u upitu), pa se može koristiti u ključevima cachea.
+    """
+    if not fields:
+        return None
+    requested = set(fields.split(","))
+    return tuple(field for field in allowed if field in requested)
+
+
 class UserBase(BaseModel):
     """Osnovni user model iz DummyJSON"""
 
@@ -73,18 +131,13 @@ class Ticket(TicketBase):
 
     id: int = Field(..., gt=0, description="Jedinstveni identifikator ticketa")
 
-    @validator("priority", pre=True)
-    def calculate_priority(cls, v, values):
+    @model_validator(mode="before")
+    @classmethod
+    def calculate_priority(cls, data: Any) -> Any:
         """Izračunaj prioritet na osnovu ID-a ako nije eksplicitno postavljen"""
-        if "id" in values and v is None:
-            ticket_id = values["id"]
-            priority_map = {
-                0: PriorityEnum.LOW,
-                1: PriorityEnum.MEDIUM,
-                2: PriorityEnum.HIGH,
-            }
-            return priority_map[ticket_id % 3]
-        return v
+        if isinstance(data, dict) and data.get("priority") is None and "id" in data:
+            data = {**data, "priority": calculate_priority(data["id"])}
+        return data
 
     class Config:
         from_attributes = True
@@ -107,12 +160,24 @@ class TicketListItem(BaseModel):
     status: StatusEnum = Field(..., description="Status ticketa")
     priority: PriorityEnum = Field(..., description="Prioritet ticketa")
 
-    @validator("title")
-    def limit_title_length(cls, v):
+    @field_validator("title")
+    @classmethod
+    def limit_title_length(cls, v: str) -> str:
         """Ograniči naslov na maksimalno 100 znakova"""
-        if len(v) > 100:
-            return v[:97] + "..."
-        return v
+        return truncate_title(v)
+
+    @classmethod
+    def from_trusted(cls, record: "TicketRecord") -> "TicketListItem":
+        """Brza konstrukcija bez validacije iz internog ``TicketRecord``
+
+        Naslov je već skraćen pri transformaciji (``list_title``).
+        """
+        return cls.model_construct(
+            id=record.id,
+            title=record.list_title,
+            status=record.status,
+            priority=record.priority,
+        )
 
     class Config:
         from_attributes = True
@@ -125,6 +190,26 @@ class TicketDetail(Ticket):
     created_at: Optional[datetime] = Field(None, description="Datum kreiranja")
     updated_at: Optional[datetime] = Field(None, description="Datum zadnje izmjene")
 
+    @classmethod
+    def from_trusted(
+        cls, record: "TicketRecord", with_source: bool = True
+    ) -> "TicketDetail":
+        """Brza konstrukcija bez validacije iz internog ``TicketRecord``
+
+        S ``with_source=False`` se ``source_data`` ne gradi - za odgovore u
+        koje se umeću izvorni bajtovi iz upstreama.
+        """
+        values: Dict[str, Any] = dict(
+            id=record.id,
+            title=record.title,
+            status=record.status,
+            priority=record.priority,
+            assignee=record.assignee,
+        )
+        if with_source:
+            values["source_data"] = record.source_data()
+        return cls.model_construct(**values)
+
     class Config:
         from_attributes = True
         json_schema_extra = {
@@ -146,6 +231,46 @@ class TicketDetail(Ticket):
         }
 
 
+class BatchTicketRequest(BaseModel):
+    """Zahtjev za dohvat više ticketa po ID-u"""
+
+    ids: List[int] = Field(
+        ..., min_length=1, description="ID-evi ticketa (duplikati se zanemaruju)"
+    )
+
+
+class BatchTicketResponse(BaseModel):
+    """Ticketi po ID-u i ID-evi koji ne postoje"""
+
+    tickets: Dict[int, TicketDetail] = Field(
+        ..., description="Detalji ticketa po ID-u, redom kao u zahtjevu"
+    )
+    not_found: List[int] = Field(..., description="ID-evi koji nisu pronađeni")
+
+    class Config:
+        from_attributes = True
+        json_schema_extra = {
+            "example": {
+                "tickets": {
+                    "1": {
+                        "id": 1,
+                        "title": "Fix login issue",
+                        "status": "open",
+                        "priority": "medium",
+                        "assignee": "john_doe",
+                        "source_data": {
+                            "id": 1,
+                            "todo": "Fix login issue",
+                            "completed": False,
+                            "userId": 1,
+                        },
+                    }
+                },
+                "not_found": [99999],
+            }
+        }
+
+
 class PaginatedResponse(BaseModel):
     """Model za paginirane odgovore"""
 
@@ -154,6 +279,9 @@ class PaginatedResponse(BaseModel):
     page: int = Field(..., ge=1, description="Trenutna stranica")
     per_page: int = Field(..., ge=1, le=100, description="Broj stavki po stranici")
     pages: int = Field(..., ge=0, description="Ukupan broj stranica")
+    facets: Optional[Dict[str, Dict[str, int]]] = Field(
+        None, description="Broj pogodaka po vrijednosti traženih polja"
+    )
 
     class Config:
         from_attributes = True
@@ -178,20 +306,95 @@ class PaginatedResponse(BaseModel):
 class TicketFilters(BaseModel):
     """Model za filtriranje ticketa"""
 
-    status: Optional[StatusEnum] = Field(None, description="Filtriraj po statusu")
+    status: Optional[StatusEnum] = Field(
+        default=None, description="Filtriraj po statusu"
+    )
     priority: Optional[PriorityEnum] = Field(
-        None, description="Filtriraj po prioritetu"
+        default=None, description="Filtriraj po prioritetu"
     )
     search: Optional[str] = Field(
-        None, min_length=1, max_length=100, description="Pretraži po nazivu"
+        default=None, min_length=1, max_length=100, description="Pretraži po nazivu"
+    )
+    page: int = Field(default=1, ge=1, description="Broj stranice")
+    per_page: int = Field(
+        default=30, ge=1, le=100, description="Broj stavki po stranici"
+    )
+    sort: Optional[str] = Field(
+        default=None,
+        pattern=SORT_PATTERN,
+        description="Sortiranje, npr. priority ili -priority za silazno",
+    )
+    fuzzy: bool = Field(
+        default=False, description="Fuzzy pretraga otporna na tipfelere"
     )
-    page: int = Field(1, ge=1, description="Broj stranice")
-    per_page: int = Field(30, ge=1, le=100, description="Broj stavki po stranici")
+    fuzzy_threshold: Optional[float] = Field(
+        default=None, ge=0, le=1, description="Minimalna sličnost za fuzzy pretragu"
+    )
+    facets: List[str] = Field(
+        default_factory=list, description="Polja za koja se vraćaju facet brojevi"
+    )
+    filter_expression: Optional[str] = Field(
+        default=None,
+        max_length=MAX_EXPRESSION_LENGTH,
+        description="Filter izraz, npr. status:open OR id:1..10",
+    )
+    fields: Optional[Tuple[str, ...]] = Field(
+        default=None,
+        description="Polja stavki u odgovoru (sparse fieldset), None za sva",
+    )
+
+    @property
+    def sort_spec(self) -> Tuple[str, bool]:
+        """Vrati (polje, silazno) za sortiranje; default je id uzlazno"""
+        if not self.sort:
+            return "id", False
+        return self.sort.lstrip("-"), self.sort.startswith("-")
 
     class Config:
         from_attributes = True
 
 
+class StatsGroup(BaseModel):
+    """Jedna grupa u group-by statistikama"""
+
+    key: Dict[str, str] = Field(..., description="Vrijednosti polja grupe")
+    count: int = Field(..., ge=0, description="Broj ticketa u grupi")
+
+
+class AssigneeLoad(BaseModel):
+    """Opterećenje jednog assigneeja"""
+
+    assignee: str = Field(..., description="Korisničko ime")
+    open_tickets: int = Field(..., ge=0, description="Broj otvorenih ticketa")
+    total_tickets: int = Field(..., ge=0, description="Ukupan broj ticketa")
+
+
+class GroupedStatsResponse(BaseModel):
+    """Statistike grupirane po statusu, prioritetu i/ili assigneeju"""
+
+    total_tickets: int = Field(..., ge=0, description="Ukupan broj ticketa")
+    group_by: List[str] = Field(..., description="Polja po kojima je grupirano")
+    groups: List[StatsGroup] = Field(..., description="Grupe, najveće prvo")
+    top_assignees: Optional[List[AssigneeLoad]] = Field(
+        None, description="Assigneeji s najviše otvorenih ticketa"
+    )
+
+    class Config:
+        from_attributes = True
+        json_schema_extra = {
+            "example": {
+                "total_tickets": 150,
+                "group_by": ["status", "priority"],
+                "groups": [
+                    {"key": {"status": "open", "priority": "high"}, "count": 25}
+                ],
+                "top_assignees": [
+                    {"assignee": "emilys", "open_tickets": 4, "total_tickets": 7}
+                ],
+            }
+        }
+
+
 class StatsResponse(BaseModel):
     """Model za statistike (bonus feature)"""
 
@@ -210,3 +413,41 @@ class StatsResponse(BaseModel):
                 "priority_breakdown": {"low": 50, "medium": 50, "high": 50},
             }
         }
+
+
+class StatsSnapshot(StatsResponse):
+    """Statistike u jednom trenutku iz povijesti"""
+
+    timestamp: datetime = Field(..., description="Vrijeme snapshota (UTC)")
+
+
+class StatsHistoryResponse(BaseModel):
+    """Snapshotovi statistika u traženom prozoru, najstariji prvi"""
+
+    window_seconds: Optional[int] = Field(
+        None, description="Traženi prozor u sekundama (None = cijela povijest)"
+    )
+    interval_seconds: float = Field(..., description="Razmak između snapshotova")
+    snapshots: List[StatsSnapshot] = Field(..., description="Snapshotovi u prozoru")
+    trend: Optional[Dict[str, int]] = Field(
+        None, description="Promjena brojeva od prvog do zadnjeg snapshota"
+    )
+
+    class Config:
+        from_attributes = True
+        json_schema_extra = {
+            "example": {
+                "window_seconds": 3600,
+                "interval_seconds": 60,
+                "snapshots": [
+                    {
+                        "timestamp": "2025-01-01T12:00:00Z",
+                        "total_tickets": 150,
+                        "open_tickets": 75,
+                        "closed_tickets": 75,
+                        "priority_breakdown": {"low": 50, "medium": 50, "high": 50},
+                    }
+                ],
+                "trend": {"total_tickets": 2, "open_tickets": -3, "closed_tickets": 5},
+            }
+        }
@@ -0,0 +1,84 @@
+"""
+Dohvat više ticketa po ID-u u jednom zahtjevu (POST /tickets/batch)
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+ID-evi se dedupliciraju, pogoci se uzimaju iz svježeg lokalnog storea, a
+ostali se dohvaćaju iz DummyJSON-a paralelno uz ograničen broj istovremenih
+poziva. Assigneeji svih dohvaćenih todoa razrješavaju se zajedno, jednim
+``transform_todos_to_tickets`` pozivom.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+
+from ..models.record import TicketRecord
+from .external_api import (
+    DummyJsonService,
+    TicketTransformService,
+    dummy_json_service,
+    ticket_transform_service,
+)
+from .ticket_store import TicketStore, ticket_store
+
+
+class BatchLookup:
+    """Razrješava skup ID-eva iz storea i upstreama"""
+
+    def __init__(
+        self,
+        store: TicketStore,
+        api_service: DummyJsonService,
+        transform_service: TicketTransformService,
+    ):
+        self.store = store
+        self.api_service = api_service
+        self.transform_service = transform_service
+
+    async def lookup(
+        self, ticket_ids: Sequence[int], concurrency: int
+    ) -> Tuple[Dict[int, TicketRecord], List[int]]:
+        """Vrati (ticketi po ID-u redom kao u zahtjevu, ID-evi koji ne postoje)"""
+        ordered = list(dict.fromkeys(ticket_ids))
+
+        found: Dict[int, TicketRecord] = {}
+        if self.store.is_fresh:
+            for ticket_id in ordered:
+                record = self.store.get(ticket_id)
+                if record is not None:
+                    found[ticket_id] = record
+
+        misses = [ticket_id for ticket_id in ordered if ticket_id not in found]
+        if misses:
+            semaphore = asyncio.Semaphore(concurrency)
+            todos = await asyncio.gather(
+                *(self._fetch_todo(ticket_id, semaphore) for ticket_id in misses)
+            )
+            todos = [todo for todo in todos if todo is not None]
+            records = await self.transform_service.transform_todos_to_tickets(todos)
+            found.update((record.id, record) for record in records)
+
+        tickets = {
+            ticket_id: found[ticket_id] for ticket_id in ordered if ticket_id in found
+        }
+        not_found = [ticket_id for ticket_id in ordered if ticket_id not in found]
+        return tickets, not_found
+
+    async def _fetch_todo(
+        self, ticket_id: int, semaphore: asyncio.Semaphore
+    ) -> Optional[Dict[str, Any]]:
+        """Jedan upstream todo; None ako ne postoji"""
+        async with semaphore:
+            try:
+                return await self.api_service.get_todo_by_id(ticket_id)
+            except HTTPException as e:
+                if e.status_code == 404:
+                    return None
+                raise
+
+
+# Singleton instanca
+batch_lookup = BatchLookup(ticket_store, dummy_json_service, ticket_transform_service)
@@ -0,0 +1,53 @@
+"""
+Pomoćne funkcije za bitmape nad pozicijama ticketa
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Bitmapa je običan Python int u kojem bit ``i`` označava ticket na poziciji ``i``
+u lokalnom storeu. Presjek, unija i komplement su tada ``&``, ``|`` i ``^``.
+"""
+
+from typing import Iterable, Iterator, Sequence
+
+
+def from_positions(positions: Iterable[int]) -> int:
+    """Složi bitmapu iz liste pozicija u linearnom vremenu"""
+    positions = list(positions)
+    if not positions:
+        return 0
+    data = bytearray(max(positions) // 8 + 1)
+    for position in positions:
+        data[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(data, "little")
+
+
+def full_mask(size: int) -> int:
+    """Bitmapa sa svih ``size`` bitova postavljenih"""
+    return (1 << size) - 1
+
+
+def count(mask: int) -> int:
+    """Broj postavljenih bitova (broj ticketa u skupu)"""
+    return mask.bit_count()
+
+
+def iter_positions(mask: int) -> Iterator[int]:
+    """Iteriraj postavljene bitove uzlazno u linearnom vremenu"""
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    for byte_index, byte in enumerate(data):
+        base = byte_index * 8
+        while byte:
+            lowest = byte & -byte
+            yield base + lowest.bit_length() - 1
+            byte ^= lowest
+
+
+def remap(mask: int, mapping: Sequence[int], start: int = 0) -> int:
+    """Preslikaj pozicije preko ``mapping`` (``-1`` izbacuje poziciju)
+
+    Bitovi ispod ``start`` ostaju na mjestu (``mapping[i] == i`` za ``i < start``),
+    pa se obilaze samo pomaknute pozicije.
+    """
+    moved = (mapping[start + offset] for offset in iter_positions(mask >> start))
+    return (mask & full_mask(start)) | from_positions(p for p in moved if p >= 0)
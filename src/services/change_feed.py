@@ -0,0 +1,154 @@
+"""
+Feed promjena ticketa (GET /tickets/changes) uz pozadinsku sinkronizaciju
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Pozadinski zadatak svakih ``CHANGE_FEED_INTERVAL`` sekundi sinkronizira
+lokalni store s DummyJSON-om (vidi ``store_sync``). Svaka promjena postaje
+događaj ``created``, ``updated`` ili ``deleted`` s rastućim ``offset``-om.
+Prva sinkronizacija je samo polazište i ne daje događaje.
+
+Zadnjih ``CHANGE_FEED_SIZE`` događaja čuva se u memoriji, pa se klijent koji
+se ponovno spoji nastavlja od zadnjeg primljenog offseta. Ako je taj offset
+već ispao iz buffera ili je veći od trenutnog (offseti kreću od 1 nakon
+restarta i na svakom workeru), klijent dobiva ``reset`` i treba ponovno
+učitati listu.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional
+
+from ..config import settings
+from .fragment_cache import list_item_data
+from .metrics import metrics
+from .store_sync import Change, store_sync
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeFeed:
+    """Buffer događaja promjena s offsetima i čekanjem na nove događaje"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self._offset = 0
+        self._changed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.subscribers = 0
+
+    @property
+    def offset(self) -> int:
+        """Offset zadnjeg objavljenog događaja (0 dok ih nema)"""
+        return self._offset
+
+    def publish(self, changes: List[Change]) -> None:
+        """Dodaj događaje u buffer i probudi pretplatnike"""
+        timestamp = time.time()
+        for change_type, ticket_id, ticket in changes:
+            self._offset += 1
+            self._events.append(
+                {
+                    "offset": self._offset,
+                    "type": change_type,
+                    "id": ticket_id,
+                    "ticket": list_item_data(ticket) if ticket is not None else None,
+                    "timestamp": timestamp,
+                }
+            )
+        metrics.inc("change_feed.events", len(changes))
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def events_since(self, offset: int) -> Optional[List[Dict[str, Any]]]:
+        """Događaji nakon ``offset``-a, ili None ako ih iz buffera nije moguće dati
+
+        None je i za offset veći od trenutnog - dolazi iz drugog procesa ili
+        od prije restarta, pa klijent mora ponovno učitati listu.
+        """
+        if offset > self._offset:
+            return None
+        if offset == self._offset:
+            return []
+        oldest = self._events[0]["offset"] if self._events else self._offset + 1
+        if offset < oldest - 1:
+            return None
+        return [event for event in self._events if event["offset"] > offset]
+
+    async def subscribe(
+        self, offset: Optional[int], follow: bool = True, keepalive: float = 15
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """Događaji od ``offset``-a (None = samo novi); None znači keep-alive
+
+        Ako je ``offset`` prestar, prvo daje ``{"type": "reset", ...}`` i
+        nastavlja od trenutnog offseta.
+        """
+        position = self._offset if offset is None else offset
+        self.subscribers += 1
+        try:
+            while True:
+                changed = self._changed
+                events = self.events_since(position)
+                if events is None:
+                    position = self._offset
+                    yield {"type": "reset", "offset": position}
+                    continue
+                for event in events:
+                    position = event["offset"]
+                    yield event
+                if not follow:
+                    return
+                try:
+                    await asyncio.wait_for(changed.wait(), keepalive)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            self.subscribers -= 1
+
+    def clear(self) -> None:
+        self._events.clear()
+        self._offset = 0
+
+    def start(self, sync: Callable[[], Awaitable[Any]], interval: float) -> None:
+        """Pokreni periodičnu sinkronizaciju u pozadini"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(sync, interval))
+
+    async def stop(self) -> None:
+        """Zaustavi pozadinski zadatak"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self, sync: Callable[[], Awaitable[Any]], interval: float) -> None:
+        while True:
+            try:
+                await sync()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Sinkronizacija feeda promjena nije uspjela: %s", e)
+            await asyncio.sleep(interval)
+
+
+# Singleton feed promjena
+change_feed = ChangeFeed(capacity=settings.change_feed_size)
+metrics.register_gauge("change_feed.subscribers", lambda: change_feed.subscribers)
+metrics.register_gauge("change_feed.offset", lambda: change_feed.offset)
+
+
+async def sync_store() -> int:
+    """Sinkroniziraj lokalni store i objavi promjene; vraća broj događaja"""
+    changes = await store_sync.run()
+    if changes:
+        change_feed.publish(changes)
+    return len(changes)
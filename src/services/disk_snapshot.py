@@ -0,0 +1,217 @@
+"""
+Snapshot cacheova na disku za brzi hladni start
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Pri gašenju i svakih ``SNAPSHOT_INTERVAL`` sekundi u ``SNAPSHOT_PATH`` se
+zapisuju cache korisnika i zapisi lokalnog storea. Pri startu se datoteka
+memory-mapira i sekcije se dekodiraju izravno iz mapiranih stranica, pa
+restartana ili nova instanca kreće s korisnicima, storeom i polazištem
+inkrementalne sinkronizacije bez ijednog poziva DummyJSON-a.
+
+Format (little-endian)::
+
+    MAGIC (8 B) | created_at f64 | users_len u32 | tickets_len u32
+    | users (JSON) | tickets (JSON)
+
+Korisnici su redovi ``[id, username, firstName, lastName, email]``, a
+ticketi ``[id, title, status, priority, assignee, userId, completed, extra]``.
+Indeksi storea (bitmape, permutacije, trigrami) se ne zapisuju - izvedeni
+su iz zapisa i grade se u memoriji pri učitavanju. Zapis je atomičan
+(privremena datoteka + ``os.replace``), a neispravna ili stara datoteka se
+preskače uz upozorenje.
+"""
+
+import asyncio
+import logging
+import mmap
+import os
+import struct
+import time
+from typing import Any, List, Optional, Tuple
+
+from ..config import settings
+from ..models.record import TicketRecord
+from ..models.ticket import UserBase
+from . import json_codec
+from .external_api import TicketTransformService, ticket_transform_service
+from .metrics import metrics
+from .store_sync import StoreSync, store_sync
+from .ticket_store import TicketStore, ticket_store
+
+MAGIC = b"THSNAP\x00\x01"
+_HEADER = struct.Struct("<dII")
+_USER_FIELDS = ("id", "username", "firstName", "lastName", "email")
+
+logger = logging.getLogger(__name__)
+
+
+def _loads(view: memoryview) -> Any:
+    # orjson čita izravno iz mapirane memorije; json treba bytes
+    if json_codec.CODEC_NAME == "orjson":
+        return json_codec.loads(view)
+    return json_codec.loads(bytes(view))
+
+
+def encode_snapshot(
+    users: List[UserBase], tickets: List[TicketRecord], created_at: float
+) -> bytes:
+    """Binarni snapshot korisnika i zapisa storea"""
+    user_rows = [[getattr(user, field) for field in _USER_FIELDS] for user in users]
+    ticket_rows = [
+        [
+            ticket.id,
+            ticket.title,
+            ticket.status.value,
+            ticket.priority.value,
+            ticket.assignee,
+            ticket.user_id,
+            ticket.completed,
+            ticket.extra,
+        ]
+        for ticket in tickets
+    ]
+    users_blob = json_codec.dumps(user_rows)
+    tickets_blob = json_codec.dumps(ticket_rows)
+    header = _HEADER.pack(created_at, len(users_blob), len(tickets_blob))
+    return MAGIC + header + users_blob + tickets_blob
+
+
+def decode_snapshot(
+    data: memoryview,
+) -> Tuple[float, List[UserBase], List[TicketRecord]]:
+    """(created_at, korisnici, zapisi) iz snapshota; ValueError za neispravan"""
+    if bytes(data[: len(MAGIC)]) != MAGIC:
+        raise ValueError("nepoznat format snapshota")
+    offset = len(MAGIC)
+    if len(data) < offset + _HEADER.size:
+        raise ValueError("skraćen snapshot")
+    created_at, users_len, tickets_len = _HEADER.unpack_from(data, offset)
+    offset += _HEADER.size
+    if len(data) != offset + users_len + tickets_len:
+        raise ValueError("skraćen snapshot")
+
+    user_rows = _loads(data[offset : offset + users_len])
+    ticket_rows = _loads(data[offset + users_len :])
+    users = [UserBase(**dict(zip(_USER_FIELDS, row))) for row in user_rows]
+    tickets = [
+        TicketRecord(
+            id=row[0],
+            title=row[1],
+            status=row[2],
+            priority=row[3],
+            assignee=row[4],
+            user_id=row[5],
+            completed=row[6],
+            extra=row[7],
+        )
+        for row in ticket_rows
+    ]
+    return created_at, users, tickets
+
+
+class DiskSnapshot:
+    """Zapis i učitavanje snapshota korisnika i storea"""
+
+    def __init__(
+        self,
+        path: Optional[str],
+        store: TicketStore = ticket_store,
+        transform_service: TicketTransformService = ticket_transform_service,
+        sync: StoreSync = store_sync,
+    ):
+        self.path = path
+        self.store = store
+        self.transform_service = transform_service
+        self.sync = sync
+        self._task: Optional[asyncio.Task] = None
+
+    def save(self) -> bool:
+        """Zapiši snapshot (samo učitan store); greška se samo logira"""
+        data = self.encode()
+        return data is not None and self.write(data)
+
+    def encode(self) -> Optional[bytes]:
+        """Snapshot trenutnog stanja ili None bez putanje / učitanog storea
+
+        Čita store i cache korisnika, pa se poziva u event loopu.
+        """
+        if not self.path or self.store.loaded_at is None:
+            return None
+        # Starost zapisa iz storea, ne trenutak pisanja
+        age = time.monotonic() - self.store.loaded_at
+        return encode_snapshot(
+            self.transform_service.cached_users(),
+            self.store.snapshot(),
+            time.time() - age,
+        )
+
+    def write(self, data: bytes) -> bool:
+        """Atomično zapiši kodirani snapshot; smije se zvati izvan event loopa"""
+        assert self.path is not None
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("Snapshot nije zapisan u %s: %s", self.path, e)
+            return False
+        metrics.inc("snapshot.writes")
+        metrics.set("snapshot.bytes", len(data))
+        return True
+
+    def restore(self) -> bool:
+        """Učitaj snapshot ako postoji; vraća je li učitan"""
+        if not self.path or not os.path.exists(self.path):
+            return False
+        started = time.monotonic()
+        try:
+            with open(self.path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped:
+                with memoryview(mapped) as view:
+                    created_at, users, tickets = decode_snapshot(view)
+        except (OSError, ValueError, TypeError, KeyError, IndexError) as e:
+            logger.warning("Snapshot %s nije učitan: %s", self.path, e)
+            return False
+
+        self.transform_service.cache_users(users)
+        self.store.restore(tickets, age=max(0.0, time.time() - created_at))
+        self.sync.adopt()
+        metrics.set(
+            "snapshot.restore_ms", round((time.monotonic() - started) * 1000, 3)
+        )
+        logger.info(
+            "Snapshot učitan: %d korisnika, %d ticketa", len(users), len(tickets)
+        )
+        return True
+
+    def start(self, interval: float) -> None:
+        """Pokreni periodično zapisivanje u pozadini"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(interval))
+
+    async def stop(self) -> None:
+        """Zaustavi pozadinski zadatak i zapiši završni snapshot"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.save()
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            # Serijalizacija u petlji, zapis na disk izvan nje
+            data = self.encode()
+            if data is not None:
+                await asyncio.to_thread(self.write, data)
+
+
+# Singleton snapshota na disku (bez SNAPSHOT_PATH ništa ne radi)
+disk_snapshot = DiskSnapshot(settings.snapshot_path)
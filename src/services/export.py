@@ -0,0 +1,181 @@
+"""
+Streaming bulk export ticketa u NDJSON ili CSV formatu
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Export je lanac async generatora: izvor daje grupe ``TicketRecord``-a (iz
+lokalnog storea ili stranicu po stranicu iz DummyJSON-a), a encoder svaku
+grupu pretvara u jedan chunk bajtova za ``StreamingResponse``. Sljedeće
+upstream stranice dohvaćaju se dok klijent prima trenutnu, a nove se ne
+traže dok klijent ne preuzme prethodnu - memorija je ograničena brojem
+stranica u letu. Isti izvor koriste i statistike nad upstreamom.
+"""
+
+import asyncio
+import csv
+import io
+from collections import deque
+from typing import AsyncIterator, Callable, Deque, Dict, List, Optional, Tuple
+
+from ..models.record import TicketRecord
+from ..models.ticket import TicketFilters
+from . import json_codec
+from .external_api import dummy_json_service, ticket_transform_service
+from .ticket_store import TicketStore
+
+# Polja ticketa u exportu, redom kao stupci CSV-a
+EXPORT_FIELDS = ("id", "title", "status", "priority", "assignee")
+
+Batches = AsyncIterator[List[TicketRecord]]
+
+
+def _export_row(ticket: TicketRecord) -> Tuple:
+    return (
+        ticket.id,
+        ticket.title,
+        ticket.status.value,
+        ticket.priority.value,
+        ticket.assignee,
+    )
+
+
+def encode_ndjson(tickets: List[TicketRecord]) -> bytes:
+    """Jedan JSON objekt po liniji, puni naslov bez skraćivanja"""
+    lines = [
+        json_codec.dumps(dict(zip(EXPORT_FIELDS, _export_row(ticket))))
+        for ticket in tickets
+    ]
+    return b"\n".join(lines) + b"\n"
+
+
+def encode_csv(tickets: List[TicketRecord]) -> bytes:
+    """CSV retci bez zaglavlja (zaglavlje šalje ``stream_export``)"""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(_export_row(ticket) for ticket in tickets)
+    return buffer.getvalue().encode()
+
+
+def _csv_header() -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(EXPORT_FIELDS)
+    return buffer.getvalue().encode()
+
+
+# format -> (media type, ekstenzija datoteke, encoder grupe, zaglavlje)
+EXPORT_FORMATS: Dict[
+    str, Tuple[str, str, Callable[[List[TicketRecord]], bytes], Optional[bytes]]
+] = {
+    "ndjson": ("application/x-ndjson", "ndjson", encode_ndjson, None),
+    "csv": ("text/csv; charset=utf-8", "csv", encode_csv, _csv_header()),
+}
+
+
+async def store_batches(
+    store: TicketStore, filters: TicketFilters, batch_size: int
+) -> Batches:
+    """Grupe pogodaka iz lokalnog storea, s predajom event loopa između grupa"""
+    for batch in store.iter_batches(filters, batch_size):
+        yield batch
+        await asyncio.sleep(0)
+
+
+async def _fetch_upstream_batch(
+    filters: TicketFilters, skip: int, limit: int, resolve_assignee: bool = True
+) -> Tuple[List[TicketRecord], int, int]:
+    """Jedna upstream stranica: (filtrirani ticketi, total, broj dohvaćenih todos)"""
+    if filters.search:
+        data = await dummy_json_service.search_todos(
+            query=filters.search, limit=limit, skip=skip
+        )
+    else:
+        data = await dummy_json_service.get_todos(limit=limit, skip=skip)
+
+    todos = data.get("todos", [])
+    tickets = await ticket_transform_service.transform_todos_to_tickets(
+        todos, resolve_assignee=resolve_assignee
+    )
+    if filters.status or filters.priority:
+        tickets = [
+            ticket
+            for ticket in tickets
+            if (not filters.status or ticket.status == filters.status)
+            and (not filters.priority or ticket.priority == filters.priority)
+        ]
+    return tickets, data.get("total", 0), len(todos)
+
+
+async def upstream_batches(
+    filters: TicketFilters,
+    batch_size: int,
+    resolve_assignee: bool = True,
+    prefetch: int = 1,
+) -> Batches:
+    """Sve upstream stranice redom, do ``total`` koji upstream prijavi
+
+    Dok potrošač obrađuje trenutnu stranicu, do ``prefetch`` sljedećih se već
+    dohvaća. Nove se zakazuju tek kad potrošač preuzme prethodnu, pa je u
+    memoriji najviše ``prefetch + 1`` stranica. Korak je broj todoa koje je
+    vratila prva stranica (upstream može ograničiti ``limit``).
+    """
+    tickets, total, page_size = await _fetch_upstream_batch(
+        filters, 0, batch_size, resolve_assignee
+    )
+    pending: Deque[asyncio.Future] = deque()
+    next_skip = page_size
+
+    def schedule() -> None:
+        nonlocal next_skip
+        while page_size and len(pending) < prefetch and next_skip < total:
+            pending.append(
+                asyncio.ensure_future(
+                    _fetch_upstream_batch(
+                        filters, next_skip, batch_size, resolve_assignee
+                    )
+                )
+            )
+            next_skip += page_size
+
+    try:
+        schedule()
+        if tickets:
+            yield tickets
+        while pending:
+            tickets, _, _ = await pending.popleft()
+            schedule()
+            if tickets:
+                yield tickets
+    finally:
+        # Klijent je prekinuo vezu - ne ostavljaj viseće dohvate
+        for future in pending:
+            future.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def prefetch_first(batches: Batches) -> Batches:
+    """Dohvati prvu grupu odmah, da greška izvora postane HTTP greška
+
+    Nakon što ``StreamingResponse`` pošalje zaglavlja status se više ne može
+    promijeniti, pa se prvi (najčešće neuspješni) dohvat radi prije odgovora.
+    """
+    try:
+        first: Optional[List[TicketRecord]] = await batches.__anext__()
+    except StopAsyncIteration:
+        first = None
+
+    async def chained() -> Batches:
+        if first is not None:
+            yield first
+        async for batch in batches:
+            yield batch
+
+    return chained()
+
+
+async def stream_export(batches: Batches, export_format: str) -> AsyncIterator[bytes]:
+    """Pretvori grupe ticketa u chunkove odgovora u traženom formatu"""
+    _, _, encode, header = EXPORT_FORMATS[export_format]
+    if header is not None:
+        yield header
+    async for batch in batches:
+        yield encode(batch)
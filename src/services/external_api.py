@@ -10,12 +10,14 @@ Prompt: "Kreiraj async servis za DummyJSON API pozive s httpx, persistent client
 """
 
 import asyncio
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any
 import httpx
 from fastapi import HTTPException
 
 from ..config import settings
-from ..models.ticket import DummyJsonTodo, UserBase
+from ..models.record import TicketRecord
+from ..models.ticket import PriorityEnum, StatusEnum, UserBase
+from . import json_codec
 
 
 class DummyJsonService:
@@ -45,11 +47,21 @@ class DummyJsonService:
         self, endpoint: str, params: Optional[Dict] = None
     ) -> Dict[Any, Any]:
         """Pomoćna metoda za HTTP pozive s error handling"""
+        raw = await self._make_raw_request(endpoint, params)
+        try:
+            return json_codec.loads(raw)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
+
+    async def _make_raw_request(
+        self, endpoint: str, params: Optional[Dict] = None
+    ) -> bytes:
+        """HTTP poziv koji vraća neparsirano tijelo odgovora"""
         try:
             client = await self.get_client()
             response = await client.get(f"{self.base_url}/{endpoint}", params=params)
             response.raise_for_status()
-            return response.json()
+            return response.content
         except httpx.HTTPStatusError as e:
             raise HTTPException(
                 status_code=e.response.status_code,
@@ -72,6 +84,10 @@ class DummyJsonService:
         """Dohvati specifični todo po ID-u"""
         return await self._make_request(f"todos/{todo_id}")
 
+    async def get_todo_raw(self, todo_id: int) -> bytes:
+        """Dohvati specifični todo kao izvorne JSON bajtove (bez parsiranja)"""
+        return await self._make_raw_request(f"todos/{todo_id}")
+
     async def get_user_by_id(self, user_id: int) -> Dict[str, Any]:
         """Dohvati korisnika po ID-u"""
         return await self._make_request(f"users/{user_id}")
@@ -113,6 +129,46 @@ class TicketTransformService:
                 )
         return self._user_cache[user_id]
 
+    async def resolve_users(self, user_ids: Iterable[int]) -> Dict[int, UserBase]:
+        """Dohvati korisnike za skup ID-eva - svaki nepoznati samo jednom
+
+        Kad nedostaje više od ``USER_PRELOAD_THRESHOLD`` korisnika, svi se
+        učitaju jednim pozivom (``preload_users``). Preostali se dohvaćaju
+        pojedinačno, najviše ``BATCH_CONCURRENCY`` istovremeno.
+        """
+        user_ids = set(user_ids)
+        missing = [user_id for user_id in user_ids if user_id not in self._user_cache]
+        if len(missing) > settings.user_preload_threshold:
+            try:
+                await self.preload_users()
+            except HTTPException:
+                pass  # pojedinačni dohvat ispod
+            missing = [uid for uid in missing if uid not in self._user_cache]
+        if missing:
+            semaphore = asyncio.Semaphore(settings.batch_concurrency)
+
+            async def fetch(user_id: int) -> None:
+                async with semaphore:
+                    await self._get_user_cached(user_id)
+
+            await asyncio.gather(*(fetch(user_id) for user_id in missing))
+        return {user_id: self._user_cache[user_id] for user_id in user_ids}
+
+    async def preload_users(self) -> int:
+        """Učitaj sve korisnike u cache jednim pozivom (``limit=0`` vraća sve)"""
+        data = await self.dummy_json_service.get_users(limit=0)
+        users = [UserBase(**user_data) for user_data in data.get("users", [])]
+        self.cache_users(users)
+        return len(users)
+
+    def cache_users(self, users: Iterable[UserBase]) -> None:
+        """Dodaj korisnike u cache (npr. iz snapshota na disku)"""
+        self._user_cache.update((user.id, user) for user in users)
+
+    def cached_users(self) -> List[UserBase]:
+        """Svi korisnici iz cachea, po ID-u"""
+        return [self._user_cache[user_id] for user_id in sorted(self._user_cache)]
+
     def _calculate_priority(self, todo_id: int) -> str:
         """Izračunaj prioritet na osnovu ID-a"""
         priority_map = {0: "low", 1: "medium", 2: "high"}
@@ -123,26 +179,45 @@ class TicketTransformService:
         return "closed" if completed else "open"
 
     async def transform_todo_to_ticket(
-        self, todo_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Transformiraj DummyJSON todo u naš Ticket format"""
-        user = await self._get_user_cached(todo_data["userId"])
-
-        return {
-            "id": todo_data["id"],
-            "title": todo_data["todo"],
-            "status": self._determine_status(todo_data["completed"]),
-            "priority": self._calculate_priority(todo_data["id"]),
-            "assignee": user.username,
-            "source_data": todo_data,
-        }
+        self, todo_data: Dict[str, Any], resolve_assignee: bool = True
+    ) -> TicketRecord:
+        """Transformiraj DummyJSON todo u interni TicketRecord
+
+        Skraćeni naslov za listu računa se jednom, ovdje; pydantic modeli se
+        grade tek na granici odgovora. S ``resolve_assignee=False`` preskače
+        se dohvat korisnika i ``assignee`` ostaje None.
+        """
+        assignee = None
+        if resolve_assignee:
+            user = await self._get_user_cached(todo_data["userId"])
+            assignee = user.username
+        return self._build_record(todo_data, assignee)
+
+    def _build_record(
+        self, todo_data: Dict[str, Any], assignee: Optional[str]
+    ) -> TicketRecord:
+        return TicketRecord.from_todo(
+            todo_data,
+            status=StatusEnum(self._determine_status(todo_data["completed"])),
+            priority=PriorityEnum(self._calculate_priority(todo_data["id"])),
+            assignee=assignee,
+        )
 
     async def transform_todos_to_tickets(
-        self, todos_data: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
-        """Transformiraj listu todos u tickete paralelno"""
-        tasks = [self.transform_todo_to_ticket(todo) for todo in todos_data]
-        return await asyncio.gather(*tasks)
+        self, todos_data: List[Dict[str, Any]], resolve_assignee: bool = True
+    ) -> List[TicketRecord]:
+        """Transformiraj listu todos u tickete
+
+        Korisnici se razrješavaju jednom za cijelu listu (svaki različiti
+        ``userId`` najviše jedan dohvat), a zatim se zapisi grade bez čekanja.
+        """
+        if not resolve_assignee:
+            return [self._build_record(todo, None) for todo in todos_data]
+        users = await self.resolve_users(todo["userId"] for todo in todos_data)
+        return [
+            self._build_record(todo, users[todo["userId"]].username)
+            for todo in todos_data
+        ]
 
 
 # Singleton instanca servisa
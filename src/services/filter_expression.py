@@ -0,0 +1,243 @@
+"""
+Jezik filter izraza za GET /tickets?filter=...
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Primjer: ``(status:open AND priority:high) OR assignee:emilys``
+
+Gramatika::
+
+    expr  := and ("OR" and)*
+    and   := not ("AND" not)*
+    not   := "NOT" not | atom
+    atom  := "(" expr ")" | polje ":" vrijednost
+
+Podržana polja su ``status``, ``priority``, ``assignee``, ``title`` (podstring,
+vrijednost može biti u navodnicima) i ``id`` (broj ili raspon ``10..20``).
+Izraz se parsira jednom, cachira po stringu i kompajlira u operacije nad
+bitmap indeksima lokalnog storea. Duljina, broj uvjeta i dubina ugniježđenja
+su ograničeni kako bi i izražajni upiti ostali jeftini i predvidivi.
+"""
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, List, Tuple
+
+from ..models.ticket import MAX_EXPRESSION_LENGTH, PriorityEnum, StatusEnum
+
+if TYPE_CHECKING:
+    from .ticket_store import TicketStore
+
+# Tvrde granice složenosti izraza (granica duljine dijeli se s TicketFilters)
+MAX_TERMS = 32
+MAX_DEPTH = 8
+
+FILTER_FIELDS = ("status", "priority", "assignee", "title", "id")
+
+_ENUM_VALUES = {
+    "status": {status.value for status in StatusEnum},
+    "priority": {priority.value for priority in PriorityEnum},
+}
+
+# Cijena uvjeta - podstring pretraga prolazi sve naslove, ostalo su indeksi
+_TERM_COST = {"title": 10}
+
+_TOKEN_RE = re.compile(
+    r"""\s*(?:
+        (?P<lparen>\() |
+        (?P<rparen>\)) |
+        (?P<field>[A-Za-z_]+):(?:"(?P<quoted>[^"]*)"|(?P<bare>[^\s()"]*)) |
+        (?P<word>[A-Za-z]+)
+    )""",
+    re.VERBOSE,
+)
+
+_ID_RE = re.compile(r"^(\d+)(?:\.\.(\d+))?$")
+
+Evaluator = Callable[["TicketStore"], int]
+
+
+class FilterExpressionError(ValueError):
+    """Neispravan ili preskup filter izraz"""
+
+
+def _tokenize(expression: str) -> List[Tuple[str, ...]]:
+    """Razloži izraz na tokene: ("(",), (")",), ("AND",), ("term", polje, vrijednost)"""
+    tokens: List[Tuple[str, ...]] = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = _TOKEN_RE.match(expression, position)
+        if match is None:
+            raise FilterExpressionError(
+                f"Unexpected character at position {position}: {expression[position:][:20]!r}"
+            )
+        position = match.end()
+        if match.group("lparen"):
+            tokens.append(("(",))
+        elif match.group("rparen"):
+            tokens.append((")",))
+        elif match.group("field"):
+            value = match.group("quoted")
+            if value is None:
+                value = match.group("bare")
+            tokens.append(("term", match.group("field").lower(), value))
+        else:
+            keyword = match.group("word").upper()
+            if keyword not in ("AND", "OR", "NOT"):
+                raise FilterExpressionError(f"Unknown operator: {match.group('word')}")
+            tokens.append((keyword,))
+    return tokens
+
+
+class _Parser:
+    """Recursive descent parser koji odmah gradi evaluator i prati složenost"""
+
+    def __init__(self, tokens: List[Tuple[str, ...]]):
+        self.tokens = tokens
+        self.index = 0
+        self.terms = 0
+
+    def _peek(self) -> str:
+        return self.tokens[self.index][0] if self.index < len(self.tokens) else ""
+
+    def parse(self) -> Tuple[Evaluator, int]:
+        evaluator, cost = self._parse_or(depth=1)
+        if self.index != len(self.tokens):
+            raise FilterExpressionError(
+                "Unexpected tokens at the end of the expression"
+            )
+        return evaluator, cost
+
+    def _parse_or(self, depth: int) -> Tuple[Evaluator, int]:
+        parts = [self._parse_and(depth)]
+        while self._peek() == "OR":
+            self.index += 1
+            parts.append(self._parse_and(depth))
+        if len(parts) == 1:
+            return parts[0]
+        evaluators = [evaluator for evaluator, _ in parts]
+
+        def evaluate_or(store: "TicketStore") -> int:
+            mask = 0
+            for evaluator in evaluators:
+                mask |= evaluator(store)
+            return mask
+
+        return evaluate_or, sum(cost for _, cost in parts)
+
+    def _parse_and(self, depth: int) -> Tuple[Evaluator, int]:
+        parts = [self._parse_not(depth)]
+        while self._peek() == "AND":
+            self.index += 1
+            parts.append(self._parse_not(depth))
+        if len(parts) == 1:
+            return parts[0]
+        # Jeftini indeksi prvo - skupa podstring pretraga često se preskoči
+        parts.sort(key=lambda part: part[1])
+        evaluators = [evaluator for evaluator, _ in parts]
+
+        def evaluate_and(store: "TicketStore") -> int:
+            mask = store.all_mask
+            for evaluator in evaluators:
+                mask &= evaluator(store)
+                if not mask:
+                    break
+            return mask
+
+        return evaluate_and, sum(cost for _, cost in parts)
+
+    def _parse_not(self, depth: int) -> Tuple[Evaluator, int]:
+        if self._peek() != "NOT":
+            return self._parse_atom(depth)
+        self.index += 1
+        evaluator, cost = self._parse_not(depth)
+        return (lambda store: store.all_mask & ~evaluator(store)), cost
+
+    def _parse_atom(self, depth: int) -> Tuple[Evaluator, int]:
+        kind = self._peek()
+        if kind == "(":
+            if depth >= MAX_DEPTH:
+                raise FilterExpressionError(
+                    f"Expression is nested too deeply (max {MAX_DEPTH})"
+                )
+            self.index += 1
+            result = self._parse_or(depth + 1)
+            if self._peek() != ")":
+                raise FilterExpressionError("Missing closing parenthesis")
+            self.index += 1
+            return result
+        if kind != "term":
+            raise FilterExpressionError(
+                "Expected a field:value condition" + (f", got {kind}" if kind else "")
+            )
+        _, field, value = self.tokens[self.index]
+        self.index += 1
+        self.terms += 1
+        if self.terms > MAX_TERMS:
+            raise FilterExpressionError(
+                f"Too many conditions in expression (max {MAX_TERMS})"
+            )
+        return _compile_term(field, value), _TERM_COST.get(field, 1)
+
+
+def _compile_term(field: str, value: str) -> Evaluator:
+    """Pretvori jedan uvjet u funkciju koja vraća bitmapu iz storea"""
+    if field not in FILTER_FIELDS:
+        raise FilterExpressionError(
+            f"Unknown field {field!r}, supported: {', '.join(FILTER_FIELDS)}"
+        )
+    if not value:
+        raise FilterExpressionError(f"Empty value for field {field!r}")
+
+    if field == "title":
+        return lambda store: store.search_mask(value)
+
+    if field == "id":
+        match = _ID_RE.match(value)
+        if match is None:
+            raise FilterExpressionError(f"Invalid id or range: {value!r}")
+        low = int(match.group(1))
+        high = int(match.group(2) or low)
+        return lambda store: store.id_range_mask(low, high)
+
+    if field in _ENUM_VALUES:
+        value = value.lower()
+        if value not in _ENUM_VALUES[field]:
+            allowed = ", ".join(sorted(_ENUM_VALUES[field]))
+            raise FilterExpressionError(
+                f"Invalid value {value!r} for {field}, allowed: {allowed}"
+            )
+    return lambda store: store.field_mask(field, value)
+
+
+class CompiledFilter:
+    """Kompajlirani filter izraz spreman za evaluaciju nad storeom"""
+
+    __slots__ = ("expression", "terms", "cost", "_evaluator")
+
+    def __init__(self, expression: str, evaluator: Evaluator, terms: int, cost: int):
+        self.expression = expression
+        self.terms = terms
+        self.cost = cost
+        self._evaluator = evaluator
+
+    def __call__(self, store: "TicketStore") -> int:
+        """Vrati bitmapu ticketa koji zadovoljavaju izraz"""
+        return self._evaluator(store)
+
+
+@lru_cache(maxsize=256)
+def compile_filter(expression: str) -> CompiledFilter:
+    """Parsiraj i kompajliraj izraz; rezultat se cachira po stringu"""
+    if len(expression) > MAX_EXPRESSION_LENGTH:
+        raise FilterExpressionError(
+            f"Expression is too long (max {MAX_EXPRESSION_LENGTH} characters)"
+        )
+    tokens = _tokenize(expression)
+    if not tokens:
+        raise FilterExpressionError("Empty filter expression")
+    parser = _Parser(tokens)
+    evaluator, cost = parser.parse()
+    return CompiledFilter(expression, evaluator, parser.terms, cost)
@@ -0,0 +1,113 @@
+"""
+Cache serijaliziranih JSON fragmenata ticketa za odgovore s listom
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+JSON jednog ``TicketListItem`` ovisi samo o sadržaju zapisa koji ulazi u
+stavku (ID, skraćeni naslov, status, prioritet) i o skupu traženih polja
+(``?fields=``). Fragmenti se zato cachiraju po (sadržaj stavke, polja): promjena
+jednog ticketa ne poništava fragmente ostalih, a isti ticket iz storea i iz
+upstream stranice dijeli fragment. Paginirani odgovor se slaže spajanjem
+gotovih fragmenata unutar malog omotača - isti bajtovi kao ``PaginatedResponse``.
+"""
+
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from ..config import settings
+from ..models.record import TicketRecord
+from ..models.ticket import TicketListItem
+from . import json_codec
+
+Fields = Optional[Tuple[str, ...]]
+
+
+def content_key(ticket: TicketRecord) -> Hashable:
+    """Sadržaj zapisa koji ulazi u JSON stavke liste (dict ga hashira)"""
+    return (ticket.id, ticket.list_title, ticket.status, ticket.priority)
+
+
+def serialize_list_item(ticket: TicketRecord, fields: Fields = None) -> bytes:
+    """JSON jednog ticketa u listi, identičan pydantic serijalizaciji"""
+    include = set(fields) if fields is not None else None
+    return TicketListItem.from_trusted(ticket).model_dump_json(include=include).encode()
+
+
+def list_item_data(ticket: TicketRecord, fields: Fields = None) -> Dict[str, Any]:
+    """Stavka liste kao JSON-kompatibilan dict, isto što i ``model_dump(mode="json")``
+
+    Za binarne formate odgovora; gradi se direktno iz zapisa, bez modela.
+    """
+    data = {
+        "id": ticket.id,
+        "title": ticket.list_title,
+        "status": ticket.status.value,
+        "priority": ticket.priority.value,
+    }
+    if fields is not None:
+        return {field: data[field] for field in fields}
+    return data
+
+
+class FragmentCache:
+    """Fragmenti ``TicketListItem`` JSON-a po (sadržaj stavke, polja)"""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._fragments: Dict[Tuple[Hashable, Fields], bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+    def fragments(
+        self, tickets: Sequence[TicketRecord], fields: Fields = None
+    ) -> List[bytes]:
+        """Vrati fragmente za tickete, iz cachea ako se sadržaj nije promijenio"""
+        result = []
+        for ticket in tickets:
+            key = (content_key(ticket), fields)
+            fragment = self._fragments.get(key)
+            if fragment is None:
+                self.misses += 1
+                fragment = serialize_list_item(ticket, fields)
+                self._store(key, fragment)
+            else:
+                self.hits += 1
+            result.append(fragment)
+        return result
+
+    def _store(self, key: Tuple[Hashable, Fields], fragment: bytes) -> None:
+        # Kod punog cachea izbacuju se najstariji unosi (najčešće zastarjeli sadržaj)
+        if len(self._fragments) >= self.max_entries:
+            del self._fragments[next(iter(self._fragments))]
+        self._fragments[key] = fragment
+
+    def clear(self) -> None:
+        self._fragments.clear()
+
+
+def assemble_page(
+    fragments: Sequence[bytes],
+    total: int,
+    page: int,
+    per_page: int,
+    pages: int,
+    facets: Optional[Dict[str, Dict[str, int]]] = None,
+) -> bytes:
+    """Složi ``PaginatedResponse`` JSON od gotovih fragmenata stavki"""
+    envelope: Dict[str, Any] = {
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "pages": pages,
+    }
+    if facets is not None:
+        envelope["facets"] = facets
+    tail = json_codec.dumps(envelope)
+    return b'{"items":[' + b",".join(fragments) + b"]," + tail[1:]
+
+
+# Singleton instanca cachea fragmenata
+fragment_cache = FragmentCache(max_entries=settings.fragment_cache_size)
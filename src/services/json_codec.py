@@ -0,0 +1,71 @@
+"""
+Zamjenjiv JSON codec za dekodiranje upstream odgovora i kodiranje naših
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Codec se bira postavkom ``JSON_CODEC``: ``auto`` (default) uzima najbrži
+instalirani (``orjson``), a ako ga nema, standardni ``json``. Eksplicitno
+traženi codec koji nije instaliran također pada na ``json``, uz upozorenje.
+Svi codeci daju isti kompaktni UTF-8 izlaz kao
+``json.dumps(..., ensure_ascii=False, separators=(",", ":"))``.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, Tuple
+
+from fastapi.responses import JSONResponse
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+Loads = Callable[[bytes], Any]
+Dumps = Callable[[Any], bytes]
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _orjson_codec() -> Tuple[Loads, Dumps]:
+    import orjson
+
+    return orjson.loads, lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Ime -> funkcija koja vraća (loads, dumps); ImportError znači da nije dostupan
+CODECS: Dict[str, Callable[[], Tuple[Loads, Dumps]]] = {
+    "orjson": _orjson_codec,
+    "json": lambda: (json.loads, _stdlib_dumps),
+}
+
+# Redoslijed isprobavanja za JSON_CODEC=auto
+_AUTO_ORDER = ("orjson", "json")
+
+
+def load_codec(name: str = "auto") -> Tuple[str, Loads, Dumps]:
+    """Vrati (ime, loads, dumps) za traženi codec ili prvi dostupan"""
+    if name != "auto" and name not in CODECS:
+        raise ValueError(f"Nepoznat JSON codec {name!r}, podržani: {', '.join(CODECS)}")
+    candidates = _AUTO_ORDER if name == "auto" else (name, "json")
+    for candidate in candidates:
+        try:
+            loads, dumps = CODECS[candidate]()
+        except ImportError:
+            if candidate == name:
+                logger.warning("JSON codec %s nije instaliran, koristim json", name)
+            continue
+        return candidate, loads, dumps
+    raise RuntimeError("Nijedan JSON codec nije dostupan")  # pragma: no cover
+
+
+CODEC_NAME, loads, dumps = load_codec(settings.json_codec)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse koji kodira izabranim codecom (default response klasa)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,52 @@
+"""
+Jednostavni in-process brojači i mjerači (GET /metrics)
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+"""
+
+from collections import defaultdict
+from typing import Callable, Dict, Union
+
+Number = Union[int, float]
+
+
+class MetricsRegistry:
+    """Brojači (``inc``), postavljene vrijednosti (``set``) i izračunati mjerači"""
+
+    def __init__(self):
+        self._values: Dict[str, Number] = defaultdict(int)
+        self._gauges: Dict[str, Callable[[], Number]] = {}
+
+    def inc(self, name: str, value: Number = 1) -> None:
+        self._values[name] += value
+
+    def set(self, name: str, value: Number) -> None:
+        self._values[name] = value
+
+    def set_max(self, name: str, value: Number) -> None:
+        """Zapamti najveću viđenu vrijednost"""
+        self._values[name] = max(self._values[name], value)
+
+    def get(self, name: str) -> Number:
+        if name in self._gauges:
+            return self._gauges[name]()
+        return self._values.get(name, 0)
+
+    def register_gauge(self, name: str, read: Callable[[], Number]) -> None:
+        """Mjerač čija se vrijednost čita tek pri ``snapshot``-u"""
+        self._gauges[name] = read
+
+    def snapshot(self) -> Dict[str, Number]:
+        """Sve vrijednosti, sortirane po imenu"""
+        values: Dict[str, Number] = dict(self._values)
+        values.update((name, read()) for name, read in self._gauges.items())
+        return dict(sorted(values.items()))
+
+    def reset(self) -> None:
+        """Obriši brojače (mjerači ostaju registrirani)"""
+        self._values.clear()
+
+
+# Singleton registar
+metrics = MetricsRegistry()
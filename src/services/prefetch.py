@@ -0,0 +1,131 @@
+"""
+Adaptivno dohvaćanje sljedeće stranice liste unaprijed
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Za svaki skup filtera (ključ stranice bez broja stranice) pamti se zadnja
+poslužena stranica. Kad klijent nakon stranice N-1 zatraži N, obrazac je
+sekvencijalan pa se nakon odgovora u pozadini dohvaća stranica N+1 u cache
+stranica. Zahtjev za stranicu koja se još dohvaća čeka taj dohvat umjesto
+da pokrene novi.
+
+Istovremeno je u letu najviše ``PREFETCH_CONCURRENCY`` dohvata; višak se
+preskače. Metrike: ``prefetch.started``, ``prefetch.hits``,
+``prefetch.skipped``, ``prefetch.errors`` i ``prefetch.hit_rate`` (udio
+dohvaćenih stranica koje je netko stvarno zatražio).
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from ..models.ticket import TicketFilters
+from .cache import TTLCache
+from .metrics import MetricsRegistry, metrics
+from .query_planner import page_cache_key
+
+logger = logging.getLogger(__name__)
+
+PageFetch = Callable[[TicketFilters], Awaitable[Any]]
+
+
+def browse_key(filters: TicketFilters) -> str:
+    """Ključ skupa filtera - ključ stranice bez broja stranice"""
+    return page_cache_key(filters.model_copy(update={"page": 1}))
+
+
+class PagePrefetcher:
+    """Uči sekvencijalno listanje po skupu filtera i dohvaća stranicu N+1"""
+
+    def __init__(
+        self,
+        page_cache: TTLCache,
+        fetch: PageFetch,
+        max_inflight: int,
+        registry: MetricsRegistry = metrics,
+    ):
+        self.page_cache = page_cache
+        self.fetch = fetch
+        self.max_inflight = max_inflight
+        self.metrics = registry
+        # Zadnja stranica po skupu filtera i stranice dohvaćene unaprijed
+        self._last_page = TTLCache(
+            ttl=page_cache.ttl, max_entries=page_cache.max_entries
+        )
+        self._prefetched = TTLCache(
+            ttl=page_cache.ttl, max_entries=page_cache.max_entries
+        )
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._claimed: Set[str] = set()
+
+    def hit_rate(self) -> float:
+        started = self.metrics.get("prefetch.started")
+        return self.metrics.get("prefetch.hits") / started if started else 0.0
+
+    def inflight(self, filters: TicketFilters) -> Optional[asyncio.Future]:
+        """Dohvat ove stranice koji je u tijeku (računa se kao pogodak)
+
+        Future daje stranicu ili None ako dohvat nije uspio.
+        """
+        key = page_cache_key(filters)
+        future = self._inflight.get(key)
+        if future is not None and key not in self._claimed:
+            self._claimed.add(key)
+            self.metrics.inc("prefetch.hits")
+        return future
+
+    def served(self, filters: TicketFilters, from_cache: bool) -> None:
+        """Zabilježi posluženu stranicu i po potrebi dohvati sljedeću"""
+        key = page_cache_key(filters)
+        if from_cache:
+            self._claim(key)
+
+        browse = browse_key(filters)
+        sequential = self._last_page.get(browse) == filters.page - 1
+        self._last_page.set(browse, filters.page)
+        if sequential:
+            self._schedule(filters.model_copy(update={"page": filters.page + 1}))
+
+    def _claim(self, key: str) -> None:
+        if self._prefetched.get(key):
+            self._prefetched.set(key, False)
+            self.metrics.inc("prefetch.hits")
+
+    def _schedule(self, filters: TicketFilters) -> None:
+        key = page_cache_key(filters)
+        if key in self._inflight or key in self.page_cache:
+            return
+        if len(self._inflight) >= self.max_inflight:
+            self.metrics.inc("prefetch.skipped")
+            return
+        self.metrics.inc("prefetch.started")
+        future = asyncio.ensure_future(self._prefetch(key, filters))
+        self._inflight[key] = future
+
+    async def _prefetch(self, key: str, filters: TicketFilters) -> Any:
+        try:
+            page = await self.fetch(filters)
+        except Exception as e:
+            # Zahtjev koji čeka ovaj dohvat sam dohvaća stranicu
+            self.metrics.inc("prefetch.errors")
+            self._claimed.discard(key)
+            logger.debug("Prefetch stranice %s nije uspio: %s", filters.page, e)
+            return None
+        finally:
+            self._inflight.pop(key, None)
+        self.page_cache.set(key, page)
+        if key in self._claimed:
+            self._claimed.discard(key)
+        else:
+            self._prefetched.set(key, True)
+        return page
+
+    def clear(self) -> None:
+        """Zaboravi naučene obrasce i prekini dohvate u tijeku"""
+        for future in self._inflight.values():
+            future.cancel()
+        self._inflight.clear()
+        self._claimed.clear()
+        self._last_page.clear()
+        self._prefetched.clear()
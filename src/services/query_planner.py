@@ -0,0 +1,247 @@
+"""
+Planer upita - bira najjeftiniji ispravan izvor podataka za svaki zahtjev
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Izvori su lokalni store (indeksi), cache stranica i DummyJSON (upstream).
+Upstream stranica je ispravna samo za upite bez sortiranja, fuzzy pretrage,
+faceta, filter izraza i filtera po statusu/prioritetu (te se filtriraju nakon
+paginacije).
+Cijene su relativne jedinice (1 ~ jedna in-memory stranica) i služe samo za
+usporedbu kandidata; izabrani plan se vraća u ``X-Query-Plan`` headeru.
+Uz mrežu i transformaciju cijena uključuje i broj zapisa koji su istovremeno
+u memoriji: reload storea drži cijeli skup, upstream stranice samo nekoliko.
+"""
+
+import math
+from enum import Enum
+from typing import Any, List
+
+from ..config import settings
+from ..models.ticket import TicketFilters
+from .cache import TTLCache
+from .ticket_store import TicketStore, ticket_store
+
+# Header u kojem API vraća izabrani plan
+PLAN_HEADER = "X-Query-Plan"
+
+# Procjene cijene u relativnim jedinicama
+UPSTREAM_ROUNDTRIP_COST = 100.0
+TRANSFORM_COST_PER_ITEM = 0.5
+STORE_COST_PER_ITEM = 0.01
+STORE_SCAN_COST_PER_ITEM = 0.001
+CACHE_HIT_COST = 1.0
+BUFFERED_ITEM_COST = 0.5
+
+# Reload storea: upit za ``total`` pa cijela lista, uz razrješavanje assigneeja
+# (jedan ``/users`` poziv kad nedostaje više korisnika, vidi ``resolve_users``)
+RELOAD_ROUNDTRIPS = 2
+USER_RESOLUTION_ROUNDTRIPS = 1
+
+# Pretpostavljena veličina skupa dok store nije nijednom učitan (DummyJSON limit)
+DEFAULT_DATASET_SIZE = 1000
+
+
+class PlanSource(str, Enum):
+    """Izvor podataka za jedan zahtjev"""
+
+    STORE = "store"
+    CACHE = "cache"
+    UPSTREAM = "upstream"
+
+
+class QueryPlan:
+    """Izabrani izvor, procijenjena cijena i razlog izbora"""
+
+    __slots__ = ("source", "cost", "reason", "cached")
+
+    def __init__(
+        self, source: PlanSource, cost: float, reason: str, cached: Any = None
+    ):
+        self.source = source
+        self.cost = cost
+        self.reason = reason
+        self.cached = cached
+
+    def header_value(self) -> str:
+        return f"{self.source.value}; cost={self.cost:.2f}; reason={self.reason}"
+
+    def __repr__(self) -> str:
+        return f"QueryPlan({self.header_value()})"
+
+
+def page_cache_key(filters: TicketFilters) -> str:
+    """Ključ cachea stranice - svi parametri koji utječu na odabir ticketa
+
+    ``fields`` mijenja samo serijalizaciju (cachiranu po poljima u cacheu
+    fragmenata), pa sve varijante iste stranice dijele jedan unos.
+    """
+    return filters.model_dump_json(exclude={"fields"})
+
+
+class QueryPlanner:
+    """Bira između lokalnog storea, cachea stranica i upstream API-ja"""
+
+    def __init__(self, store: TicketStore, page_cache: TTLCache):
+        self.store = store
+        self.page_cache = page_cache
+
+    def _store_cost(self, items: int, scan: bool = False) -> float:
+        """Cijena upita nad storeom, uključujući reload ako je zastario"""
+        size = len(self.store) or DEFAULT_DATASET_SIZE
+        cost = 1.0 + items * STORE_COST_PER_ITEM
+        if scan:
+            cost += size * STORE_SCAN_COST_PER_ITEM
+        if not self.store.is_fresh:
+            cost += self._reload_cost(size)
+        return cost
+
+    @staticmethod
+    def _reload_cost(size: int) -> float:
+        """Reload storea: ``total``, cijela lista, korisnici (assignee) i transformacija
+
+        Cijela lista dolazi u jednom odgovoru i zapisi se grade odjednom, pa je
+        u memoriji cijeli skup.
+        """
+        roundtrips = RELOAD_ROUNDTRIPS + USER_RESOLUTION_ROUNDTRIPS
+        return roundtrips * UPSTREAM_ROUNDTRIP_COST + size * (
+            TRANSFORM_COST_PER_ITEM + BUFFERED_ITEM_COST
+        )
+
+    @staticmethod
+    def _scan_cost(size: int, resolve_assignee: bool) -> float:
+        """Prolaz kroz sve upstream stranice kao u ``upstream_batches``
+
+        Nakon prve stranice ``UPSTREAM_PREFETCH_PAGES`` se dohvaća istovremeno,
+        a u memoriji je najviše ``prefetch + 1`` stranica.
+        """
+        page_size = settings.stats_page_size
+        prefetch = max(settings.upstream_prefetch_pages, 1)
+        pages = max(math.ceil(size / page_size), 1)
+        roundtrips = 1 + math.ceil((pages - 1) / prefetch)
+        if resolve_assignee:
+            roundtrips += USER_RESOLUTION_ROUNDTRIPS
+        buffered = min(size, page_size * (prefetch + 1))
+        return (
+            roundtrips * UPSTREAM_ROUNDTRIP_COST
+            + size * (TRANSFORM_COST_PER_ITEM + STORE_SCAN_COST_PER_ITEM)
+            + buffered * BUFFERED_ITEM_COST
+        )
+
+    @staticmethod
+    def _upstream_cost(items: int, requests: int = 1) -> float:
+        return requests * UPSTREAM_ROUNDTRIP_COST + items * TRANSFORM_COST_PER_ITEM
+
+    @staticmethod
+    def _cheapest(candidates: List[QueryPlan]) -> QueryPlan:
+        # min() zadržava prvi kandidat kod jednake cijene - store ima prednost
+        return min(candidates, key=lambda plan: plan.cost)
+
+    def plan_list(self, filters: TicketFilters) -> QueryPlan:
+        """Plan za paginiranu listu / pretragu ticketa"""
+        filtered = bool(
+            filters.status
+            or filters.priority
+            or filters.search
+            or filters.filter_expression
+        )
+        candidates = [
+            QueryPlan(
+                PlanSource.STORE,
+                self._store_cost(filters.per_page, scan=filtered),
+                "fresh-index" if self.store.is_fresh else "reload-index",
+            )
+        ]
+
+        needs_store = (
+            filters.sort
+            or filters.fuzzy
+            or filters.facets
+            or filters.status
+            or filters.priority
+            or filters.filter_expression
+        )
+        if needs_store:
+            candidates[0].reason = "requires-index"
+            return candidates[0]
+
+        cached = self.page_cache.get(page_cache_key(filters))
+        if cached is not None:
+            candidates.append(
+                QueryPlan(PlanSource.CACHE, CACHE_HIT_COST, "cache-hit", cached)
+            )
+        candidates.append(
+            QueryPlan(
+                PlanSource.UPSTREAM,
+                self._upstream_cost(filters.per_page),
+                "upstream-page",
+            )
+        )
+        return self._cheapest(candidates)
+
+    def plan_detail(self, ticket_id: int) -> QueryPlan:
+        """Plan za detalje jednog ticketa - store samo ako je svjež i sadrži ID"""
+        if self.store.is_fresh and self.store.get(ticket_id) is not None:
+            return QueryPlan(PlanSource.STORE, self._store_cost(1), "fresh-index")
+        return QueryPlan(
+            PlanSource.UPSTREAM, self._upstream_cost(1), "not-in-fresh-index"
+        )
+
+    def plan_export(self, filters: TicketFilters) -> QueryPlan:
+        """Plan za bulk export - store ako je svjež ili nužan, inače upstream stranice
+
+        Zastarjeli store bi prije prvog bajta morao učitati i transformirati
+        cijeli skup; upstream stranice se šalju čim stignu, uz ograničenu
+        memoriju, pa se za export bez indeksa biraju one.
+        """
+        size = len(self.store) or DEFAULT_DATASET_SIZE
+        if filters.sort or filters.filter_expression:
+            return QueryPlan(
+                PlanSource.STORE, self._store_cost(size, scan=True), "requires-index"
+            )
+        if self.store.is_fresh:
+            return QueryPlan(
+                PlanSource.STORE, self._store_cost(size, scan=True), "fresh-index"
+            )
+        pages = math.ceil(size / settings.export_batch_size)
+        return QueryPlan(
+            PlanSource.UPSTREAM,
+            self._upstream_cost(size, requests=pages),
+            "stream-pages",
+        )
+
+    def plan_stats(
+        self, needs_assignee: bool = False, allow_reload: bool = True
+    ) -> QueryPlan:
+        """Plan za statistike - brojevi iz bitmapa ili prolaz kroz upstream stranice
+
+        Svjež store je uvijek najjeftiniji. Zastarjeli bi prije brojanja
+        morao dohvatiti cijelu listu odjednom i razriješiti assigneeje, što
+        statistike bez ``assignee`` grupiranja ne trebaju, pa se tada broje
+        upstream stranice. S ``allow_reload=False`` (npr. stream, koji mora
+        početi odmah) zastarjeli store nije kandidat.
+        """
+        size = len(self.store) or DEFAULT_DATASET_SIZE
+        upstream = QueryPlan(
+            PlanSource.UPSTREAM,
+            self._scan_cost(size, resolve_assignee=needs_assignee),
+            "upstream-scan",
+        )
+        if not (self.store.is_fresh or allow_reload):
+            return upstream
+        return self._cheapest(
+            [
+                QueryPlan(
+                    PlanSource.STORE,
+                    self._store_cost(0),
+                    "fresh-index" if self.store.is_fresh else "reload-index",
+                ),
+                upstream,
+            ]
+        )
+
+
+# Singleton instance cachea stranica i planera
+page_cache = TTLCache(ttl=settings.cache_ttl, max_entries=settings.page_cache_size)
+query_planner = QueryPlanner(ticket_store, page_cache)
@@ -0,0 +1,102 @@
+"""
+Single-flight izračun s TTL memoizacijom i osvježavanjem u pozadini
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Istovremeni pozivatelji dijele jedan izračun u tijeku umjesto da svaki
+pokrene svoj. Rezultat vrijedi ``ttl`` sekundi; u zadnjih ``refresh_ahead``
+sekundi prvi pogodak pokreće osvježavanje u pozadini, pa pozivatelji i dalje
+dobivaju postojeću vrijednost bez čekanja. Neuspjeli izračun se ne pamti.
+
+Metrike (prefiks je ``name``): ``computations``, ``hits``, ``shared_callers``
+(pozivatelji koji su se pridružili izračunu u tijeku), ``last_flight_callers``
+i ``max_flight_callers`` (broj pozivatelja koji su čekali jedan izračun).
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from .metrics import MetricsRegistry, metrics
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """Dijeljeni, memoizirani async izračun bez argumenata"""
+
+    def __init__(
+        self,
+        name: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: float,
+        refresh_ahead: float = 0.0,
+        registry: MetricsRegistry = metrics,
+    ):
+        self.name = name
+        self.compute = compute
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.metrics = registry
+        self._value: Any = None
+        self._expires_at: Optional[float] = None
+        self._inflight: Optional[asyncio.Future] = None
+        self._flight_callers = 0
+
+    @property
+    def is_fresh(self) -> bool:
+        return self._expires_at is not None and time.monotonic() < self._expires_at
+
+    async def get(self) -> Any:
+        """Memoizirana vrijednost ili rezultat (zajedničkog) izračuna"""
+        expires_at = self._expires_at
+        if expires_at is not None and time.monotonic() < expires_at:
+            self.metrics.inc(f"{self.name}.hits")
+            if (
+                self._inflight is None
+                and time.monotonic() >= expires_at - self.refresh_ahead
+            ):
+                self._start()
+            return self._value
+
+        inflight = self._inflight
+        if inflight is None:
+            inflight = self._start()
+        else:
+            self.metrics.inc(f"{self.name}.shared_callers")
+        self._flight_callers += 1
+        # shield: prekinut pozivatelj ne prekida izračun ostalima
+        return await asyncio.shield(inflight)
+
+    def _start(self) -> asyncio.Future:
+        self._flight_callers = 0
+        inflight = asyncio.ensure_future(self._run())
+        inflight.add_done_callback(self._log_failure)
+        self._inflight = inflight
+        return inflight
+
+    async def _run(self) -> Any:
+        try:
+            value = await self.compute()
+        finally:
+            self._inflight = None
+            self.metrics.inc(f"{self.name}.computations")
+            self.metrics.set(f"{self.name}.last_flight_callers", self._flight_callers)
+            self.metrics.set_max(
+                f"{self.name}.max_flight_callers", self._flight_callers
+            )
+        self._value = value
+        self._expires_at = time.monotonic() + self.ttl
+        return value
+
+    def _log_failure(self, future: asyncio.Future) -> None:
+        # Dohvati iznimku i kad nitko ne čeka (pozadinsko osvježavanje)
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning("%s: izračun nije uspio: %s", self.name, future.exception())
+
+    def clear(self) -> None:
+        """Zaboravi memoiziranu vrijednost"""
+        self._value = None
+        self._expires_at = None
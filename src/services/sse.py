@@ -0,0 +1,35 @@
+"""
+Server-Sent Events: kodiranje događaja za streaming endpointove
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Svaki događaj je blok ``event:``/``id:``/``data:`` linija završen praznom
+linijom. Podaci su kompaktni JSON (izabrani codec) u jednoj liniji, pa ih
+klijent (npr. ``EventSource``) parsira s ``JSON.parse(event.data)``.
+"""
+
+from typing import Any, Optional
+
+from . import json_codec
+
+SSE_MEDIA_TYPE = "text/event-stream"
+
+# Proxyji (nginx) ne smiju bufferirati ni cachirati stream
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+# Komentar koji drži vezu otvorenom kad nema događaja
+KEEPALIVE = b": keep-alive\n\n"
+
+
+def format_event(
+    data: Any, event: Optional[str] = None, event_id: Optional[str] = None
+) -> bytes:
+    """Jedan SSE događaj s JSON podacima"""
+    lines = []
+    if event is not None:
+        lines.append(b"event: " + event.encode())
+    if event_id is not None:
+        lines.append(b"id: " + event_id.encode())
+    lines.append(b"data: " + json_codec.dumps(data))
+    return b"\n".join(lines) + b"\n\n"
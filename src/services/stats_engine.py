@@ -0,0 +1,145 @@
+"""
+Group-by statistike ticketa (GET /tickets/stats)
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Brojevi se računaju u jednom prolazu kroz zapise: svaki ticket daje ključ
+grupe (tuple vrijednosti traženih polja) koji broji ``Counter``, a usput se
+broje otvoreni ticketi po assigneeju za top-K. Isti akumulator radi nad
+lokalnim storeom i nad upstream stranicama koje stižu jedna po jedna, pa
+memorija ne raste s veličinom skupa nego s brojem grupa. ``summaries`` daje
+međurezultat nakon svake stranice (GET /tickets/stats/stream).
+"""
+
+import heapq
+from collections import Counter
+from operator import attrgetter
+from typing import Any, AsyncIterator, Dict, Iterable, List, Tuple
+
+from ..models.record import TicketRecord
+from ..models.ticket import PriorityEnum, StatusEnum
+
+# Polja po kojima se može grupirati (?group_by=status,assignee)
+GROUP_FIELDS = ("status", "priority", "assignee")
+GROUP_BY_PATTERN = r"^({0})(,({0}))*$".format("|".join(GROUP_FIELDS))
+
+# Grupiranje iz kojeg se slaže ``StatsResponse`` (vidi ``summary``)
+SUMMARY_GROUP_BY = ("status", "priority")
+
+
+def _value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+class GroupByAccumulator:
+    """Broji tickete po grupama i otvorene tickete po assigneeju"""
+
+    def __init__(self, group_by: Tuple[str, ...], top_assignees: int = 0):
+        self.group_by = group_by
+        self.top_assignees = top_assignees
+        self.total = 0
+        self._groups: Counter = Counter()
+        self._assignee_total: Counter = Counter()
+        self._assignee_open: Counter = Counter()
+        # attrgetter s više polja vraća tuple, s jednim samu vrijednost
+        self._key = attrgetter(*group_by) if group_by else None
+
+    @property
+    def needs_assignee(self) -> bool:
+        """Treba li izvor razriješiti assigneeje"""
+        return "assignee" in self.group_by or self.top_assignees > 0
+
+    def add(self, tickets: Iterable[TicketRecord]) -> None:
+        """Dodaj grupu ticketa u brojeve"""
+        tickets = list(tickets)
+        self.total += len(tickets)
+        if self._key is not None:
+            self._groups.update(map(self._key, tickets))
+        if self.top_assignees:
+            self._assignee_total.update(ticket.assignee for ticket in tickets)
+            self._assignee_open.update(
+                ticket.assignee
+                for ticket in tickets
+                if ticket.status is StatusEnum.OPEN
+            )
+
+    async def add_batches(self, batches: AsyncIterator[List[TicketRecord]]) -> None:
+        """Dodaj sve grupe iz async izvora (npr. upstream stranice)"""
+        async for batch in batches:
+            self.add(batch)
+
+    async def summaries(
+        self, batches: AsyncIterator[List[TicketRecord]]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Dodaje grupe iz async izvora i nakon svake daje trenutni ``summary``"""
+        async for batch in batches:
+            self.add(batch)
+            yield self.summary()
+
+    def groups(self) -> List[Dict[str, Any]]:
+        """Grupe s brojem ticketa, najveće prvo (izjednačene po ključu)"""
+        single = len(self.group_by) == 1
+        rows = []
+        for key, count in self._groups.items():
+            values = (key,) if single else key
+            rows.append(
+                (
+                    -count,
+                    tuple(str(_value(value)) for value in values),
+                    {
+                        "key": {
+                            field: _value(value)
+                            for field, value in zip(self.group_by, values)
+                        },
+                        "count": count,
+                    },
+                )
+            )
+        rows.sort(key=lambda row: row[:2])
+        return [row[2] for row in rows]
+
+    def counts_by(self, field: str) -> Counter:
+        """Zbroj grupa po vrijednostima jednog od polja grupiranja"""
+        index = self.group_by.index(field)
+        single = len(self.group_by) == 1
+        counts: Counter = Counter()
+        for key, count in self._groups.items():
+            counts[_value(key if single else key[index])] += count
+        return counts
+
+    def summary(self) -> Dict[str, Any]:
+        """Brojevi u obliku ``StatsResponse`` (grupiranje mora biti status, prioritet)"""
+        status = self.counts_by("status")
+        priority = self.counts_by("priority")
+        return {
+            "total_tickets": self.total,
+            "open_tickets": status[StatusEnum.OPEN.value],
+            "closed_tickets": status[StatusEnum.CLOSED.value],
+            "priority_breakdown": {p.value: priority[p.value] for p in PriorityEnum},
+        }
+
+    def top_assignee_loads(self) -> List[Dict[str, Any]]:
+        """Top-K assigneeja po broju otvorenih ticketa"""
+        top = heapq.nsmallest(
+            self.top_assignees,
+            self._assignee_total,
+            key=lambda assignee: (-self._assignee_open[assignee], str(assignee)),
+        )
+        return [
+            {
+                "assignee": assignee,
+                "open_tickets": self._assignee_open[assignee],
+                "total_tickets": self._assignee_total[assignee],
+            }
+            for assignee in top
+        ]
+
+    def result(self) -> Dict[str, Any]:
+        """Rezultat u obliku ``GroupedStatsResponse``"""
+        return {
+            "total_tickets": self.total,
+            "group_by": list(self.group_by),
+            "groups": self.groups(),
+            "top_assignees": self.top_assignee_loads() if self.top_assignees else None,
+        }
@@ -0,0 +1,178 @@
+"""
+Povijest statistika: periodični snapshotovi u prstenastom bufferu
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Pozadinski zadatak svakih ``STATS_HISTORY_INTERVAL`` sekundi uzme trenutne
+statistike (iz memoiziranog ``/tickets/stats/summary``) i doda ih u buffer
+fiksne veličine; najstariji snapshot ispada kad se buffer napuni. Upiti za
+trend (GET /tickets/stats/history) samo čitaju buffer i ništa ne računaju.
+
+Uz ``STATS_HISTORY_PATH`` pozadinski zadatak nakon svakog snapshota zapisuje
+buffer u JSON datoteku u zasebnoj dretvi (atomično, preko privremene datoteke),
+a pri startu se učitavaju samo ispravni snapshotovi iz nje.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from pydantic import ValidationError
+
+from ..config import settings
+from ..models.ticket import StatsSnapshot
+from . import json_codec
+
+logger = logging.getLogger(__name__)
+
+# Prozor upita: sekunde, uz opcionalnu jedinicu (npr. 900, 15m, 6h, 1d)
+_WINDOW_RE = re.compile(r"^(\d+)([smhd]?)$")
+WINDOW_PATTERN = _WINDOW_RE.pattern
+_WINDOW_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# Polja snapshota čija se promjena računa u trendu
+_TREND_FIELDS = ("total_tickets", "open_tickets", "closed_tickets")
+
+
+def parse_window(window: str) -> int:
+    """Prozor u sekundama iz oblika ``<broj>[s|m|h|d]``"""
+    match = _WINDOW_RE.match(window)
+    if match is None:
+        raise ValueError(f"Neispravan prozor {window!r}")
+    return int(match.group(1)) * _WINDOW_UNITS[match.group(2) or "s"]
+
+
+def _is_valid(snapshot: Any) -> bool:
+    """Je li zapis iz datoteke snapshot kakav ``record`` sprema"""
+    if not isinstance(snapshot, dict):
+        return False
+    if not isinstance(snapshot.get("timestamp"), (int, float)):
+        return False
+    try:
+        StatsSnapshot.model_validate(snapshot)
+    except ValidationError:
+        return False
+    return True
+
+
+class StatsHistory:
+    """Prstenasti buffer snapshotova ``{"timestamp": ..., **StatsResponse}``"""
+
+    def __init__(self, capacity: int, path: Optional[str] = None):
+        self.capacity = capacity
+        self.path = path
+        self._snapshots: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def record(self, stats: Dict[str, Any], timestamp: Optional[float] = None) -> None:
+        """Dodaj snapshot u buffer"""
+        snapshot = {"timestamp": time.time() if timestamp is None else timestamp}
+        snapshot.update(stats)
+        self._snapshots.append(snapshot)
+
+    def window(
+        self, seconds: Optional[int] = None, now: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Snapshotovi iz zadnjih ``seconds`` sekundi (svi za None), najstariji prvi"""
+        if seconds is None:
+            return list(self._snapshots)
+        since = (time.time() if now is None else now) - seconds
+        return [s for s in self._snapshots if s["timestamp"] >= since]
+
+    @staticmethod
+    def trend(snapshots: List[Dict[str, Any]]) -> Optional[Dict[str, int]]:
+        """Promjena brojeva između prvog i zadnjeg snapshota"""
+        if len(snapshots) < 2:
+            return None
+        first, last = snapshots[0], snapshots[-1]
+        return {field: last[field] - first[field] for field in _TREND_FIELDS}
+
+    def save(self) -> None:
+        """Zapiši buffer u datoteku (ako je zadana); greška se samo logira"""
+        if self.path:
+            self._write(json_codec.dumps(list(self._snapshots)))
+
+    def _write(self, data: bytes) -> None:
+        assert self.path is not None
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("Povijest statistika nije zapisana u %s: %s", self.path, e)
+
+    def load(self) -> None:
+        """Učitaj buffer iz datoteke ako postoji (višak najstarijih ispada)"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "rb") as f:
+                snapshots = json_codec.loads(f.read())
+        except (OSError, ValueError) as e:
+            logger.warning("Povijest statistika nije učitana iz %s: %s", self.path, e)
+            return
+        if not isinstance(snapshots, list):
+            logger.warning("Povijest statistika u %s nije lista", self.path)
+            return
+        valid = [snapshot for snapshot in snapshots if _is_valid(snapshot)]
+        if len(valid) < len(snapshots):
+            logger.warning(
+                "Preskočeno %d neispravnih snapshotova iz %s",
+                len(snapshots) - len(valid),
+                self.path,
+            )
+        self._snapshots.clear()
+        self._snapshots.extend(valid)
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+
+    def start(
+        self, sample: Callable[[], Awaitable[Dict[str, Any]]], interval: float
+    ) -> None:
+        """Pokreni periodično uzimanje snapshotova u pozadini"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(sample, interval))
+
+    async def stop(self) -> None:
+        """Zaustavi pozadinski zadatak"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(
+        self, sample: Callable[[], Awaitable[Dict[str, Any]]], interval: float
+    ) -> None:
+        while True:
+            try:
+                self.record(await sample())
+                if self.path:
+                    # Serijalizacija u petlji, zapis na disk izvan nje
+                    data = json_codec.dumps(list(self._snapshots))
+                    await asyncio.to_thread(self._write, data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Propušten snapshot nije razlog da se uzorkovanje zaustavi
+                logger.warning("Snapshot statistika nije uspio: %s", e)
+            await asyncio.sleep(interval)
+
+
+# Singleton povijesti statistika
+stats_history = StatsHistory(
+    capacity=settings.stats_history_size, path=settings.stats_history_path
+)
@@ -0,0 +1,193 @@
+"""
+Inkrementalna sinkronizacija lokalnog storea s DummyJSON-om
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Todoi se dijele u raspone ID-eva (``SYNC_CHUNK_SIZE`` ID-eva po rasponu) i
+za svaki raspon pamti se hash sadržaja - izvornih todoa i username-a njihovih
+assigneeja, istih podataka koje drži store, pa i preimenovanje korisnika
+označi raspon promijenjenim. Pri sinkronizaciji se transformiraju samo todoi
+iz raspona čiji se hash promijenio, a ostali zapisi se preuzimaju
+nepromijenjeni. Raspon je po ID-u, ne po poziciji,
+pa brisanje jednog todoa ne pomiče granice ostalih raspona.
+
+Promjene u promijenjenim rasponima utvrđuju se po ID-u i hashu zapisa i
+vraćaju kao (``created``/``updated``/``deleted``, ID, zapis) - isti događaji
+koje objavljuje feed promjena. Promjene se u store unose pojedinačno
+(``apply_changes``), bez ponovne izgradnje indeksa i uz istu verziju; bez
+promjena store se samo označi svježim.
+
+Ako je store u međuvremenu učitan mimo sinkronizacije (npr. lijeno, kroz
+``ensure_fresh``), sljedeća sinkronizacija radi puni reload, ali promjene i
+dalje računa prema zadnjoj sinkronizaciji, pa feed ne gubi događaje. Samo
+prva sinkronizacija (ili nakon ``clear``) je polazišna i ne daje događaje.
+"""
+
+import asyncio
+import hashlib
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+from ..config import settings
+from ..models.record import TicketRecord
+from . import json_codec
+from .metrics import metrics
+from .ticket_store import TicketStore, ticket_store
+
+CREATED = "created"
+UPDATED = "updated"
+DELETED = "deleted"
+
+# (vrsta, ID ticketa, zapis ili None za obrisane)
+Change = Tuple[str, int, Optional[TicketRecord]]
+
+
+def content_hash(ticket: TicketRecord) -> bytes:
+    """Kratak, stabilan hash sadržaja ticketa
+
+    Status i prioritet su izvedeni iz izvornog todoa, pa su izvorni podaci i
+    assignee dovoljni da se uoči svaka promjena vidljiva u API-ju.
+    """
+    payload = json_codec.dumps([ticket.source_data(), ticket.assignee])
+    return hashlib.blake2b(payload, digest_size=8).digest()
+
+
+def chunk_hashes(
+    todos: List[Dict[str, Any]],
+    chunk_size: int,
+    assignees: Mapping[int, Optional[str]],
+) -> Dict[int, bytes]:
+    """Hash sadržaja po rasponu ID-eva (ključ je ``(id - 1) // chunk_size``)
+
+    ``assignees`` mapira ``userId`` u username koji zapis dobiva kao assignee.
+    """
+    chunks: Dict[int, List[Any]] = {}
+    for todo in sorted(todos, key=lambda todo: todo["id"]):
+        chunks.setdefault((todo["id"] - 1) // chunk_size, []).append(
+            [todo, assignees.get(todo["userId"])]
+        )
+    return {
+        key: hashlib.blake2b(json_codec.dumps(chunk), digest_size=8).digest()
+        for key, chunk in chunks.items()
+    }
+
+
+class StoreSync:
+    """Sinkronizacija storea koja obrađuje samo promijenjene raspone ID-eva"""
+
+    def __init__(self, store: TicketStore, chunk_size: int):
+        self.store = store
+        self.chunk_size = chunk_size
+        self._chunk_hashes: Dict[int, bytes] = {}
+        self._record_hashes: Dict[int, bytes] = {}
+        self._synced_version: Optional[int] = None
+        self._lock = asyncio.Lock()
+
+    def _chunk(self, ticket_id: int) -> int:
+        return (ticket_id - 1) // self.chunk_size
+
+    async def run(self) -> List[Change]:
+        """Jedna sinkronizacija; vraća promjene (prazno za polazišnu)"""
+        async with self._lock:
+            todos = await self.store.fetch_all_todos()
+            # Iz cachea korisnika; nepoznati bi se dohvatili i pri transformaciji
+            users = await self.store.transform_service.resolve_users(
+                todo["userId"] for todo in todos
+            )
+            assignees = {user_id: user.username for user_id, user in users.items()}
+            hashes = chunk_hashes(todos, self.chunk_size, assignees)
+
+            if self._synced_version != self.store.version:
+                tickets = await self.store.transform_service.transform_todos_to_tickets(
+                    todos
+                )
+                changes: List[Change] = []
+                if self._synced_version is not None:
+                    # Store je učitan mimo sinkronizacije - promjene od zadnje
+                    changes = self._diff(
+                        hashes.keys() | self._chunk_hashes.keys(), tickets
+                    )
+                self.store.load(tickets)
+                metrics.inc("store_sync.full_loads")
+                metrics.inc("store_sync.changes", len(changes))
+                self._remember(hashes, tickets)
+                return changes
+
+            changed: Set[int] = {
+                key
+                for key in hashes.keys() | self._chunk_hashes.keys()
+                if hashes.get(key) != self._chunk_hashes.get(key)
+            }
+            metrics.inc("store_sync.runs")
+            metrics.inc("store_sync.changed_chunks", len(changed))
+            if not changed:
+                self.store.touch()
+                return []
+
+            changed_todos = [t for t in todos if self._chunk(t["id"]) in changed]
+            tickets = await self.store.transform_service.transform_todos_to_tickets(
+                changed_todos
+            )
+            changes = self._diff(changed, tickets)
+            if changes:
+                self.store.apply_changes(
+                    [ticket for _, _, ticket in changes if ticket is not None],
+                    [ticket_id for kind, ticket_id, _ in changes if kind == DELETED],
+                )
+            else:
+                self.store.touch()
+            self._chunk_hashes = hashes
+            self._synced_version = self.store.version
+            metrics.inc("store_sync.changes", len(changes))
+            return changes
+
+    def _diff(self, changed: Set[int], tickets: List[TicketRecord]) -> List[Change]:
+        """Promjene unutar promijenjenih raspona, po ID-u i hashu zapisa"""
+        changes: List[Change] = []
+        seen: Set[int] = set()
+        for ticket in tickets:
+            seen.add(ticket.id)
+            digest = content_hash(ticket)
+            old = self._record_hashes.get(ticket.id)
+            if old != digest:
+                changes.append((CREATED if old is None else UPDATED, ticket.id, ticket))
+                self._record_hashes[ticket.id] = digest
+        deleted = sorted(
+            ticket_id
+            for ticket_id in self._record_hashes
+            if self._chunk(ticket_id) in changed and ticket_id not in seen
+        )
+        for ticket_id in deleted:
+            del self._record_hashes[ticket_id]
+            changes.append((DELETED, ticket_id, None))
+        return changes
+
+    def _remember(self, hashes: Dict[int, bytes], tickets: List[TicketRecord]) -> None:
+        self._chunk_hashes = hashes
+        self._record_hashes = {ticket.id: content_hash(ticket) for ticket in tickets}
+        self._synced_version = self.store.version
+
+    def adopt(self) -> None:
+        """Preuzmi trenutni sadržaj storea kao polazište (npr. nakon snapshota)
+
+        Hashevi raspona računaju se iz rekonstruiranih todoa, pa sljedeća
+        sinkronizacija odmah može biti inkrementalna.
+        """
+        tickets = self.store.snapshot()
+        todos = [ticket.source_data() for ticket in tickets]
+        assignees = {
+            ticket.user_id: ticket.assignee
+            for ticket in tickets
+            if ticket.user_id is not None
+        }
+        self._remember(chunk_hashes(todos, self.chunk_size, assignees), tickets)
+
+    def clear(self) -> None:
+        """Zaboravi stanje; sljedeća sinkronizacija je polazišna"""
+        self._chunk_hashes = {}
+        self._record_hashes = {}
+        self._synced_version = None
+
+
+# Singleton sinkronizacije lokalnog storea
+store_sync = StoreSync(ticket_store, chunk_size=settings.sync_chunk_size)
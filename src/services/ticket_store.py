@@ -0,0 +1,523 @@
+"""
+Lokalni in-memory store ticketa s unaprijed izračunatim indeksima
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Store drži cijeli skup ticketa iz DummyJSON-a poredan po ID-u. Pri svakom
+(ponovnom) učitavanju grade se:
+- bitmape po statusu, prioritetu i assigneeju (vidi ``bitmap`` modul)
+- permutacije sortiranja za svako polje iz ``SORT_FIELDS``, uzlazno i silazno
+- trigram indeks naslova za fuzzy pretragu
+
+Sortirana stranica bez filtera je tada obični slice permutacije. Pojedinačne
+promjene (``apply_changes``) ažuriraju samo bitove, mjesta u permutacijama i
+trigrame promijenjenih zapisa, bez ponovne izgradnje.
+"""
+
+import asyncio
+import bisect
+import heapq
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from ..config import settings
+from ..models.record import TicketRecord
+from ..models.ticket import SORT_FIELDS, PriorityEnum, StatusEnum, TicketFilters
+from . import bitmap
+from .filter_expression import compile_filter
+from .external_api import TicketTransformService, ticket_transform_service
+from .trigram_index import TrigramIndex
+
+_STATUS_RANK = {status.value: rank for rank, status in enumerate(StatusEnum)}
+_PRIORITY_RANK = {priority.value: rank for rank, priority in enumerate(PriorityEnum)}
+
+# Ključevi sortiranja - status i prioritet po redoslijedu u enumu, ne abecedno
+_SORT_KEYS: Dict[str, Callable[[TicketRecord], Any]] = {
+    "id": lambda ticket: ticket.id,
+    "title": lambda ticket: ticket.title.casefold(),
+    "status": lambda ticket: _STATUS_RANK[ticket.status.value],
+    "priority": lambda ticket: _PRIORITY_RANK[ticket.priority.value],
+    "assignee": lambda ticket: (ticket.assignee or "").casefold(),
+}
+
+# Polja za koja se grade bitmap indeksi
+INDEXED_FIELDS = ("status", "priority", "assignee")
+
+
+def _index_value(ticket: TicketRecord, field: str) -> Any:
+    """Ključ zapisa u bitmap indeksu polja (vrijednost enuma, ne instanca)"""
+    value = getattr(ticket, field)
+    return value.value if isinstance(value, Enum) else value
+
+
+_ENUM_FACET_VALUES = {
+    "status": [status.value for status in StatusEnum],
+    "priority": [priority.value for priority in PriorityEnum],
+}
+
+
+class TicketStore:
+    """In-memory kopija svih ticketa s indeksima za filtriranje i sortiranje"""
+
+    def __init__(
+        self,
+        transform_service: TicketTransformService,
+        ttl: int = settings.store_ttl,
+    ):
+        self.transform_service = transform_service
+        self.ttl = ttl
+        self.loaded_at: Optional[float] = None
+        self.version = 0
+        self._tickets: List[TicketRecord] = []
+        self._positions: Dict[int, int] = {}
+        self._ids: List[int] = []
+        self._titles: List[str] = []
+        self._indexes: Dict[str, Dict[str, int]] = {}
+        self._permutations: Dict[Tuple[str, bool], List[int]] = {}
+        self._ranks: Dict[Tuple[str, bool], List[int]] = {}
+        self._trigram_index = TrigramIndex(max_candidates=settings.fuzzy_max_candidates)
+        self._all_mask = 0
+        self._load_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tickets)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.loaded_at is not None
+
+    @property
+    def is_fresh(self) -> bool:
+        """Je li store učitan i mlađi od TTL-a"""
+        return (
+            self.loaded_at is not None and time.monotonic() - self.loaded_at < self.ttl
+        )
+
+    async def ensure_fresh(self) -> None:
+        """Učitaj store ako je prazan ili zastario (samo jedan reload istovremeno)"""
+        if self.is_fresh:
+            return
+        async with self._load_lock:
+            if not self.is_fresh:
+                await self.reload()
+
+    async def fetch_all_todos(self) -> List[Dict[str, Any]]:
+        """Dohvati sve todos iz DummyJSON-a (prvo ``total``, pa sve odjednom)"""
+        service = self.transform_service.dummy_json_service
+        initial_data = await service.get_todos(limit=1, skip=0)
+        total_available = initial_data.get("total", 0)
+
+        if not total_available:
+            return []
+        data = await service.get_todos(limit=total_available, skip=0)
+        return data.get("todos", [])
+
+    async def reload(self) -> None:
+        """Dohvati sve todos iz DummyJSON-a, transformiraj i ponovno izgradi indekse"""
+        todos = await self.fetch_all_todos()
+        tickets = await self.transform_service.transform_todos_to_tickets(todos)
+        self.load(tickets)
+
+    def load(self, tickets: List[TicketRecord]) -> None:
+        """Zamijeni sadržaj storea i izgradi sve indekse i permutacije"""
+        tickets = sorted(tickets, key=lambda ticket: ticket.id)
+        positions = range(len(tickets))
+
+        postings: Dict[str, Dict[str, List[int]]] = {f: {} for f in INDEXED_FIELDS}
+        for position, ticket in enumerate(tickets):
+            for field in INDEXED_FIELDS:
+                value = _index_value(ticket, field)
+                postings[field].setdefault(value, []).append(position)
+        indexes = {
+            field: {
+                value: bitmap.from_positions(field_positions)
+                for value, field_positions in values.items()
+            }
+            for field, values in postings.items()
+        }
+
+        permutations: Dict[Tuple[str, bool], List[int]] = {}
+        ranks: Dict[Tuple[str, bool], List[int]] = {}
+        for field in SORT_FIELDS:
+            sort_key = _SORT_KEYS[field]
+            for descending in (False, True):
+                # Stabilan sort nad pozicijama poredanim po ID-u - izjednačeni
+                # ticketi ostaju poredani po ID-u i kod silaznog sortiranja
+                permutation = sorted(
+                    positions,
+                    key=lambda position: sort_key(tickets[position]),
+                    reverse=descending,
+                )
+                rank = [0] * len(tickets)
+                for order, position in enumerate(permutation):
+                    rank[position] = order
+                permutations[(field, descending)] = permutation
+                ranks[(field, descending)] = rank
+
+        self._tickets = tickets
+        self._positions = {ticket.id: pos for pos, ticket in enumerate(tickets)}
+        self._ids = [ticket.id for ticket in tickets]
+        self._titles = [ticket.title.casefold() for ticket in tickets]
+        self._trigram_index.build([ticket.title for ticket in tickets])
+        self._indexes = indexes
+        self._permutations = permutations
+        self._ranks = ranks
+        self._all_mask = bitmap.full_mask(len(tickets))
+        self.loaded_at = time.monotonic()
+        self.version += 1
+
+    def apply_changes(
+        self, upserts: List[TicketRecord], deleted_ids: List[int]
+    ) -> None:
+        """Dodaj/zamijeni i obriši pojedine zapise, ostali ostaju isti objekti
+
+        Ništa se ne gradi ponovno: zamijenjenom zapisu mijenjaju se samo
+        njegovi bitovi, mjesto u permutacijama i trigrami. Novi i obrisani
+        zapisi pomiču pozicije iza sebe - one se preslikaju, a novi umetnu
+        binarnom pretragom. Verzija ostaje ista (cache fragmenata je ključan po
+        sadržaju zapisa). Liste ticketa i permutacija zamjenjuju se kopijama,
+        pa iteracija započeta prije promjene (``iter_batches``) vidi staro stanje.
+        """
+        deleted = {
+            self._positions[ticket_id]
+            for ticket_id in deleted_ids
+            if ticket_id in self._positions
+        }
+        created = sorted(
+            (ticket for ticket in upserts if ticket.id not in self._positions),
+            key=lambda ticket: ticket.id,
+        )
+        replaced = [ticket for ticket in upserts if ticket.id in self._positions]
+
+        self._tickets = list(self._tickets)
+        self._permutations = {
+            key: list(permutation) for key, permutation in self._permutations.items()
+        }
+        if created or deleted:
+            self._reposition(created, deleted)
+        for ticket in replaced:
+            self._replace(self._positions[ticket.id], ticket)
+        self.loaded_at = time.monotonic()
+
+    def _replace(self, position: int, ticket: TicketRecord) -> None:
+        """Zamijeni zapis na istoj poziciji i pomakni ga samo gdje se promijenio"""
+        old = self._tickets[position]
+        self._tickets[position] = ticket
+        bit = 1 << position
+        for field in INDEXED_FIELDS:
+            old_value = _index_value(old, field)
+            new_value = _index_value(ticket, field)
+            if old_value == new_value:
+                continue
+            index = self._indexes[field]
+            remaining = index[old_value] ^ bit
+            if remaining:
+                index[old_value] = remaining
+            else:
+                del index[old_value]
+            index[new_value] = index.get(new_value, 0) | bit
+        for field in SORT_FIELDS:
+            sort_key = _SORT_KEYS[field]
+            if sort_key(old) == sort_key(ticket):
+                continue
+            for descending in (False, True):
+                permutation = self._permutations[(field, descending)]
+                rank = self._ranks[(field, descending)]
+                old_order = rank[position]
+                del permutation[old_order]
+                new_order = self._insertion_order(
+                    permutation, position, field, descending
+                )
+                permutation.insert(new_order, position)
+                for order in range(
+                    min(old_order, new_order), max(old_order, new_order) + 1
+                ):
+                    rank[permutation[order]] = order
+        if old.title != ticket.title:
+            self._titles[position] = ticket.title.casefold()
+            self._trigram_index.replace(position, ticket.title)
+
+    def _reposition(self, created: List[TicketRecord], deleted: Set[int]) -> None:
+        """Umetni nove (poredane po ID-u) i izbaci obrisane pozicije
+
+        Pozicije ispred prve promjene ostaju iste; ostale se preslikaju uz
+        očuvan redoslijed, pa se bitmape, permutacije i trigram indeks ne sortiraju
+        ponovno.
+        """
+        old = self._tickets
+        first_created = (
+            bisect.bisect_left(self._ids, created[0].id) if created else len(old)
+        )
+        start = min(deleted | {first_created})
+
+        mapping = list(range(start)) + [-1] * (len(old) - start)
+        tickets = old[:start]
+        added: List[int] = []
+        pending = deque(created)
+        for position in range(start, len(old)):
+            while pending and pending[0].id < old[position].id:
+                added.append(len(tickets))
+                tickets.append(pending.popleft())
+            if position not in deleted:
+                mapping[position] = len(tickets)
+                tickets.append(old[position])
+        for ticket in pending:
+            added.append(len(tickets))
+            tickets.append(ticket)
+
+        titles = self._titles[:start] + [""] * (len(tickets) - start)
+        for position in range(start, len(old)):
+            if mapping[position] >= 0:
+                titles[mapping[position]] = self._titles[position]
+        for position in added:
+            titles[position] = tickets[position].title.casefold()
+
+        self._tickets = tickets
+        self._positions = {ticket.id: pos for pos, ticket in enumerate(tickets)}
+        self._ids = [ticket.id for ticket in tickets]
+        self._titles = titles
+        self._trigram_index.remap(
+            mapping, start, {position: tickets[position].title for position in added}
+        )
+        self._all_mask = bitmap.full_mask(len(tickets))
+        self._remap_indexes(mapping, start, added)
+        self._remap_permutations(mapping, start, added)
+
+    def _remap_indexes(self, mapping: List[int], start: int, added: List[int]) -> None:
+        """Preslikaj bitove pomaknutih pozicija i postavi bitove novih zapisa"""
+        shifted = start < len(mapping)
+        for field, index in self._indexes.items():
+            for value in list(index):
+                if shifted:
+                    index[value] = bitmap.remap(index[value], mapping, start)
+                if not index[value]:
+                    del index[value]
+            for position in added:
+                value = _index_value(self._tickets[position], field)
+                index[value] = index.get(value, 0) | (1 << position)
+
+    def _remap_permutations(
+        self, mapping: List[int], start: int, added: List[int]
+    ) -> None:
+        """Preslikaj permutacije (redoslijed ostaje), umetni nove i obnovi rankove"""
+        shifted = start < len(mapping)
+        for key, permutation in self._permutations.items():
+            if shifted:
+                permutation[:] = [mapping[p] for p in permutation if mapping[p] >= 0]
+                rank = [0] * len(self._tickets)
+                first = 0
+            else:
+                rank = self._ranks[key] + [0] * len(added)
+                first = len(permutation)
+            for position in added:
+                order = self._insertion_order(permutation, position, *key)
+                permutation.insert(order, position)
+                first = min(first, order)
+            for order in range(first, len(permutation)):
+                rank[permutation[order]] = order
+            self._ranks[key] = rank
+
+    def _insertion_order(
+        self, permutation: List[int], position: int, field: str, descending: bool
+    ) -> int:
+        """Mjesto pozicije u permutaciji - isti poredak kao stabilan sort u ``load``
+
+        Izjednačeni ključevi ostaju poredani po poziciji (ID-u) i kod silaznog
+        smjera.
+        """
+        sort_key = _SORT_KEYS[field]
+        key = sort_key(self._tickets[position])
+        low, high = 0, len(permutation)
+        while low < high:
+            middle = (low + high) // 2
+            other = permutation[middle]
+            other_key = sort_key(self._tickets[other])
+            if other_key == key:
+                before = other < position
+            elif descending:
+                before = other_key > key
+            else:
+                before = other_key < key
+            if before:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def restore(self, tickets: List[TicketRecord], age: float) -> None:
+        """Učitaj zapise stare ``age`` sekundi (npr. iz snapshota na disku)
+
+        Svježina se računa od trenutka kad su zapisi dohvaćeni, pa se prestar
+        snapshot ponovno učitava kao i svaki zastarjeli store.
+        """
+        self.load(tickets)
+        self.loaded_at = time.monotonic() - age
+
+    def touch(self) -> None:
+        """Označi store svježim bez promjene sadržaja i verzije"""
+        self.loaded_at = time.monotonic()
+
+    def clear(self) -> None:
+        """Isprazni store; sljedeći ``ensure_fresh`` ga ponovno učitava"""
+        self.load([])
+        self.loaded_at = None
+
+    def snapshot(self) -> List[TicketRecord]:
+        """Svi zapisi po ID-u; reload zamjenjuje listu, ne mijenja postojeću"""
+        return self._tickets
+
+    def get(self, ticket_id: int) -> Optional[TicketRecord]:
+        """Dohvati ticket po ID-u ili None"""
+        position = self._positions.get(ticket_id)
+        return None if position is None else self._tickets[position]
+
+    def stats(self) -> Dict[str, Any]:
+        """Statistike u obliku ``StatsResponse`` izračunate iz bitmap indeksa"""
+        facets = self.facet_counts(TicketFilters(facets=["status", "priority"]))
+        return {
+            "total_tickets": len(self._tickets),
+            "open_tickets": facets["status"][StatusEnum.OPEN.value],
+            "closed_tickets": facets["status"][StatusEnum.CLOSED.value],
+            "priority_breakdown": facets["priority"],
+        }
+
+    def match_mask(self, filters: TicketFilters) -> int:
+        """Bitmapa ticketa koji zadovoljavaju status, prioritet, search i filter izraz"""
+        mask = self._all_mask
+        if filters.status:
+            mask &= self._indexes["status"].get(filters.status.value, 0)
+        if filters.priority:
+            mask &= self._indexes["priority"].get(filters.priority.value, 0)
+        if filters.search and not filters.fuzzy:
+            mask &= self.search_mask(filters.search)
+        if filters.filter_expression and mask:
+            mask &= compile_filter(filters.filter_expression)(self)
+        return mask
+
+    @property
+    def all_mask(self) -> int:
+        """Bitmapa svih ticketa u storeu"""
+        return self._all_mask
+
+    def field_mask(self, field: str, value: str) -> int:
+        """Bitmapa ticketa s danom vrijednošću indeksiranog polja"""
+        return self._indexes.get(field, {}).get(value, 0)
+
+    def id_range_mask(self, low: int, high: int) -> int:
+        """Bitmapa ticketa s ID-em u [low, high] - pozicije su poredane po ID-u"""
+        start = bisect.bisect_left(self._ids, low)
+        stop = bisect.bisect_right(self._ids, high)
+        if start >= stop:
+            return 0
+        return bitmap.full_mask(stop) ^ bitmap.full_mask(start)
+
+    def search_mask(self, query: str) -> int:
+        """Podstring pretraga po naslovu, kao DummyJSON todos/search"""
+        needle = query.casefold()
+        return bitmap.from_positions(
+            position for position, title in enumerate(self._titles) if needle in title
+        )
+
+    def query(self, filters: TicketFilters) -> Tuple[List[TicketRecord], int]:
+        """Vrati (tickete na traženoj stranici, ukupan broj pogodaka)"""
+        mask = self.match_mask(filters)
+        sort_spec = filters.sort_spec
+        start = (filters.page - 1) * filters.per_page
+        stop = start + filters.per_page
+
+        if filters.fuzzy and filters.search:
+            positions, total = self._fuzzy_page(filters, mask, start, stop)
+        elif mask == self._all_mask:
+            # Bez filtera stranica je direktno slice permutacije - O(per_page)
+            positions = self._permutations[sort_spec][start:stop]
+            total = len(self._tickets)
+        else:
+            # S filterom biramo najmanjih `stop` po ranku unutar permutacije
+            rank = self._ranks[sort_spec]
+            positions = heapq.nsmallest(
+                stop, bitmap.iter_positions(mask), key=rank.__getitem__
+            )[start:]
+            total = bitmap.count(mask)
+
+        return [self._tickets[position] for position in positions], total
+
+    def iter_batches(
+        self, filters: TicketFilters, batch_size: int
+    ) -> Iterator[List[TicketRecord]]:
+        """Svi pogoci za filtere redom sortiranja, u grupama od ``batch_size``
+
+        Drži referencu na listu ticketa s početka, pa reload tijekom
+        iteracije ne miješa dvije verzije podataka.
+        """
+        tickets = self._tickets
+        mask = self.match_mask(filters)
+        if mask == self._all_mask:
+            positions = self._permutations[filters.sort_spec]
+        else:
+            rank = self._ranks[filters.sort_spec]
+            positions = sorted(bitmap.iter_positions(mask), key=rank.__getitem__)
+        for start in range(0, len(positions), batch_size):
+            yield [tickets[p] for p in positions[start : start + batch_size]]
+
+    def _fuzzy_matches(self, filters: TicketFilters) -> List[int]:
+        """Pozicije fuzzy pogodaka, najsličnije prvo"""
+        threshold = filters.fuzzy_threshold
+        if threshold is None:
+            threshold = settings.fuzzy_threshold
+        return [
+            position
+            for position, _score in self._trigram_index.search(
+                filters.search or "", threshold
+            )
+        ]
+
+    def _fuzzy_page(
+        self, filters: TicketFilters, mask: int, start: int, stop: int
+    ) -> Tuple[List[int], int]:
+        """Fuzzy pogoci rangirani po sličnosti (ili po ``sort`` ako je zadan)"""
+        matches = self._fuzzy_matches(filters)
+        if mask != self._all_mask:
+            allowed = set(bitmap.iter_positions(mask))
+            matches = [position for position in matches if position in allowed]
+        if filters.sort:
+            matches.sort(key=self._ranks[filters.sort_spec].__getitem__)
+        return matches[start:stop], len(matches)
+
+    def result_mask(self, filters: TicketFilters) -> int:
+        """Bitmapa svih pogodaka za filtere, uključujući fuzzy pretragu"""
+        mask = self.match_mask(filters)
+        if filters.fuzzy and filters.search:
+            mask &= bitmap.from_positions(self._fuzzy_matches(filters))
+        return mask
+
+    def facet_counts(self, filters: TicketFilters) -> Dict[str, Dict[str, int]]:
+        """Broj pogodaka po vrijednosti za svako polje iz ``filters.facets``
+
+        Brojevi su popcount presjeka bitmape pogodaka i bitmape vrijednosti,
+        bez materijaliziranja ijednog ticketa.
+        """
+        mask = self.result_mask(filters)
+        facets: Dict[str, Dict[str, int]] = {}
+        for field in filters.facets:
+            index = self._indexes.get(field, {})
+            if field in _ENUM_FACET_VALUES:
+                # Status i prioritet uvijek vraćaju sve vrijednosti, i nule
+                facets[field] = {
+                    value: bitmap.count(mask & index.get(value, 0))
+                    for value in _ENUM_FACET_VALUES[field]
+                }
+                continue
+            counts = [
+                (value, bitmap.count(mask & posting))
+                for value, posting in index.items()
+            ]
+            counts.sort(key=lambda item: (-item[1], item[0]))
+            facets[field] = {value: total for value, total in counts if total}
+        return facets
+
+
+# Singleton instanca storea
+ticket_store = TicketStore(ticket_transform_service)
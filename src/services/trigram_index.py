@@ -0,0 +1,122 @@
+"""
+Trigram indeks za fuzzy pretragu naslova ticketa
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Naslovi se razlažu na trigrame riječi (kao pg_trgm: svaka riječ se nadopuni s
+dva razmaka sprijeda i jednim straga). Sličnost je udio trigrama upita koji se
+nalaze u naslovu, pa upit s tipfelerom i dalje pogađa naslov koji ga sadrži.
+
+Kandidati se generiraju prefiks filtriranjem: naslov sa sličnošću >= prag mora
+dijeliti barem ``ceil(prag * |upit|)`` trigrama, pa se mora pojaviti u barem
+jednoj od ``|upit| - min_shared + 1`` najrjeđih posting lista. Ostale (česte)
+liste se ne čitaju. Ako kandidata ima više od ``max_candidates``, zadržavaju se
+oni s najviše zajedničkih trigrama u tim listama, ne prvi po poziciji.
+"""
+
+import bisect
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Dict, FrozenSet, List, Mapping, Sequence, Set, Tuple
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def trigrams(text: str) -> Set[str]:
+    """Skup trigrama svih riječi u tekstu (case-insensitive)"""
+    grams: Set[str] = set()
+    for word in _WORD_RE.findall(text.casefold()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class TrigramIndex:
+    """Invertirani indeks trigram -> pozicije naslova"""
+
+    def __init__(self, titles: Sequence[str] = (), max_candidates: int = 1000):
+        self.max_candidates = max_candidates
+        self._grams: List[FrozenSet[str]] = []
+        self._postings: Dict[str, List[int]] = {}
+        self.build(titles)
+
+    def build(self, titles: Sequence[str]) -> None:
+        """Izgradi indeks; pozicija naslova odgovara poziciji ticketa u storeu"""
+        grams_per_title = [frozenset(trigrams(title)) for title in titles]
+        postings: Dict[str, List[int]] = {}
+        for position, grams in enumerate(grams_per_title):
+            for gram in grams:
+                postings.setdefault(gram, []).append(position)
+        self._grams = grams_per_title
+        self._postings = postings
+
+    def replace(self, position: int, title: str) -> None:
+        """Zamijeni naslov na poziciji; mijenjaju se samo liste razlike trigrama"""
+        old, new = self._grams[position], frozenset(trigrams(title))
+        for gram in old - new:
+            postings = self._postings[gram]
+            del postings[bisect.bisect_left(postings, position)]
+            if not postings:
+                del self._postings[gram]
+        for gram in new - old:
+            bisect.insort(self._postings.setdefault(gram, []), position)
+        self._grams[position] = new
+
+    def remap(
+        self, mapping: Sequence[int], start: int, added: Mapping[int, str]
+    ) -> None:
+        """Preslikaj pozicije (``-1`` za obrisane) i dodaj naslove na nove pozicije
+
+        ``mapping`` je rastući, pa posting liste ostaju poredane. Pozicije
+        ispod ``start`` se ne mijenjaju, a postojeći naslovi se ne tokeniziraju
+        ponovno.
+        """
+        moved = [position for position in mapping[start:] if position >= 0]
+        grams = self._grams[:start] + [frozenset()] * (len(moved) + len(added))
+        for old_position in range(start, len(self._grams)):
+            if mapping[old_position] >= 0:
+                grams[mapping[old_position]] = self._grams[old_position]
+        if moved != list(range(start, len(self._grams))):
+            for gram, postings in list(self._postings.items()):
+                first = bisect.bisect_left(postings, start)
+                postings[first:] = [
+                    mapping[p] for p in postings[first:] if mapping[p] >= 0
+                ]
+                if not postings:
+                    del self._postings[gram]
+        self._grams = grams
+        for position, title in added.items():
+            self._grams[position] = frozenset(trigrams(title))
+            for gram in self._grams[position]:
+                bisect.insort(self._postings.setdefault(gram, []), position)
+
+    def search(self, query: str, threshold: float) -> List[Tuple[int, float]]:
+        """Vrati (pozicija, sličnost) za naslove iznad praga, najsličnije prvo"""
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+
+        min_shared = max(1, math.ceil(threshold * len(query_grams)))
+        by_rarity = sorted(query_grams, key=lambda g: len(self._postings.get(g, ())))
+        prefix = by_rarity[: len(by_rarity) - min_shared + 1]
+
+        hits: Counter = Counter()
+        for gram in prefix:
+            hits.update(self._postings.get(gram, ()))
+        candidates = list(hits)
+        if len(candidates) > self.max_candidates:
+            candidates = heapq.nlargest(
+                self.max_candidates, candidates, key=lambda p: (hits[p], -p)
+            )
+
+        results = []
+        for position in candidates:
+            score = len(query_grams & self._grams[position]) / len(query_grams)
+            if score >= threshold:
+                results.append((position, score))
+
+        results.sort(key=lambda result: (-result[1], result[0]))
+        return results
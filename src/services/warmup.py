@@ -0,0 +1,71 @@
+"""
+Zagrijavanje cacheova pri startu i stanje spremnosti instance
+
+Autor: Roko Čubrić (roko.cubric@fer.hr)
+AI Akademija 2025 - Python Developer Test
+
+Zagrijavanje se izvodi u pozadini, pa instanca odmah odgovara na
+``/health`` (live), a ``/health/ready`` vraća 503 dok zagrijavanje traje.
+Neuspjelo ili predugo zagrijavanje ne blokira promet zauvijek: instanca
+postaje spremna, ali ostaje "cold" i cacheovi se pune na zahtjevima.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+from .metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+COLD = "cold"
+WARMING = "warming"
+WARM = "warm"
+
+
+class Warmup:
+    """Stanje zagrijavanja: ``cold``, ``warming`` ili ``warm``"""
+
+    def __init__(self):
+        self.state = COLD
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        """Smije li instanca primati promet (ne dok se zagrijava)"""
+        return self.state != WARMING
+
+    async def run(self, warm: Callable[[], Awaitable[None]], timeout: float) -> None:
+        """Izvedi zagrijavanje; greška ili istek vremena ostavljaju ``cold``"""
+        self.state = WARMING
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(warm(), timeout)
+            self.state = WARM
+        except Exception as e:
+            logger.warning("Zagrijavanje cacheova nije uspjelo: %s", e)
+            self.state = COLD
+        finally:
+            metrics.set("warmup.seconds", round(time.monotonic() - started, 3))
+
+    def start(self, warm: Callable[[], Awaitable[None]], timeout: float) -> None:
+        """Pokreni zagrijavanje u pozadini; stanje odmah postaje ``warming``"""
+        if self._task is None:
+            self.state = WARMING
+            self._task = asyncio.create_task(self.run(warm, timeout))
+
+    async def stop(self) -> None:
+        """Prekini zagrijavanje ako još traje"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+# Singleton stanja zagrijavanja
+warmup = Warmup()
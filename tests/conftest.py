@@ -14,6 +14,30 @@ def client():
     return TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def reset_local_state():
+    """Isprazni lokalni store i cache stranica nakon svakog testa"""
+    yield
+    from src.api.tickets import page_prefetcher, stats_summary
+    from src.services.change_feed import change_feed
+    from src.services.metrics import metrics
+    from src.services.query_planner import page_cache
+    from src.services.stats_history import stats_history
+    from src.services.store_sync import store_sync
+    from src.services.warmup import COLD, warmup
+    from src.services.ticket_store import ticket_store
+
+    ticket_store.clear()
+    page_cache.clear()
+    page_prefetcher.clear()
+    stats_summary.clear()
+    stats_history.clear()
+    change_feed.clear()
+    store_sync.clear()
+    warmup.state = COLD
+    metrics.reset()
+
+
 @pytest.fixture
 def mock_dummyjson_response():
     """Mock response from DummyJSON API"""
@@ -5,11 +5,15 @@ Generated with AI assistance - GitHub Copilot
 Razlog: Standardni pattern za integration testove FastAPI aplikacija
 """
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, patch
 
 from src.main import app
+from src.models.record import TicketRecord
+from src.models.ticket import PriorityEnum, StatusEnum, UserBase
 
 
 @pytest.fixture
@@ -73,6 +77,23 @@ class TestHealthEndpoints:
         data = response.json()
         assert data["status"] == "healthy"
         assert data["service"] == "tickethub-api"
+        assert data["live"] is True
+        assert data["warm"] is False
+
+    def test_readiness_waits_for_warmup(self, client):
+        """Test readiness probe: 503 dok se cacheovi zagrijavaju"""
+        from src.services.warmup import WARM, WARMING, warmup
+
+        assert client.get("/health/ready").status_code == 200
+
+        warmup.state = WARMING
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json() == {"ready": False, "cache_state": "warming"}
+
+        warmup.state = WARM
+        assert client.get("/health").json()["warm"] is True
+        assert client.get("/health/ready").json()["ready"] is True
 
 
 class TestTicketEndpoints:
@@ -89,20 +110,20 @@ class TestTicketEndpoints:
         # Setup mocks
         mock_get_todos.return_value = mock_dummy_json_todos_response
         mock_transform.return_value = [
-            {
-                "id": 1,
-                "title": "Do something nice for someone I care about",
-                "status": "open",
-                "priority": "medium",
-                "assignee": "hkmiles",
-            },
-            {
-                "id": 2,
-                "title": "Memorize the fifty states and their capitals",
-                "status": "closed",
-                "priority": "high",
-                "assignee": "testuser",
-            },
+            TicketRecord(
+                id=1,
+                title="Do something nice for someone I care about",
+                status="open",
+                priority="medium",
+                assignee="hkmiles",
+            ),
+            TicketRecord(
+                id=2,
+                title="Memorize the fifty states and their capitals",
+                status="closed",
+                priority="high",
+                assignee="testuser",
+            ),
         ]
 
         response = client.get("/tickets/")
@@ -119,6 +140,383 @@ class TestTicketEndpoints:
         assert data["total"] == 150
         assert data["page"] == 1
         assert data["per_page"] == 30
+        assert response.headers["X-Query-Plan"].startswith("upstream;")
+
+        # Ista stranica drugi put dolazi iz cachea, bez upstream poziva
+        response = client.get("/tickets/")
+        assert response.status_code == 200
+        assert response.headers["X-Query-Plan"].startswith("cache;")
+        assert len(response.json()["items"]) == 2
+        mock_get_todos.assert_called_once()
+
+    @patch(
+        "src.services.ticket_store.ticket_store.ensure_fresh", new_callable=AsyncMock
+    )
+    def test_get_tickets_sorted_from_store(self, mock_ensure_fresh, client):
+        """Test sortiranja iz lokalnog storea"""
+        from src.services.ticket_store import ticket_store
+
+        ticket_store.load(
+            [
+                TicketRecord(ticket_id, f"Ticket {ticket_id}", "open", priority, "hk")
+                for ticket_id, priority in [(1, "medium"), (2, "high"), (3, "low")]
+            ]
+        )
+
+        response = client.get("/tickets/?sort=-priority&per_page=2")
+        assert response.status_code == 200
+        assert response.headers["X-Query-Plan"].startswith("store;")
+        mock_ensure_fresh.assert_awaited_once()
+
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == [2, 1]
+        assert data["total"] == 3
+        assert data["pages"] == 2
+        assert "facets" not in data
+
+        response = client.get("/tickets/?priority=high&facets=status,priority")
+        assert response.status_code == 200
+        assert response.json()["facets"] == {
+            "status": {"open": 1, "closed": 0},
+            "priority": {"low": 0, "medium": 0, "high": 1},
+        }
+
+        response = client.get("/tickets/?filter=priority:high OR id:3&sort=-id")
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [3, 2]
+
+        response = client.get("/tickets/?sort=-id&per_page=1&fields=id,priority")
+        assert response.status_code == 200
+        assert response.json()["items"] == [{"id": 3, "priority": "low"}]
+
+    @patch(
+        "src.services.ticket_store.ticket_store.ensure_fresh", new_callable=AsyncMock
+    )
+    def test_export_tickets_from_store(self, mock_ensure_fresh, client):
+        """Test streaming exporta u NDJSON i CSV formatu"""
+        from src.services.ticket_store import ticket_store
+
+        ticket_store.load(
+            [
+                TicketRecord(ticket_id, f"Ticket {ticket_id}", "open", priority, "hk")
+                for ticket_id, priority in [(1, "medium"), (2, "high"), (3, "high")]
+            ]
+        )
+
+        response = client.get("/tickets/export?priority=high&sort=-id")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.headers["X-Query-Plan"].startswith("store;")
+        lines = response.text.splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [3, 2]
+
+        response = client.get("/tickets/export?format=csv&filter=id:1..2")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "tickets.csv" in response.headers["content-disposition"]
+        assert response.text.splitlines() == [
+            "id,title,status,priority,assignee",
+            "1,Ticket 1,open,medium,hk",
+            "2,Ticket 2,open,high,hk",
+        ]
+
+    @patch(
+        "src.services.ticket_store.ticket_store.ensure_fresh", new_callable=AsyncMock
+    )
+    def test_binary_formats_keep_response_schema(self, mock_ensure_fresh, client):
+        """Test MessagePack i CBOR odgovora preko Accept headera"""
+        msgpack = pytest.importorskip("msgpack")
+        cbor2 = pytest.importorskip("cbor2")
+        from src.services.ticket_store import ticket_store
+
+        ticket_store.load(
+            [
+                TicketRecord(ticket_id, f"Ticket {ticket_id}", "open", priority, "hk")
+                for ticket_id, priority in [(1, "medium"), (2, "high")]
+            ]
+        )
+
+        url = "/tickets/?sort=-id&facets=status"
+        response = client.get(url, headers={"Accept": "application/msgpack"})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/msgpack"
+        assert "Accept" in response.headers["vary"]
+        assert msgpack.unpackb(response.content) == client.get(url).json()
+
+        response = client.get("/tickets/2", headers={"Accept": "application/cbor"})
+        assert response.status_code == 200
+        assert cbor2.loads(response.content) == client.get("/tickets/2").json()
+
+        response = client.get(
+            "/tickets/stats/summary", headers={"Accept": "application/msgpack"}
+        )
+        assert response.status_code == 200
+        assert msgpack.unpackb(response.content) == {
+            "total_tickets": 2,
+            "open_tickets": 2,
+            "closed_tickets": 0,
+            "priority_breakdown": {"low": 0, "medium": 1, "high": 1},
+        }
+
+    @patch("src.services.batch_lookup.dummy_json_service.get_todo_by_id")
+    def test_batch_lookup(self, mock_get_todo, client):
+        """Test batch dohvata: store pogoci, deduplikacija i not_found"""
+        from fastapi import HTTPException
+        from src.services.ticket_store import ticket_store
+
+        ticket_store.load(
+            [
+                TicketRecord(ticket_id, f"Ticket {ticket_id}", "open", "low", "hk")
+                for ticket_id in (1, 2)
+            ]
+        )
+        mock_get_todo.side_effect = HTTPException(status_code=404)
+
+        response = client.post("/tickets/batch", json={"ids": [2, 1, 2, 999]})
+        assert response.status_code == 200
+        data = response.json()
+        assert list(data["tickets"]) == ["2", "1"]
+        assert data["tickets"]["1"]["source_data"]["todo"] == "Ticket 1"
+        assert data["not_found"] == [999]
+        mock_get_todo.assert_called_once_with(999)
+
+    @patch(
+        "src.services.ticket_store.ticket_store.ensure_fresh", new_callable=AsyncMock
+    )
+    def test_grouped_stats_from_store(self, mock_ensure_fresh, client):
+        """Test group-by statistika i top assigneeja iz lokalnog storea"""
+        from src.services.ticket_store import ticket_store
+
+        ticket_store.load(
+            [
+                TicketRecord(1, "a", "open", "high", "hk"),
+                TicketRecord(2, "b", "open", "low", "hk"),
+                TicketRecord(3, "c", "closed", "high", "emilys"),
+            ]
+        )
+
+        response = client.get("/tickets/stats?group_by=priority,status&top_assignees=1")
+        assert response.status_code == 200
+        assert response.headers["X-Query-Plan"].startswith("store;")
+        data = response.json()
+        assert data["total_tickets"] == 3
+        assert data["group_by"] == ["priority", "status"]
+        assert {"key": {"priority": "high", "status": "open"}, "count": 1} in data[
+            "groups"
+        ]
+        assert data["top_assignees"] == [
+            {"assignee": "hk", "open_tickets": 2, "total_tickets": 2}
+        ]
+
+        response = client.get("/tickets/stats")
+        assert "top_assignees" not in response.json()
+
+    @patch(
+        "src.services.ticket_store.ticket_store.ensure_fresh", new_callable=AsyncMock
+    )
+    def test_stats_summary_is_memoized(self, mock_ensure_fresh, client):
+        """Test da se statistike računaju jednom i broje u /metrics"""
+        from src.services.ticket_store import ticket_store
+
+        ticket_store.load([TicketRecord(1, "a", "open", "high", "hk")])
+
+        for _ in range(3):
+            response = client.get("/tickets/stats/summary")
+            assert response.status_code == 200
+            assert response.json()["total_tickets"] == 1
+
+        mock_ensure_fresh.assert_awaited_once()
+        metrics = client.get("/metrics").json()
+        assert metrics["stats_summary.computations"] == 1
+        assert metrics["stats_summary.hits"] == 2
+
+    @patch(
+        "src.services.ticket_store.ticket_store.ensure_fresh", new_callable=AsyncMock
+    )
+    @patch("src.services.export.dummy_json_service.get_todos", new_callable=AsyncMock)
+    def test_stats_stream_sends_partial_then_final(
+        self, mock_get_todos, mock_ensure_fresh, client
+    ):
+        """Test SSE statistika iz hladnog storea: događaj po upstream stranici"""
+        todos = [
+            {"id": i, "todo": f"Todo {i}", "completed": i % 3 == 0, "userId": 1}
+            for i in range(1, 6)
+        ]
+        mock_get_todos.side_effect = lambda limit, skip: {
+            "todos": todos[skip : skip + 2],
+            "total": len(todos),
+        }
+
+        with patch("src.api.tickets.settings.stats_page_size", 2):
+            response = client.get("/tickets/stats/stream")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.headers["X-Query-Plan"].startswith("upstream;")
+
+        events = [
+            (block.split("\n")[0], json.loads(block.split("data: ", 1)[1]))
+            for block in response.text.strip().split("\n\n")
+        ]
+        assert [name for name, _ in events] == ["event: partial"] * 3 + ["event: final"]
+        assert [data["total_tickets"] for _, data in events] == [2, 4, 5, 5]
+        final = events[-1][1]
+        assert final["closed_tickets"] == 1
+        assert sum(final["priority_breakdown"].values()) == 5
+        mock_ensure_fresh.assert_not_awaited()
+
+    @patch("src.services.export.dummy_json_service.get_todos", new_callable=AsyncMock)
+    def test_stats_stream_from_stale_store_streams_pages(self, mock_get_todos, client):
+        """Test da zastarjeli store ne čeka reload nego streama stranice"""
+        from src.services.ticket_store import ticket_store
+
+        ticket_store.load([TicketRecord(1, "a", "open", "high", "hk")])
+        ticket_store.loaded_at -= ticket_store.ttl
+        todos = [
+            {"id": i, "todo": f"Todo {i}", "completed": False, "userId": 1}
+            for i in range(1, 4)
+        ]
+        mock_get_todos.side_effect = lambda limit, skip: {
+            "todos": todos[skip : skip + 2],
+            "total": len(todos),
+        }
+
+        with patch("src.api.tickets.settings.stats_page_size", 2):
+            response = client.get("/tickets/stats/stream")
+        assert response.headers["X-Query-Plan"].startswith("upstream;")
+        names = [block.split("\n")[0] for block in response.text.strip().split("\n\n")]
+        assert names == ["event: partial", "event: partial", "event: final"]
+        assert len(ticket_store) == 1
+
+    @patch(
+        "src.services.external_api.ticket_transform_service.dummy_json_service",
+    )
+    @patch("src.services.export.dummy_json_service.get_todos", new_callable=AsyncMock)
+    def test_stats_summary_from_cold_store_scans_upstream_pages(
+        self, mock_get_todos, mock_transform_api, client
+    ):
+        """Test da hladan store ne pokreće reload nego brojanje upstream stranica"""
+        todos = [
+            {"id": i, "todo": f"Todo {i}", "completed": i % 2 == 0, "userId": i}
+            for i in range(1, 601)
+        ]
+        mock_get_todos.side_effect = lambda limit, skip: {
+            "todos": todos[skip : skip + limit],
+            "total": len(todos),
+        }
+
+        response = client.get("/tickets/stats/summary")
+        assert response.status_code == 200
+        assert response.headers["X-Query-Plan"].startswith("upstream;")
+        assert response.headers["X-Query-Plan"].endswith("reason=upstream-scan")
+        assert response.json()["total_tickets"] == 600
+        assert response.json()["closed_tickets"] == 300
+
+        assert [call.kwargs for call in mock_get_todos.await_args_list] == [
+            {"limit": 250, "skip": skip} for skip in (0, 250, 500)
+        ]
+        # Bez assigneeja - nikakav dohvat korisnika
+        mock_transform_api.get_user_by_id.assert_not_called()
+        mock_transform_api.get_users.assert_not_called()
+
+    @patch(
+        "src.services.ticket_store.ticket_store.ensure_fresh", new_callable=AsyncMock
+    )
+    def test_stats_stream_from_store_sends_final_only(self, mock_ensure_fresh, client):
+        """Test SSE statistika iz svježeg storea"""
+        from src.services.ticket_store import ticket_store
+
+        ticket_store.load([TicketRecord(1, "a", "open", "high", "hk")])
+
+        response = client.get("/tickets/stats/stream")
+        assert response.status_code == 200
+        assert response.text.startswith("event: final\ndata: ")
+        assert json.loads(response.text.split("data: ", 1)[1])["open_tickets"] == 1
+
+    @patch("src.api.tickets.settings.stats_history_interval", 0)
+    def test_stats_history_disabled(self, client):
+        """Test da isključeno uzorkovanje nije prazna povijest nego 503"""
+        response = client.get("/tickets/stats/history")
+        assert response.status_code == 503
+        assert "STATS_HISTORY_INTERVAL" in response.json()["detail"]
+
+    @patch("src.api.tickets.settings.stats_history_interval", 60)
+    def test_stats_history_window_and_trend(self, client):
+        """Test povijesti statistika: prozor i promjena od prvog snapshota"""
+        import time
+
+        from src.services.stats_history import stats_history
+
+        now = time.time()
+        for age, open_tickets in ((7200, 9), (600, 5), (60, 4)):
+            stats_history.record(
+                {
+                    "total_tickets": 10,
+                    "open_tickets": open_tickets,
+                    "closed_tickets": 10 - open_tickets,
+                    "priority_breakdown": {"low": 10, "medium": 0, "high": 0},
+                },
+                timestamp=now - age,
+            )
+
+        data = client.get("/tickets/stats/history?window=15m").json()
+        assert data["window_seconds"] == 900
+        assert [s["open_tickets"] for s in data["snapshots"]] == [5, 4]
+        assert data["trend"] == {
+            "total_tickets": 0,
+            "open_tickets": -1,
+            "closed_tickets": 1,
+        }
+
+        data = client.get("/tickets/stats/history").json()
+        assert len(data["snapshots"]) == 3
+        assert "window_seconds" not in data
+
+        assert client.get("/tickets/stats/history?window=1w").status_code == 422
+
+    @patch("src.api.tickets.settings.change_feed_interval", 0)
+    def test_changes_disabled(self, client):
+        """Test da isključen feed odbija pretplatu umjesto vječnog čekanja"""
+        response = client.get("/tickets/changes")
+        assert response.status_code == 503
+        assert "CHANGE_FEED_INTERVAL" in response.json()["detail"]
+
+    @patch("src.api.tickets.settings.change_feed_interval", 30)
+    def test_changes_resume_from_offset(self, client):
+        """Test feeda promjena: nastavak od offseta i preko Last-Event-ID"""
+        from src.services.change_feed import change_feed
+
+        change_feed.publish(
+            [
+                ("updated", 1, TicketRecord(1, "a", "closed", "high", "hk")),
+                ("created", 2, TicketRecord(2, "b", "open", "low", "hk")),
+            ]
+        )
+
+        response = client.get("/tickets/changes?since=0&follow=false")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        blocks = response.text.strip().split("\n\n")
+        assert [block.split("\n")[:2] for block in blocks] == [
+            ["event: updated", "id: 1"],
+            ["event: created", "id: 2"],
+        ]
+        first = json.loads(blocks[0].split("data: ", 1)[1])
+        assert first["ticket"] == {
+            "id": 1,
+            "title": "a",
+            "status": "closed",
+            "priority": "high",
+        }
+
+        response = client.get(
+            "/tickets/changes?follow=false", headers={"Last-Event-ID": "1"}
+        )
+        assert response.text.startswith("event: created\nid: 2\n")
+
+        response = client.get(
+            "/tickets/changes?follow=false", headers={"Last-Event-ID": "x"}
+        )
+        assert response.status_code == 400
 
     def test_get_tickets_with_pagination(self, client):
         """Test paginacije"""
@@ -141,7 +539,7 @@ class TestTicketEndpoints:
         response = client.get("/tickets/search")
         assert response.status_code == 422  # Validation error
 
-    @patch("src.services.external_api.dummy_json_service.get_todo_by_id")
+    @patch("src.services.external_api.dummy_json_service.get_todo_raw")
     @patch(
         "src.services.external_api.ticket_transform_service.transform_todo_to_ticket"
     )
@@ -154,15 +552,13 @@ class TestTicketEndpoints:
             "completed": False,
             "userId": 26,
         }
-        mock_get_todo.return_value = todo_data
-        mock_transform.return_value = {
-            "id": 1,
-            "title": "Do something nice for someone I care about",
-            "status": "open",
-            "priority": "medium",
-            "assignee": "hkmiles",
-            "source_data": todo_data,
-        }
+        mock_get_todo.return_value = json.dumps(todo_data).encode()
+        mock_transform.return_value = TicketRecord.from_todo(
+            todo_data,
+            status=StatusEnum.OPEN,
+            priority=PriorityEnum.MEDIUM,
+            assignee="hkmiles",
+        )
 
         response = client.get("/tickets/1")
         assert response.status_code == 200
@@ -173,6 +569,49 @@ class TestTicketEndpoints:
         assert data["status"] == "open"
         assert "source_data" in data
 
+    @patch("src.services.external_api.dummy_json_service.get_user_by_id")
+    @patch("src.services.external_api.dummy_json_service.get_todo_raw")
+    def test_get_ticket_by_id_sparse_fields(self, mock_get_todo, mock_get_user, client):
+        """Test da fields bez assigneeja preskače dohvat korisnika"""
+        mock_get_todo.return_value = (
+            b'{"id":7,"todo":"Sparse ticket","completed":true,"userId":12345}'
+        )
+
+        response = client.get("/tickets/7?fields=title,id")
+        assert response.status_code == 200
+        assert response.json() == {"id": 7, "title": "Sparse ticket"}
+        mock_get_user.assert_not_called()
+
+    @patch("src.services.external_api.dummy_json_service.get_todo_raw")
+    @patch("src.services.external_api.ticket_transform_service._get_user_cached")
+    def test_get_ticket_by_id_splices_raw_source(
+        self, mock_get_user, mock_get_todo, client, mock_user_response
+    ):
+        """Test da se izvorni upstream JSON umeće u source_data bez promjene"""
+        raw = (
+            b'{"id": 3, "todo": "Raw \\u010d ticket", "completed": false,'
+            b' "userId": 26, "tags": ["a"]}'
+        )
+        mock_get_todo.return_value = raw
+        mock_get_user.return_value = UserBase(**mock_user_response)
+
+        response = client.get("/tickets/3")
+        assert response.status_code == 200
+        assert raw in response.content
+        assert response.json() == {
+            "title": "Raw č ticket",
+            "status": "open",
+            "priority": "low",
+            "assignee": "hkmiles",
+            "id": 3,
+            "source_data": json.loads(raw),
+            "created_at": None,
+            "updated_at": None,
+        }
+
+        response = client.get("/tickets/3?fields=source_data,id")
+        assert response.content == b'{"id":3,"source_data":' + raw + b"}"
+
     def test_get_ticket_by_id_not_found(self, client):
         """Test dohvaćanja nepostojećeg ticketa"""
         response = client.get("/tickets/99999")
@@ -198,6 +637,44 @@ class TestValidation:
         response = client.get("/tickets/?page=1&per_page=101")
         assert response.status_code == 422
 
+    def test_invalid_facets_parameter(self, client):
+        """Test nepodržanog facet polja"""
+        response = client.get("/tickets/?facets=status,title")
+        assert response.status_code == 422
+
+    def test_invalid_filter_expression(self, client):
+        """Test neispravnog filter izraza"""
+        response = client.get("/tickets/?filter=status:open AND (")
+        assert response.status_code == 422
+        assert response.json()["detail"] == (
+            "Invalid filter: Expected a field:value condition"
+        )
+
+    def test_invalid_export_parameters(self, client):
+        """Test nepodržanog formata i neispravnog filtera za export"""
+        assert client.get("/tickets/export?format=xml").status_code == 422
+        assert client.get("/tickets/export?filter=status:").status_code == 422
+
+    def test_invalid_fields_parameter(self, client):
+        """Test nepoznatog polja u fields parametru"""
+        assert client.get("/tickets/?fields=id,assignee").status_code == 422
+        assert client.get("/tickets/1?fields=id,bogus").status_code == 422
+
+    def test_invalid_batch_request(self, client):
+        """Test praznog i prevelikog batch zahtjeva"""
+        assert client.post("/tickets/batch", json={"ids": []}).status_code == 422
+        ids = list(range(1, 1000))
+        assert client.post("/tickets/batch", json={"ids": ids}).status_code == 422
+
+    def test_invalid_group_by_parameter(self, client):
+        """Test nepodržanog polja grupiranja"""
+        assert client.get("/tickets/stats?group_by=title").status_code == 422
+
+    def test_invalid_sort_parameter(self, client):
+        """Test nepodržanog polja za sortiranje"""
+        response = client.get("/tickets/?sort=created_at")
+        assert response.status_code == 422
+
     def test_invalid_search_query(self, client):
         """Test neispravnog search query-ja"""
         # Prazan query
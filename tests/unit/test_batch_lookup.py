@@ -0,0 +1,101 @@
+"""
+Unit testovi za batch dohvat ticketa
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import HTTPException
+from src.models.record import TicketRecord
+from src.services.batch_lookup import BatchLookup
+from src.services.external_api import TicketTransformService
+from src.services.ticket_store import TicketStore
+
+
+class FakeApi:
+    """Upstream koji broji istovremene pozive; ID-evi > 100 ne postoje"""
+
+    def __init__(self):
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+
+    async def get_todo_by_id(self, todo_id):
+        self.calls.append(todo_id)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.001)
+        self.active -= 1
+        if todo_id > 100:
+            raise HTTPException(status_code=404, detail="not found")
+        return {
+            "id": todo_id,
+            "todo": f"Todo {todo_id}",
+            "completed": False,
+            "userId": todo_id % 2 + 1,
+        }
+
+
+@pytest.fixture
+def transform_service():
+    service = TicketTransformService()
+    service.dummy_json_service.get_user_by_id = AsyncMock(
+        side_effect=lambda user_id: {
+            "id": user_id,
+            "username": f"user{user_id}",
+            "firstName": "A",
+            "lastName": "B",
+            "email": "a@b.c",
+        }
+    )
+    return service
+
+
+@pytest.fixture
+def store():
+    ticket_store = TicketStore(transform_service=None, ttl=60)
+    ticket_store.load([TicketRecord(1, "Stored", "open", "medium", "emilys")])
+    return ticket_store
+
+
+class TestBatchLookup:
+    """Test klasa za deduplikaciju, store pogotke i ograničen fan-out"""
+
+    @pytest.mark.asyncio
+    async def test_store_hits_and_upstream_misses(self, store, transform_service):
+        api = FakeApi()
+        lookup = BatchLookup(store, api, transform_service)
+
+        tickets, not_found = await lookup.lookup([5, 1, 5, 101, 2, 1], concurrency=4)
+
+        assert list(tickets) == [5, 1, 2]
+        assert tickets[1].title == "Stored"
+        assert tickets[2].assignee == "user1"
+        assert not_found == [101]
+        assert sorted(api.calls) == [2, 5, 101]
+
+    @pytest.mark.asyncio
+    async def test_fan_out_is_bounded(self, store, transform_service):
+        api = FakeApi()
+        lookup = BatchLookup(store, api, transform_service)
+
+        await lookup.lookup(list(range(2, 40)), concurrency=3)
+        assert api.max_active <= 3
+
+    @pytest.mark.asyncio
+    async def test_assignees_resolved_once_per_user(self, store, transform_service):
+        lookup = BatchLookup(store, FakeApi(), transform_service)
+
+        await lookup.lookup(list(range(2, 30)), concurrency=10)
+        user_calls = transform_service.dummy_json_service.get_user_by_id
+        assert sorted(call.args[0] for call in user_calls.call_args_list) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_upstream_errors_propagate(self, store, transform_service):
+        api = FakeApi()
+        api.get_todo_by_id = AsyncMock(side_effect=HTTPException(status_code=503))
+        lookup = BatchLookup(store, api, transform_service)
+
+        with pytest.raises(HTTPException):
+            await lookup.lookup([7], concurrency=2)
@@ -0,0 +1,101 @@
+"""
+Unit testovi za feed promjena ticketa
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from src.models.record import TicketRecord
+from src.services.change_feed import ChangeFeed, sync_store
+
+
+def ticket(ticket_id, status="open"):
+    return TicketRecord(ticket_id, f"Ticket {ticket_id}", status, "low", "hk")
+
+
+CHANGES = [
+    ("updated", 2, ticket(2, status="closed")),
+    ("created", 4, ticket(4)),
+    ("deleted", 3, None),
+]
+
+
+class TestChangeFeed:
+    """Test klasa za offsete, nastavak i čekanje na događaje"""
+
+    def test_offsets_and_resume(self):
+        feed = ChangeFeed(capacity=10)
+        feed.publish(CHANGES)
+
+        events = feed.events_since(0)
+        assert [event["offset"] for event in events] == [1, 2, 3]
+        assert events[0]["ticket"]["status"] == "closed"
+        assert events[2]["ticket"] is None
+        assert feed.events_since(2) == events[2:]
+        assert feed.events_since(3) == []
+
+    def test_offset_older_than_buffer_needs_reset(self):
+        feed = ChangeFeed(capacity=2)
+        feed.publish(CHANGES)
+
+        assert feed.events_since(0) is None
+        assert [event["offset"] for event in feed.events_since(1)] == [2, 3]
+
+    def test_offset_from_future_needs_reset(self):
+        feed = ChangeFeed(capacity=10)
+        feed.publish(CHANGES)
+
+        # Last-Event-ID iz prethodnog procesa, prije restarta
+        assert feed.events_since(40) is None
+
+    @pytest.mark.asyncio
+    async def test_subscribe_resets_future_offset(self):
+        feed = ChangeFeed(capacity=10)
+        feed.publish(CHANGES)
+
+        events = [event async for event in feed.subscribe(40, follow=False)]
+        assert events == [{"type": "reset", "offset": 3}]
+
+    @pytest.mark.asyncio
+    async def test_subscribe_resets_then_catches_up(self):
+        feed = ChangeFeed(capacity=2)
+        feed.publish(CHANGES)
+
+        events = [event async for event in feed.subscribe(0, follow=False)]
+        assert events == [{"type": "reset", "offset": 3}]
+
+    @pytest.mark.asyncio
+    async def test_follow_waits_for_new_events(self):
+        feed = ChangeFeed(capacity=10)
+        stream = feed.subscribe(None, keepalive=5)
+
+        pending = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+        assert not pending.done()
+        assert feed.subscribers == 1
+
+        feed.publish(CHANGES)
+        event = await asyncio.wait_for(pending, 1)
+        assert (event["offset"], event["type"], event["id"]) == (1, "updated", 2)
+        await stream.aclose()
+        assert feed.subscribers == 0
+
+    @pytest.mark.asyncio
+    async def test_keepalive_when_idle(self):
+        feed = ChangeFeed(capacity=10)
+        stream = feed.subscribe(None, keepalive=0.001)
+        assert await stream.__anext__() is None
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    @patch("src.services.change_feed.store_sync.run", new_callable=AsyncMock)
+    async def test_sync_store_publishes_changes(self, mock_run):
+        from src.services.change_feed import change_feed
+
+        mock_run.side_effect = [[], CHANGES]
+
+        assert await sync_store() == 0
+        assert change_feed.offset == 0
+        assert await sync_store() == 3
+        assert change_feed.offset == 3
@@ -0,0 +1,129 @@
+"""
+Unit testovi za middleware kompresije odgovora
+"""
+
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.middleware.compression import (
+    CompressionMiddleware,
+    available_codecs,
+    choose_encoding,
+)
+
+BIG_BODY = b'{"items":[' + b",".join([b'{"id":1,"title":"x"}'] * 200) + b"]}"
+
+
+@pytest.fixture
+def middleware_app():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500, level=6)
+
+    @app.get("/big")
+    async def big():
+        return Response(content=BIG_BODY, media_type="application/json")
+
+    @app.get("/small")
+    async def small():
+        return Response(content=b'{"ok":true}', media_type="application/json")
+
+    @app.get("/png")
+    async def png():
+        return Response(content=b"\x89PNG" * 500, media_type="image/png")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(3):
+                yield b"line of text\n" * 20
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/events")
+    async def events():
+        return PlainTextResponse("data: x\n\n" * 200, media_type="text/event-stream")
+
+    return app
+
+
+@pytest.fixture
+def client(middleware_app):
+    return TestClient(middleware_app)
+
+
+def get_raw(client, path, accept_encoding):
+    """Dohvati odgovor bez automatskog dekodiranja tijela"""
+    with client.stream(
+        "GET", path, headers={"Accept-Encoding": accept_encoding}
+    ) as response:
+        return response, b"".join(response.iter_raw())
+
+
+class TestChooseEncoding:
+    """Test klasa za pregovaranje kodeka"""
+
+    def test_prefers_best_available_on_tie(self):
+        codecs = available_codecs()
+        assert choose_encoding("gzip, br, zstd", codecs) == next(iter(codecs))
+
+    def test_respects_q_values(self):
+        codecs = available_codecs()
+        assert choose_encoding("zstd;q=0.1, br;q=0.2, gzip;q=0.9", codecs) == "gzip"
+
+    def test_identity_and_q_zero(self):
+        codecs = available_codecs()
+        assert choose_encoding("identity", codecs) is None
+        assert choose_encoding("gzip;q=0", codecs) is None
+        assert choose_encoding("", codecs) is None
+
+    def test_wildcard(self):
+        codecs = {"gzip": available_codecs()["gzip"]}
+        assert choose_encoding("*", codecs) == "gzip"
+
+
+class TestCompressionMiddleware:
+    """Test klasa za kompresiju odgovora"""
+
+    def test_gzip_response(self, client):
+        response, raw = get_raw(client, "/big", "gzip")
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) == len(raw) < len(BIG_BODY)
+        assert gzip.decompress(raw) == BIG_BODY
+
+    def test_brotli_response(self, client):
+        brotli = pytest.importorskip("brotli")
+        response, raw = get_raw(client, "/big", "br")
+        assert response.headers["content-encoding"] == "br"
+        assert brotli.decompress(raw) == BIG_BODY
+
+    def test_zstd_response(self, client):
+        zstandard = pytest.importorskip("zstandard")
+        response, raw = get_raw(client, "/big", "zstd")
+        assert response.headers["content-encoding"] == "zstd"
+        assert zstandard.ZstdDecompressor().decompressobj().decompress(raw) == BIG_BODY
+
+    def test_small_response_is_not_compressed(self, client):
+        response, raw = get_raw(client, "/small", "gzip")
+        assert "content-encoding" not in response.headers
+        assert raw == b'{"ok":true}'
+
+    def test_binary_and_sse_are_not_compressed(self, client):
+        for path in ("/png", "/events"):
+            response, _ = get_raw(client, path, "gzip")
+            assert "content-encoding" not in response.headers
+
+    def test_no_accept_encoding(self, client):
+        response, raw = get_raw(client, "/big", "identity")
+        assert "content-encoding" not in response.headers
+        assert raw == BIG_BODY
+
+    def test_streaming_response(self, client):
+        response, raw = get_raw(client, "/stream", "gzip")
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert gzip.decompress(raw) == b"line of text\n" * 60
@@ -0,0 +1,147 @@
+"""
+Unit testovi za snapshot cacheova na disku
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from src.models.record import TicketRecord
+from src.models.ticket import UserBase
+from src.services.disk_snapshot import DiskSnapshot, decode_snapshot, encode_snapshot
+from src.services.external_api import TicketTransformService
+from src.services.store_sync import StoreSync
+from src.services.ticket_store import TicketStore
+
+USERS = [UserBase(id=1, username="hk", firstName="H", lastName="K", email="h@k.hr")]
+TICKETS = [
+    TicketRecord.from_todo(
+        {"id": 1, "todo": "Prvi", "completed": False, "userId": 1},
+        "open",
+        "medium",
+        "hk",
+    ),
+    TicketRecord.from_todo(
+        {"id": 2, "todo": "Drugi", "completed": True, "userId": 1, "tag": "x"},
+        "closed",
+        "high",
+        "hk",
+    ),
+]
+
+
+def make_snapshot(path):
+    service = TicketTransformService()
+    store = TicketStore(service)
+    sync = StoreSync(store, chunk_size=10)
+    return DiskSnapshot(str(path), store, service, sync)
+
+
+class TestEncoding:
+    """Test klasa za binarni format snapshota"""
+
+    def test_roundtrip(self):
+        data = encode_snapshot(USERS, TICKETS, created_at=123.5)
+        created_at, users, tickets = decode_snapshot(memoryview(data))
+
+        assert created_at == 123.5
+        assert users == USERS
+        assert tickets == TICKETS
+        assert tickets[1].source_data() == TICKETS[1].source_data()
+
+    def test_rejects_foreign_and_truncated_data(self):
+        data = encode_snapshot(USERS, TICKETS, created_at=0)
+        with pytest.raises(ValueError):
+            decode_snapshot(memoryview(b"not a snapshot at all"))
+        with pytest.raises(ValueError):
+            decode_snapshot(memoryview(data[:-5]))
+
+
+class TestDiskSnapshot:
+    """Test klasa za zapis i učitavanje snapshota"""
+
+    def test_save_and_restore_into_fresh_process(self, tmp_path):
+        path = tmp_path / "cache.snapshot"
+        source = make_snapshot(path)
+        source.transform_service.cache_users(USERS)
+        source.store.load(TICKETS)
+        assert source.save()
+
+        restored = make_snapshot(path)
+        assert restored.restore()
+        assert restored.transform_service.cached_users() == USERS
+        assert restored.store.snapshot() == TICKETS
+        assert restored.store.is_fresh
+        assert restored.store.stats()["open_tickets"] == 1
+
+    def test_old_snapshot_restores_stale_store(self, tmp_path):
+        path = tmp_path / "cache.snapshot"
+        path.write_bytes(encode_snapshot(USERS, TICKETS, time.time() - 3600))
+
+        restored = make_snapshot(path)
+        assert restored.restore()
+        assert len(restored.store) == 2
+        assert not restored.store.is_fresh
+
+    @pytest.mark.asyncio
+    async def test_first_sync_after_restore_is_incremental(self, tmp_path):
+        path = tmp_path / "cache.snapshot"
+        path.write_bytes(encode_snapshot(USERS, TICKETS, time.time()))
+        restored = make_snapshot(path)
+        restored.restore()
+
+        # Korisnici dolaze iz snapshota, pa se ni jedan ne dohvaća
+        service = restored.transform_service
+        service.transform_todos_to_tickets = AsyncMock(return_value=[])
+        service.dummy_json_service.get_user_by_id = AsyncMock()
+        restored.store.fetch_all_todos = AsyncMock(
+            return_value=[ticket.source_data() for ticket in TICKETS]
+        )
+
+        assert await restored.sync.run() == []
+        service.transform_todos_to_tickets.assert_not_awaited()
+        service.dummy_json_service.get_user_by_id.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_periodic_write_runs_off_the_event_loop(self, tmp_path):
+        path = tmp_path / "cache.snapshot"
+        snapshot = make_snapshot(path)
+        snapshot.store.load(TICKETS)
+        loop = asyncio.get_running_loop()
+        written = asyncio.Event()
+        loop_thread = threading.get_ident()
+        threads = []
+        write = snapshot.write
+
+        def tracked_write(data):
+            threads.append(threading.get_ident())
+            result = write(data)
+            loop.call_soon_threadsafe(written.set)
+            return result
+
+        with patch.object(snapshot, "write", side_effect=tracked_write):
+            snapshot.start(0.01)
+            await asyncio.wait_for(written.wait(), timeout=5)
+            await snapshot.stop()
+
+        assert threads[0] != loop_thread
+        # Završni zapis pri gašenju je sinkron, u petlji
+        assert threads[-1] == loop_thread
+        assert make_snapshot(path).restore()
+
+    def test_missing_corrupt_or_disabled(self, tmp_path):
+        assert not make_snapshot(tmp_path / "missing").restore()
+
+        corrupt = tmp_path / "corrupt"
+        corrupt.write_bytes(b"THSNAP\x00\x01garbage")
+        assert not make_snapshot(corrupt).restore()
+
+        empty = tmp_path / "empty"
+        empty.write_bytes(b"")
+        assert not make_snapshot(empty).restore()
+
+        unloaded = make_snapshot(tmp_path / "unloaded")
+        assert not unloaded.save()
+        assert not (tmp_path / "unloaded").exists()
@@ -0,0 +1,186 @@
+"""
+Unit testovi za streaming export ticketa
+"""
+
+import asyncio
+import csv
+import io
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from src.models.record import TicketRecord
+from src.models.ticket import TicketFilters
+from src.services.export import (
+    encode_csv,
+    encode_ndjson,
+    prefetch_first,
+    store_batches,
+    stream_export,
+    upstream_batches,
+)
+from src.services.ticket_store import TicketStore
+
+
+def make_ticket(ticket_id, status="open", priority="low"):
+    return TicketRecord(ticket_id, f'Ticket, "{ticket_id}"', status, priority, "hk")
+
+
+def todos_page(skip, limit, total):
+    return {
+        "todos": [
+            {"id": i, "todo": f"Todo {i}", "completed": False, "userId": 1}
+            for i in range(skip + 1, min(skip + limit, total) + 1)
+        ],
+        "total": total,
+    }
+
+
+async def transform(todos, resolve_assignee=True):
+    return [
+        make_ticket(todo["id"], priority="high" if todo["id"] % 2 else "low")
+        for todo in todos
+    ]
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+class TestEncoders:
+    """Test klasa za NDJSON i CSV encodere"""
+
+    def test_ndjson_one_object_per_line(self):
+        body = encode_ndjson([make_ticket(1), make_ticket(2, "closed", "high")])
+        lines = body.decode().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1]) == {
+            "id": 2,
+            "title": 'Ticket, "2"',
+            "status": "closed",
+            "priority": "high",
+            "assignee": "hk",
+        }
+
+    @pytest.mark.asyncio
+    async def test_csv_has_header_and_quoting(self):
+        async def batches():
+            yield [make_ticket(1)]
+            yield [make_ticket(2)]
+
+        body = b"".join(await collect(stream_export(batches(), "csv")))
+        rows = list(csv.reader(io.StringIO(body.decode())))
+        assert rows[0] == ["id", "title", "status", "priority", "assignee"]
+        assert rows[2] == ["2", 'Ticket, "2"', "open", "low", "hk"]
+        assert encode_csv([]) == b""
+
+
+class TestExportSources:
+    """Test klasa za izvore exporta (store i upstream stranice)"""
+
+    @pytest.mark.asyncio
+    async def test_store_batches_follow_sort_and_filters(self):
+        store = TicketStore(transform_service=None, ttl=60)
+        store.load(
+            [make_ticket(i, priority="high" if i % 2 else "low") for i in range(1, 8)]
+        )
+        filters = TicketFilters(priority="high", sort="-id")
+
+        batches = await collect(store_batches(store, filters, batch_size=3))
+        assert [[t.id for t in batch] for batch in batches] == [[7, 5, 3], [1]]
+
+    @pytest.mark.asyncio
+    @patch(
+        "src.services.export.ticket_transform_service.transform_todos_to_tickets",
+        side_effect=transform,
+    )
+    @patch("src.services.export.dummy_json_service.get_todos", new_callable=AsyncMock)
+    async def test_upstream_batches_walk_all_pages(self, mock_get_todos, _transform):
+        mock_get_todos.side_effect = lambda limit, skip: todos_page(skip, limit, 7)
+        filters = TicketFilters(priority="high")
+
+        batches = await collect(upstream_batches(filters, batch_size=3))
+        assert [[t.id for t in batch] for batch in batches] == [[1, 3], [5], [7]]
+        assert [call.kwargs["skip"] for call in mock_get_todos.call_args_list] == [
+            0,
+            3,
+            6,
+        ]
+
+    @pytest.mark.asyncio
+    @patch(
+        "src.services.export.ticket_transform_service.transform_todos_to_tickets",
+        side_effect=transform,
+    )
+    @patch("src.services.export.dummy_json_service.get_todos", new_callable=AsyncMock)
+    async def test_upstream_batches_prefetch_is_bounded(
+        self, mock_get_todos, _transform
+    ):
+        # Upstream vraća najviše 2 todoa bez obzira na traženi limit
+        mock_get_todos.side_effect = lambda limit, skip: todos_page(skip, 2, 9)
+        batches = upstream_batches(TicketFilters(), batch_size=50, prefetch=2)
+
+        first = await batches.__anext__()
+        await asyncio.sleep(0)
+        assert [t.id for t in first] == [1, 2]
+        # Prva stranica + najviše dvije unaprijed
+        assert mock_get_todos.await_count == 3
+
+        rest = await collect(batches)
+        assert [[t.id for t in batch] for batch in rest] == [
+            [3, 4],
+            [5, 6],
+            [7, 8],
+            [9],
+        ]
+        assert [call.kwargs["skip"] for call in mock_get_todos.call_args_list] == [
+            0,
+            2,
+            4,
+            6,
+            8,
+        ]
+
+    @pytest.mark.asyncio
+    @patch(
+        "src.services.export.ticket_transform_service.transform_todos_to_tickets",
+        side_effect=transform,
+    )
+    @patch("src.services.export.dummy_json_service.get_todos", new_callable=AsyncMock)
+    async def test_upstream_batches_close_awaits_cancelled_prefetch(
+        self, mock_get_todos, _transform
+    ):
+        cancelled = []
+
+        async def get_todos(limit, skip):
+            if skip == 0:
+                return todos_page(skip, 2, 9)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(skip)
+                raise
+
+        mock_get_todos.side_effect = get_todos
+        batches = upstream_batches(TicketFilters(), batch_size=50, prefetch=2)
+        await batches.__anext__()
+        await asyncio.sleep(0)
+
+        # Klijent prekida vezu - dohvati unaprijed su otkazani i dovršeni
+        await batches.aclose()
+        assert sorted(cancelled) == [2, 4]
+
+    @pytest.mark.asyncio
+    @patch(
+        "src.services.export.ticket_transform_service.transform_todos_to_tickets",
+        side_effect=transform,
+    )
+    @patch("src.services.export.dummy_json_service.get_todos", new_callable=AsyncMock)
+    async def test_prefetch_first_fetches_before_streaming(
+        self, mock_get_todos, _transform
+    ):
+        mock_get_todos.side_effect = lambda limit, skip: todos_page(skip, limit, 2)
+
+        batches = await prefetch_first(upstream_batches(TicketFilters(), 10))
+        mock_get_todos.assert_awaited_once()
+        assert [[t.id for t in batch] for batch in await collect(batches)] == [[1, 2]]
@@ -0,0 +1,70 @@
+"""
+Unit testovi za razrješavanje korisnika u TicketTransformService
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+from src.services.external_api import TicketTransformService
+
+
+def user(user_id):
+    return {
+        "id": user_id,
+        "username": f"user{user_id}",
+        "firstName": "A",
+        "lastName": "B",
+        "email": "a@b.c",
+    }
+
+
+@pytest.fixture
+def service():
+    service = TicketTransformService()
+    service.dummy_json_service.get_user_by_id = AsyncMock(side_effect=user)
+    service.dummy_json_service.get_users = AsyncMock(
+        return_value={"users": [user(i) for i in range(1, 31)]}
+    )
+    return service
+
+
+class TestResolveUsers:
+    """Test klasa za dohvat assigneeja pri transformaciji"""
+
+    @pytest.mark.asyncio
+    async def test_few_missing_users_are_fetched_individually(self, service):
+        users = await service.resolve_users([1, 2, 2])
+
+        assert sorted(users) == [1, 2]
+        assert service.dummy_json_service.get_user_by_id.await_count == 2
+        service.dummy_json_service.get_users.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_many_missing_users_are_preloaded_in_one_call(self, service):
+        users = await service.resolve_users(range(1, 26))
+
+        assert users[25].username == "user25"
+        service.dummy_json_service.get_users.assert_awaited_once_with(limit=0)
+        service.dummy_json_service.get_user_by_id.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @patch("src.services.external_api.settings.batch_concurrency", 3)
+    async def test_fallback_fetches_are_bounded(self, service):
+        service.dummy_json_service.get_users.side_effect = HTTPException(503)
+        inflight = peak = 0
+
+        async def get_user(user_id):
+            nonlocal inflight, peak
+            inflight += 1
+            peak = max(peak, inflight)
+            await asyncio.sleep(0)
+            inflight -= 1
+            return user(user_id)
+
+        service.dummy_json_service.get_user_by_id.side_effect = get_user
+        users = await service.resolve_users(range(1, 21))
+
+        assert len(users) == 20
+        assert peak == 3
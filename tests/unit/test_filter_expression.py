@@ -0,0 +1,118 @@
+"""
+Unit testovi za jezik filter izraza
+"""
+
+import pytest
+from src.models.record import TicketRecord
+from src.models.ticket import TicketFilters
+from src.services import bitmap
+from src.services.filter_expression import (
+    MAX_DEPTH,
+    MAX_TERMS,
+    FilterExpressionError,
+    compile_filter,
+)
+from src.services.ticket_store import TicketStore
+
+TICKETS = [
+    (1, "Fix login page", "open", "medium", "emilys"),
+    (2, "Write docs", "open", "high", "michaelw"),
+    (3, "Fix logout", "closed", "low", "emilys"),
+    (4, "Review PR", "closed", "medium", "oliviaw"),
+    (5, "Deploy release", "open", "high", "emilys"),
+]
+
+
+@pytest.fixture
+def store():
+    ticket_store = TicketStore(transform_service=None, ttl=60)
+    ticket_store.load([TicketRecord(*ticket) for ticket in TICKETS])
+    return ticket_store
+
+
+def matching_ids(store, expression):
+    mask = compile_filter(expression)(store)
+    return [TICKETS[position][0] for position in bitmap.iter_positions(mask)]
+
+
+class TestFilterEvaluation:
+    """Test klasa za evaluaciju izraza nad bitmap indeksima"""
+
+    def test_single_term(self, store):
+        assert matching_ids(store, "status:closed") == [3, 4]
+
+    def test_and_or_with_parentheses(self, store):
+        expression = "(status:open AND priority:high) OR assignee:oliviaw"
+        assert matching_ids(store, expression) == [2, 4, 5]
+
+    def test_and_binds_tighter_than_or(self, store):
+        expression = "priority:low OR status:open AND assignee:michaelw"
+        assert matching_ids(store, expression) == [2, 3]
+
+    def test_not(self, store):
+        assert matching_ids(store, "NOT assignee:emilys") == [2, 4]
+
+    def test_keywords_are_case_insensitive(self, store):
+        assert matching_ids(store, "status:OPEN and not priority:high") == [1]
+
+    def test_quoted_title_substring(self, store):
+        assert matching_ids(store, 'title:"fix log"') == [1, 3]
+
+    def test_id_range(self, store):
+        assert matching_ids(store, "id:2..4 AND NOT id:3") == [2, 4]
+        assert matching_ids(store, "id:10..20") == []
+
+    def test_unknown_assignee_matches_nothing(self, store):
+        assert matching_ids(store, "assignee:nobody") == []
+
+    def test_combined_with_query_filters(self, store):
+        filters = TicketFilters(
+            priority="high", filter_expression="assignee:emilys", sort="-id"
+        )
+        tickets, total = store.query(filters)
+        assert [ticket.id for ticket in tickets] == [5]
+        assert total == 1
+
+
+class TestFilterCompilation:
+    """Test klasa za parsiranje, cache i granice složenosti"""
+
+    def test_compiled_filter_is_cached_by_string(self):
+        assert compile_filter("status:open") is compile_filter("status:open")
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "",
+            "status",
+            "status:maybe",
+            "color:red",
+            "status:open AND",
+            "(status:open",
+            "status:open)",
+            "status:open XOR priority:low",
+            "id:abc",
+        ],
+    )
+    def test_invalid_expressions(self, expression):
+        with pytest.raises(FilterExpressionError):
+            compile_filter(expression)
+
+    @pytest.mark.parametrize("expression", ["status:", 'title:""', "status: AND id:1"])
+    def test_empty_value(self, expression):
+        with pytest.raises(FilterExpressionError, match="Empty value for field"):
+            compile_filter(expression)
+
+    def test_too_many_terms(self):
+        expression = " OR ".join(["status:open"] * (MAX_TERMS + 1))
+        with pytest.raises(FilterExpressionError, match="Too many conditions"):
+            compile_filter(expression)
+
+    def test_too_deep(self):
+        expression = "(" * MAX_DEPTH + "status:open" + ")" * MAX_DEPTH
+        with pytest.raises(FilterExpressionError, match="nested too deeply"):
+            compile_filter(expression)
+
+    def test_too_long(self):
+        with pytest.raises(FilterExpressionError, match="too long"):
+            compile_filter("title:" + "a" * 600)
@@ -0,0 +1,53 @@
+"""
+Unit testovi za pregovaranje formata odgovora
+"""
+
+import pytest
+from src.api.formats import (
+    BINARY_ENCODERS,
+    CBOR_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    choose_format,
+    encoded_response,
+)
+
+msgpack = pytest.importorskip("msgpack")
+
+
+class TestChooseFormat:
+    """Test klasa za izbor formata iz Accept headera"""
+
+    @pytest.mark.parametrize(
+        "accept",
+        ["", "*/*", "application/json", "application/json, application/msgpack"],
+    )
+    def test_json_is_default(self, accept):
+        assert choose_format(accept) is None
+
+    def test_explicit_msgpack(self):
+        assert choose_format("application/msgpack") == MSGPACK_MEDIA_TYPE
+        assert choose_format("application/x-msgpack") == "application/x-msgpack"
+
+    def test_q_values(self):
+        accept = "application/json;q=0.5, application/msgpack"
+        assert choose_format(accept) == MSGPACK_MEDIA_TYPE
+        accept = "application/msgpack;q=0.2, */*;q=0.8"
+        assert choose_format(accept) is None
+
+    def test_cbor(self):
+        pytest.importorskip("cbor2")
+        assert choose_format("application/cbor") == CBOR_MEDIA_TYPE
+
+    def test_unknown_binary_type_falls_back_to_json(self):
+        assert choose_format("application/protobuf") is None
+
+
+class TestEncodedResponse:
+    """Test klasa za kodiranje odgovora"""
+
+    def test_roundtrip(self):
+        data = {"items": [{"id": 1, "title": "Čćž"}], "total": 1}
+        response = encoded_response(data, MSGPACK_MEDIA_TYPE)
+        assert response.media_type == MSGPACK_MEDIA_TYPE
+        assert msgpack.unpackb(response.body) == data
+        assert MSGPACK_MEDIA_TYPE in BINARY_ENCODERS
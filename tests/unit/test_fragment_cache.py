@@ -0,0 +1,89 @@
+"""
+Unit testovi za cache JSON fragmenata ticketa
+"""
+
+import json
+
+from src.models.record import TicketRecord
+from src.models.ticket import PaginatedResponse, TicketListItem
+from src.services.fragment_cache import FragmentCache, assemble_page
+
+TICKETS = [
+    TicketRecord(1, "Prvi ticket", "open", "medium", "emilys"),
+    TicketRecord(2, "Drugi – ticket " + "x" * 120, "closed", "high", "emilys"),
+]
+
+
+class TestFragmentCache:
+    """Test klasa za cache fragmenata i slaganje stranice"""
+
+    def test_fragments_are_cached_per_content(self):
+        cache = FragmentCache()
+        first = cache.fragments(TICKETS)
+        second = cache.fragments(TICKETS)
+
+        assert first == second
+        assert (cache.hits, cache.misses) == (2, 2)
+
+        # Promjena jednog ticketa ne poništava fragment drugog
+        changed = TicketRecord(1, "Prvi ticket", "closed", "medium", "emilys")
+        third = cache.fragments([changed, TICKETS[1]])
+        assert json.loads(third[0])["status"] == "closed"
+        assert third[1] == first[1]
+        assert (cache.hits, cache.misses) == (3, 3)
+
+    def test_equal_content_shares_fragment(self):
+        cache = FragmentCache()
+        cache.fragments(TICKETS)
+        # Isti ticket bez assigneeja (npr. upstream stranica) - ista stavka liste
+        upstream = TicketRecord(1, "Prvi ticket", "open", "medium", None)
+        cache.fragments([upstream])
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_fragments_are_cached_per_fieldset(self):
+        cache = FragmentCache()
+        full = cache.fragments(TICKETS)
+        sparse = cache.fragments(TICKETS, fields=("id", "status"))
+
+        assert json.loads(sparse[0]) == {"id": 1, "status": "open"}
+        assert full[0] != sparse[0]
+        assert cache.misses == 4
+
+    def test_cache_is_bounded(self):
+        cache = FragmentCache(max_entries=3)
+        cache.fragments(TICKETS)
+        cache.fragments(TICKETS, fields=("id",))
+        assert len(cache) == 3
+
+    def test_assembled_page_matches_pydantic(self):
+        fragments = FragmentCache().fragments(TICKETS)
+        facets = {"status": {"open": 1, "closed": 1}}
+        body = assemble_page(fragments, 2, 1, 30, 1, facets)
+
+        expected = PaginatedResponse(
+            items=[
+                TicketListItem(
+                    id=ticket.id,
+                    title=ticket.title,
+                    status=ticket.status,
+                    priority=ticket.priority,
+                )
+                for ticket in TICKETS
+            ],
+            total=2,
+            page=1,
+            per_page=30,
+            pages=1,
+            facets=facets,
+        )
+        assert body == expected.model_dump_json().encode()
+
+    def test_assembled_page_without_facets(self):
+        body = assemble_page([], 0, 1, 30, 0)
+        assert json.loads(body) == {
+            "items": [],
+            "total": 0,
+            "page": 1,
+            "per_page": 30,
+            "pages": 0,
+        }
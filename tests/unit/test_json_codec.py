@@ -0,0 +1,51 @@
+"""
+Unit testovi za zamjenjivi JSON codec
+"""
+
+import json
+
+import pytest
+from src.services import json_codec
+from src.services.json_codec import CODECS, FastJSONResponse, load_codec
+
+PAYLOAD = {
+    "items": [{"id": 1, "title": 'Čćž – "quoted"', "completed": False}],
+    "total": 1,
+    "facets": {"priority": {"low": 0}},
+    "ratio": 0.5,
+    "missing": None,
+}
+
+
+class TestJsonCodec:
+    """Test klasa za izbor codeca i kompatibilnost izlaza"""
+
+    @pytest.mark.parametrize("name", list(CODECS))
+    def test_codecs_match_stdlib_output(self, name):
+        if name == "orjson":
+            pytest.importorskip("orjson")
+        codec_name, loads, dumps = load_codec(name)
+        assert codec_name == name
+        expected = json.dumps(PAYLOAD, ensure_ascii=False, separators=(",", ":"))
+        assert dumps(PAYLOAD) == expected.encode()
+        assert loads(expected.encode()) == PAYLOAD
+
+    def test_non_string_keys_are_stringified(self):
+        assert json.loads(json_codec.dumps({1: "a"})) == {"1": "a"}
+
+    def test_missing_codec_falls_back_to_stdlib(self, monkeypatch):
+        def unavailable():
+            raise ImportError("orjson")
+
+        monkeypatch.setitem(CODECS, "orjson", unavailable)
+        assert load_codec("orjson")[0] == "json"
+        assert load_codec("auto")[0] == "json"
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError):
+            load_codec("simdjson")
+
+    def test_response_class_uses_codec(self):
+        response = FastJSONResponse(PAYLOAD)
+        assert response.body == json_codec.dumps(PAYLOAD)
+        assert response.media_type == "application/json"
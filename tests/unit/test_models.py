@@ -5,7 +5,6 @@ Generated with AI assistance - GitHub Copilot
 Razlog: Standardni pattern za testiranje pydantic modela
 """
 
-import pytest
 from src.models.ticket import (
     Ticket,
     TicketListItem,
@@ -15,7 +14,10 @@ from src.models.ticket import (
     StatsResponse,
     PriorityEnum,
     StatusEnum,
+    LIST_FIELDS,
+    parse_fields,
 )
+from src.models.record import TicketRecord
 
 
 class TestTicketModels:
@@ -63,6 +65,42 @@ class TestTicketModels:
         assert len(ticket.title) == 100
         assert ticket.title.endswith("...")
 
+    def test_ticket_priority_calculated_from_id(self):
+        """Test da se prioritet računa iz ID-a kad nije postavljen"""
+        ticket = Ticket(
+            id=5, title="Test", status="open", priority=None, assignee="test_user"
+        )
+        assert ticket.priority == PriorityEnum.HIGH
+
+    def test_trusted_list_item_matches_validated(self):
+        """Test da from_trusted daje isti JSON kao validirani konstruktor"""
+        record = TicketRecord(7, "B" * 150, "closed", "medium", "test_user")
+        trusted = TicketListItem.from_trusted(record)
+        validated = TicketListItem(
+            id=7, title="B" * 150, status="closed", priority="medium"
+        )
+
+        assert trusted.model_dump_json() == validated.model_dump_json()
+        assert trusted.status is StatusEnum.CLOSED
+        assert len(trusted.title) == 100
+
+    def test_trusted_list_item_uses_precomputed_title(self):
+        """Test da from_trusted koristi naslov skraćen pri transformaciji"""
+        record = TicketRecord(1, "full title", "open", "low", "u", list_title="short")
+        assert TicketListItem.from_trusted(record).title == "short"
+
+    def test_trusted_ticket_detail(self):
+        """Test TicketDetail.from_trusted s rekonstruiranim source_data"""
+        todo = {"id": 1, "todo": "Test", "completed": False, "userId": 3}
+        record = TicketRecord.from_todo(
+            todo, StatusEnum.OPEN, PriorityEnum.MEDIUM, "test_user"
+        )
+        ticket = TicketDetail.from_trusted(record)
+
+        assert ticket.source_data == todo
+        assert ticket.created_at is None
+        assert ticket.model_dump(mode="json")["priority"] == "medium"
+
     def test_ticket_detail_with_source_data(self):
         """Test TicketDetail modela s source_data"""
         ticket_data = {
@@ -112,6 +150,12 @@ class TestTicketModels:
         assert filters.page == 2
         assert filters.per_page == 50
 
+    def test_parse_fields_is_canonical(self):
+        """Test da isti skup polja uvijek daje isti tuple"""
+        assert parse_fields("title,id,title", LIST_FIELDS) == ("id", "title")
+        assert parse_fields("id,title", LIST_FIELDS) == ("id", "title")
+        assert parse_fields(None, LIST_FIELDS) is None
+
     def test_stats_response(self):
         """Test StatsResponse modela"""
         stats_data = {
@@ -126,3 +170,35 @@ class TestTicketModels:
         assert stats.open_tickets == 75
         assert stats.closed_tickets == 75
         assert stats.priority_breakdown["low"] == 50
+
+
+class TestTicketRecord:
+    """Test klasa za interni TicketRecord"""
+
+    def test_record_has_no_instance_dict(self):
+        """Test da je zapis slotted (bez __dict__ po ticketu)"""
+        record = TicketRecord(1, "Test", "open", "low", "test_user")
+        assert not hasattr(record, "__dict__")
+
+    def test_from_todo_does_not_keep_source_dict(self):
+        """Test da zapis ne drži referencu na izvorni todo dict"""
+        todo = {"id": 2, "todo": "Test", "completed": True, "userId": 5}
+        record = TicketRecord.from_todo(
+            todo, StatusEnum.CLOSED, PriorityEnum.HIGH, "test_user"
+        )
+        assert record.source_data() == todo
+        assert record.source_data() is not todo
+        assert record.extra is None
+
+    def test_unknown_todo_fields_are_preserved(self):
+        """Test da se dodatna polja iz izvora čuvaju u source_data"""
+        todo = {"id": 3, "todo": "Test", "completed": False, "userId": 1, "tag": "x"}
+        record = TicketRecord.from_todo(
+            todo, StatusEnum.OPEN, PriorityEnum.LOW, "test_user"
+        )
+        assert record.source_data() == todo
+
+    def test_list_title_is_shared_when_short(self):
+        """Test da kratki naslov ne alocira drugi string"""
+        record = TicketRecord(1, "Short title", "open", "low", "test_user")
+        assert record.list_title is record.title
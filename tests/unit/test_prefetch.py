@@ -0,0 +1,97 @@
+"""
+Unit testovi za adaptivni dohvat sljedeće stranice unaprijed
+"""
+
+import asyncio
+
+import pytest
+from src.models.ticket import StatusEnum, TicketFilters
+from src.services.cache import TTLCache
+from src.services.metrics import MetricsRegistry
+from src.services.prefetch import PagePrefetcher
+from src.services.query_planner import page_cache_key
+
+
+def make_prefetcher(fetch, max_inflight=4):
+    registry = MetricsRegistry()
+    cache = TTLCache(ttl=60, max_entries=100)
+    return PagePrefetcher(cache, fetch, max_inflight, registry), cache, registry
+
+
+async def fetch_page(filters):
+    return [f"page-{filters.page}"], 100
+
+
+class TestPagePrefetcher:
+    """Test klasa za PagePrefetcher"""
+
+    @pytest.mark.asyncio
+    async def test_prefetches_after_sequential_step(self):
+        prefetcher, cache, registry = make_prefetcher(fetch_page)
+
+        prefetcher.served(TicketFilters(page=1), from_cache=False)
+        await asyncio.sleep(0)
+        assert registry.get("prefetch.started") == 0
+
+        prefetcher.served(TicketFilters(page=2), from_cache=False)
+        await asyncio.sleep(0)
+        assert cache.get(page_cache_key(TicketFilters(page=3))) == (["page-3"], 100)
+
+        prefetcher.served(TicketFilters(page=3), from_cache=True)
+        await asyncio.sleep(0)
+        assert registry.get("prefetch.started") == 2
+        assert registry.get("prefetch.hits") == 1
+        assert prefetcher.hit_rate() == 0.5
+
+    @pytest.mark.asyncio
+    async def test_patterns_are_per_filter_set(self):
+        prefetcher, _, registry = make_prefetcher(fetch_page)
+
+        prefetcher.served(TicketFilters(page=1), from_cache=False)
+        prefetcher.served(TicketFilters(page=2, status=StatusEnum.OPEN), False)
+        prefetcher.served(TicketFilters(page=5, per_page=10), False)
+        assert registry.get("prefetch.started") == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self):
+        release = asyncio.Event()
+
+        async def slow_fetch(filters):
+            await release.wait()
+            return [], 0
+
+        prefetcher, _, registry = make_prefetcher(slow_fetch, max_inflight=1)
+        for status in (StatusEnum.OPEN, StatusEnum.CLOSED):
+            prefetcher.served(TicketFilters(page=1, status=status), False)
+            prefetcher.served(TicketFilters(page=2, status=status), False)
+
+        assert registry.get("prefetch.started") == 1
+        assert registry.get("prefetch.skipped") == 1
+        release.set()
+        await asyncio.sleep(0)
+
+    @pytest.mark.asyncio
+    async def test_request_waits_for_inflight_prefetch(self):
+        prefetcher, cache, registry = make_prefetcher(fetch_page)
+        prefetcher.served(TicketFilters(page=1), False)
+        prefetcher.served(TicketFilters(page=2), False)
+
+        pending = prefetcher.inflight(TicketFilters(page=3))
+        assert await pending == (["page-3"], 100)
+
+        prefetcher.served(TicketFilters(page=3), from_cache=True)
+        assert registry.get("prefetch.hits") == 1
+        assert prefetcher.inflight(TicketFilters(page=3)) is None
+
+    @pytest.mark.asyncio
+    async def test_failed_prefetch_yields_none(self):
+        async def failing_fetch(filters):
+            raise RuntimeError("upstream down")
+
+        prefetcher, cache, registry = make_prefetcher(failing_fetch)
+        prefetcher.served(TicketFilters(page=1), False)
+        prefetcher.served(TicketFilters(page=2), False)
+
+        assert await prefetcher.inflight(TicketFilters(page=3)) is None
+        assert registry.get("prefetch.errors") == 1
+        assert page_cache_key(TicketFilters(page=3)) not in cache
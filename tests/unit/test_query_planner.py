@@ -0,0 +1,138 @@
+"""
+Unit testovi za planer upita i cache stranica
+"""
+
+import time
+
+import pytest
+from src.models.record import TicketRecord
+from src.models.ticket import TicketFilters
+from src.services.cache import TTLCache
+from src.services.query_planner import PlanSource, QueryPlanner, page_cache_key
+from src.services.ticket_store import TicketStore
+
+
+@pytest.fixture
+def store():
+    return TicketStore(transform_service=None, ttl=60)
+
+
+@pytest.fixture
+def loaded_store(store):
+    store.load([TicketRecord(1, "Fix login", "open", "medium", "emilys")])
+    return store
+
+
+@pytest.fixture
+def cache():
+    return TTLCache(ttl=60)
+
+
+class TestTTLCache:
+    """Test klasa za TTL/LRU cache"""
+
+    def test_get_and_set(self, cache):
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_entries_expire(self):
+        cache = TTLCache(ttl=0.01)
+        cache.set("a", 1)
+        time.sleep(0.02)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        cache = TTLCache(ttl=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert "a" in cache
+        assert "b" not in cache
+
+
+class TestQueryPlanner:
+    """Test klasa za izbor izvora podataka"""
+
+    def test_plain_page_goes_upstream_when_store_is_cold(self, store, cache):
+        plan = QueryPlanner(store, cache).plan_list(TicketFilters())
+        assert plan.source is PlanSource.UPSTREAM
+
+    def test_cached_page_beats_upstream(self, store, cache):
+        filters = TicketFilters(page=2)
+        cache.set(page_cache_key(filters), ([], 0))
+        plan = QueryPlanner(store, cache).plan_list(filters)
+        assert plan.source is PlanSource.CACHE
+        assert plan.cached == ([], 0)
+
+    def test_fresh_store_beats_upstream(self, loaded_store, cache):
+        plan = QueryPlanner(loaded_store, cache).plan_list(TicketFilters())
+        assert plan.source is PlanSource.STORE
+        assert plan.reason == "fresh-index"
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            TicketFilters(sort="title"),
+            TicketFilters(status="open"),
+            TicketFilters(search="x", fuzzy=True),
+            TicketFilters(facets=["status"]),
+        ],
+    )
+    def test_index_only_queries_use_store(self, store, cache, filters):
+        plan = QueryPlanner(store, cache).plan_list(filters)
+        assert plan.source is PlanSource.STORE
+        assert plan.reason == "requires-index"
+        # Hladan store znači reload, što je uključeno u cijenu
+        assert plan.cost > 100
+
+    def test_detail_uses_store_only_if_ticket_is_there(self, loaded_store, cache):
+        planner = QueryPlanner(loaded_store, cache)
+        assert planner.plan_detail(1).source is PlanSource.STORE
+        assert planner.plan_detail(2).source is PlanSource.UPSTREAM
+
+    def test_stats_use_fresh_store(self, loaded_store, cache):
+        plan = QueryPlanner(loaded_store, cache).plan_stats()
+        assert plan.source is PlanSource.STORE
+        assert plan.reason == "fresh-index"
+
+    @pytest.mark.parametrize("size", [1, 1000, 100000])
+    @pytest.mark.parametrize("needs_assignee", [False, True])
+    def test_stats_scan_upstream_instead_of_reloading(
+        self, store, cache, size, needs_assignee
+    ):
+        store.load(
+            [TicketRecord(i, "t", "open", "low", "emilys") for i in range(1, size + 1)]
+        )
+        store.loaded_at -= store.ttl
+        plan = QueryPlanner(store, cache).plan_stats(needs_assignee=needs_assignee)
+        assert plan.source is PlanSource.UPSTREAM
+        assert plan.reason == "upstream-scan"
+
+    def test_stats_without_reload_skip_stale_store(self, store, cache):
+        planner = QueryPlanner(store, cache)
+        assert planner.plan_stats(allow_reload=False).source is PlanSource.UPSTREAM
+        store.load([TicketRecord(1, "Fix login", "open", "medium", "emilys")])
+        assert planner.plan_stats(allow_reload=False).source is PlanSource.STORE
+
+    def test_export_streams_upstream_pages_from_cold_store(self, store, cache):
+        planner = QueryPlanner(store, cache)
+        assert planner.plan_export(TicketFilters()).source is PlanSource.UPSTREAM
+        assert planner.plan_export(TicketFilters(sort="-id")).reason == "requires-index"
+
+    def test_export_uses_fresh_store(self, loaded_store, cache):
+        plan = QueryPlanner(loaded_store, cache).plan_export(TicketFilters())
+        assert plan.source is PlanSource.STORE
+
+    def test_page_cache_key_ignores_fields(self):
+        assert page_cache_key(TicketFilters(fields=("id",))) == page_cache_key(
+            TicketFilters()
+        )
+        assert page_cache_key(TicketFilters(page=2)) != page_cache_key(TicketFilters())
+
+    def test_header_value(self, store, cache):
+        plan = QueryPlanner(store, cache).plan_list(TicketFilters())
+        assert plan.header_value().startswith("upstream; cost=")
@@ -0,0 +1,109 @@
+"""
+Unit testovi za single-flight memoizaciju
+"""
+
+import asyncio
+
+import pytest
+from src.services.metrics import MetricsRegistry
+from src.services.single_flight import SingleFlight
+
+
+class Counter:
+    """Izračun koji broji pozive i traje dok se ne otpusti"""
+
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return self.calls
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+class TestSingleFlight:
+    """Test klasa za dijeljenje izračuna, TTL i osvježavanje u pozadini"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_computation(self, registry):
+        compute = Counter()
+        flight = SingleFlight("stats", compute, ttl=60, registry=registry)
+
+        waiters = [asyncio.ensure_future(flight.get()) for _ in range(10)]
+        await asyncio.sleep(0)
+        compute.release.set()
+
+        assert await asyncio.gather(*waiters) == [1] * 10
+        assert compute.calls == 1
+        assert registry.get("stats.shared_callers") == 9
+        assert registry.get("stats.last_flight_callers") == 10
+        assert registry.get("stats.max_flight_callers") == 10
+
+    @pytest.mark.asyncio
+    async def test_value_is_memoized_for_ttl(self, registry):
+        compute = Counter()
+        compute.release.set()
+        flight = SingleFlight("stats", compute, ttl=60, registry=registry)
+
+        assert await flight.get() == 1
+        assert await flight.get() == 1
+        assert registry.get("stats.hits") == 1
+
+        flight.ttl = 0
+        flight.clear()
+        assert await flight.get() == 2
+        assert registry.get("stats.computations") == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_ahead_runs_in_background(self, registry):
+        compute = Counter()
+        compute.release.set()
+        flight = SingleFlight(
+            "stats", compute, ttl=60, refresh_ahead=60, registry=registry
+        )
+
+        assert await flight.get() == 1
+        # U prozoru osvježavanja pogodak odmah vraća staru vrijednost
+        assert await flight.get() == 1
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert compute.calls == 2
+        assert await flight.get() == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_all_waiters_and_is_not_cached(self, registry):
+        compute = Counter(fail=True)
+        flight = SingleFlight("stats", compute, ttl=60, registry=registry)
+
+        waiters = [asyncio.ensure_future(flight.get()) for _ in range(3)]
+        await asyncio.sleep(0)
+        compute.release.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert not flight.is_fresh
+        compute.fail = False
+        assert await flight.get() == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_computation(self, registry):
+        compute = Counter()
+        flight = SingleFlight("stats", compute, ttl=60, registry=registry)
+
+        first = asyncio.ensure_future(flight.get())
+        second = asyncio.ensure_future(flight.get())
+        await asyncio.sleep(0)
+        first.cancel()
+        compute.release.set()
+
+        assert await second == 1
+        assert compute.calls == 1
@@ -0,0 +1,22 @@
+"""
+Unit testovi za kodiranje Server-Sent Events događaja
+"""
+
+from src.services.sse import format_event
+
+
+class TestFormatEvent:
+    """Test klasa za format_event"""
+
+    def test_data_only(self):
+        assert format_event({"a": 1}) == b'data: {"a":1}\n\n'
+
+    def test_event_and_id_precede_data(self):
+        assert format_event([1, 2], event="partial", event_id="7") == (
+            b"event: partial\nid: 7\ndata: [1,2]\n\n"
+        )
+
+    def test_unicode_is_kept_on_one_line(self):
+        body = format_event({"title": "čćž\nnovi red"})
+        assert body.count(b"\n") == 2
+        assert "čćž".encode() in body
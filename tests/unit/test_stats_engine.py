@@ -0,0 +1,120 @@
+"""
+Unit testovi za group-by statistike
+"""
+
+import pytest
+from src.models.record import TicketRecord
+from src.services.stats_engine import SUMMARY_GROUP_BY, GroupByAccumulator
+
+TICKETS = [
+    TicketRecord(1, "a", "open", "high", "emilys"),
+    TicketRecord(2, "b", "open", "low", "emilys"),
+    TicketRecord(3, "c", "closed", "high", "michaelw"),
+    TicketRecord(4, "d", "open", "high", "michaelw"),
+    TicketRecord(5, "e", "open", "medium", "oliviaw"),
+    TicketRecord(6, "f", "closed", "low", "emilys"),
+]
+
+
+async def pages(size):
+    for start in range(0, len(TICKETS), size):
+        yield TICKETS[start : start + size]
+
+
+class TestGroupByAccumulator:
+    """Test klasa za jedan prolaz grupiranja i top-K assigneeja"""
+
+    def test_single_field(self):
+        accumulator = GroupByAccumulator(("status",))
+        accumulator.add(TICKETS)
+        result = accumulator.result()
+
+        assert result["total_tickets"] == 6
+        assert result["groups"] == [
+            {"key": {"status": "open"}, "count": 4},
+            {"key": {"status": "closed"}, "count": 2},
+        ]
+        assert result["top_assignees"] is None
+
+    def test_combined_fields_sorted_by_count_then_key(self):
+        accumulator = GroupByAccumulator(("status", "priority"))
+        accumulator.add(TICKETS)
+        groups = accumulator.groups()
+
+        assert groups[0] == {"key": {"status": "open", "priority": "high"}, "count": 2}
+        assert sum(group["count"] for group in groups) == 6
+        assert [group["key"] for group in groups[1:3]] == [
+            {"status": "closed", "priority": "high"},
+            {"status": "closed", "priority": "low"},
+        ]
+
+    def test_top_assignees_by_open_load(self):
+        accumulator = GroupByAccumulator(("assignee",), top_assignees=2)
+        accumulator.add(TICKETS)
+
+        assert accumulator.top_assignee_loads() == [
+            {"assignee": "emilys", "open_tickets": 2, "total_tickets": 3},
+            {"assignee": "michaelw", "open_tickets": 1, "total_tickets": 2},
+        ]
+        assert accumulator.needs_assignee
+
+    def test_status_only_does_not_need_assignee(self):
+        assert not GroupByAccumulator(("status", "priority")).needs_assignee
+
+    @pytest.mark.asyncio
+    async def test_streamed_batches_match_single_pass(self):
+        single = GroupByAccumulator(("status", "priority", "assignee"), 3)
+        single.add(TICKETS)
+        streamed = GroupByAccumulator(("status", "priority", "assignee"), 3)
+        await streamed.add_batches(pages(4))
+
+        assert streamed.result() == single.result()
+
+    def test_summary_counts_status_and_priority(self):
+        accumulator = GroupByAccumulator(SUMMARY_GROUP_BY)
+        accumulator.add(TICKETS)
+
+        assert accumulator.summary() == {
+            "total_tickets": 6,
+            "open_tickets": 4,
+            "closed_tickets": 2,
+            "priority_breakdown": {"low": 2, "medium": 1, "high": 3},
+        }
+
+    def test_summary_of_empty_input_has_all_priorities(self):
+        assert GroupByAccumulator(SUMMARY_GROUP_BY).summary() == {
+            "total_tickets": 0,
+            "open_tickets": 0,
+            "closed_tickets": 0,
+            "priority_breakdown": {"low": 0, "medium": 0, "high": 0},
+        }
+
+    @pytest.mark.asyncio
+    async def test_summary_is_exact_beyond_single_page_limit(self):
+        async def many_pages():
+            for start in range(0, 2500, 250):
+                yield [
+                    TicketRecord(
+                        i, "t", "closed" if i % 4 == 0 else "open", "low", None
+                    )
+                    for i in range(start + 1, start + 251)
+                ]
+
+        accumulator = GroupByAccumulator(SUMMARY_GROUP_BY)
+        await accumulator.add_batches(many_pages())
+        summary = accumulator.summary()
+
+        assert summary["total_tickets"] == 2500
+        assert summary["closed_tickets"] == 625
+        assert summary["priority_breakdown"]["low"] == 2500
+
+    @pytest.mark.asyncio
+    async def test_summaries_after_each_batch(self):
+        accumulator = GroupByAccumulator(SUMMARY_GROUP_BY)
+        totals = [
+            summary["total_tickets"]
+            async for summary in accumulator.summaries(pages(4))
+        ]
+
+        assert totals == [4, 6]
+        assert accumulator.summary()["open_tickets"] == 4
@@ -0,0 +1,124 @@
+"""
+Unit testovi za povijest statistika (prstenasti buffer)
+"""
+
+import asyncio
+import json
+import os
+
+import pytest
+from src.services.stats_history import StatsHistory, parse_window
+
+
+def stats(open_tickets, total=10):
+    return {
+        "total_tickets": total,
+        "open_tickets": open_tickets,
+        "closed_tickets": total - open_tickets,
+        "priority_breakdown": {"low": total, "medium": 0, "high": 0},
+    }
+
+
+class TestStatsHistory:
+    """Test klasa za StatsHistory"""
+
+    def test_ring_buffer_drops_oldest(self):
+        history = StatsHistory(capacity=3)
+        for i in range(5):
+            history.record(stats(i), timestamp=i)
+
+        assert len(history) == 3
+        assert [s["open_tickets"] for s in history.window()] == [2, 3, 4]
+
+    def test_window_and_trend(self):
+        history = StatsHistory(capacity=10)
+        history.record(stats(8), timestamp=100)
+        history.record(stats(6, total=11), timestamp=150)
+        history.record(stats(3, total=12), timestamp=190)
+
+        recent = history.window(60, now=200)
+        assert [s["timestamp"] for s in recent] == [150, 190]
+        assert StatsHistory.trend(recent) == {
+            "total_tickets": 1,
+            "open_tickets": -3,
+            "closed_tickets": 4,
+        }
+        assert StatsHistory.trend(history.window(5, now=200)) is None
+
+    def test_parse_window_units(self):
+        assert parse_window("90") == 90
+        assert parse_window("15m") == 900
+        assert parse_window("2h") == 7200
+        assert parse_window("1d") == 86400
+        with pytest.raises(ValueError):
+            parse_window("1w")
+
+    def test_persisted_history_survives_restart(self, tmp_path):
+        path = str(tmp_path / "history.json")
+        history = StatsHistory(capacity=5, path=path)
+        history.record(stats(4), timestamp=1)
+        history.record(stats(2), timestamp=2)
+        history.save()
+
+        restored = StatsHistory(capacity=1, path=path)
+        restored.load()
+        assert restored.window() == [{"timestamp": 2, **stats(2)}]
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "history.json"
+        path.write_text("{not json")
+        history = StatsHistory(capacity=5, path=str(path))
+        history.load()
+        assert len(history) == 0
+
+    def test_invalid_entries_are_skipped(self, tmp_path):
+        path = tmp_path / "history.json"
+        path.write_text(
+            json.dumps(
+                [
+                    {"timestamp": 1, **stats(4)},
+                    {"timestamp": "yesterday", **stats(3)},
+                    {"timestamp": 2, "open_tickets": 1},
+                    "garbage",
+                    {"timestamp": 3, **stats(2)},
+                ]
+            )
+        )
+        history = StatsHistory(capacity=5, path=str(path))
+        history.load()
+        assert [s["timestamp"] for s in history.window()] == [1, 3]
+
+    @pytest.mark.asyncio
+    async def test_sampler_persists_history(self, tmp_path):
+        path = str(tmp_path / "history.json")
+        history = StatsHistory(capacity=5, path=path)
+
+        async def sample():
+            return stats(7)
+
+        history.start(sample, interval=0.001)
+        while not os.path.exists(path):
+            await asyncio.sleep(0.001)
+        await history.stop()
+
+        restored = StatsHistory(capacity=5, path=path)
+        restored.load()
+        assert restored.window()[0]["open_tickets"] == 7
+
+    @pytest.mark.asyncio
+    async def test_sampler_records_and_survives_failures(self):
+        history = StatsHistory(capacity=10)
+        calls = []
+
+        async def sample():
+            calls.append(1)
+            if len(calls) == 2:
+                raise RuntimeError("upstream down")
+            return stats(len(calls))
+
+        history.start(sample, interval=0.001)
+        while len(calls) < 4:
+            await asyncio.sleep(0.001)
+        await history.stop()
+
+        assert [s["open_tickets"] for s in history.window()][:2] == [1, 3]
@@ -0,0 +1,165 @@
+"""
+Unit testovi za inkrementalnu sinkronizaciju storea
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.models.record import TicketRecord
+from src.models.ticket import PriorityEnum, StatusEnum
+from src.services.store_sync import StoreSync, chunk_hashes
+from src.services.ticket_store import TicketStore
+
+
+USERNAMES = {1: "hk", 2: "emilys"}
+ASSIGNEES = {1: "hk"}
+
+
+def todo(todo_id, completed=False, text=None, user_id=1):
+    return {
+        "id": todo_id,
+        "todo": text or f"Todo {todo_id}",
+        "completed": completed,
+        "userId": user_id,
+    }
+
+
+async def resolve_users(user_ids):
+    return {uid: SimpleNamespace(username=USERNAMES[uid]) for uid in set(user_ids)}
+
+
+async def transform(todos, resolve_assignee=True):
+    return [
+        TicketRecord.from_todo(
+            t,
+            StatusEnum.CLOSED if t["completed"] else StatusEnum.OPEN,
+            PriorityEnum.LOW,
+            USERNAMES[t["userId"]],
+        )
+        for t in todos
+    ]
+
+
+@pytest.fixture
+def sync():
+    service = MagicMock()
+    service.resolve_users = AsyncMock(side_effect=resolve_users)
+    service.transform_todos_to_tickets = AsyncMock(side_effect=transform)
+    store = TicketStore(service)
+    store.fetch_all_todos = AsyncMock()
+    return StoreSync(store, chunk_size=3)
+
+
+def transformed_ids(sync):
+    call = sync.store.transform_service.transform_todos_to_tickets.call_args
+    return [t["id"] for t in call.args[0]]
+
+
+class TestChunkHashes:
+    """Test klasa za hash po rasponu ID-eva"""
+
+    def test_change_affects_only_its_range(self):
+        before = chunk_hashes([todo(i) for i in range(1, 8)], 3, ASSIGNEES)
+        after = chunk_hashes(
+            [todo(i, completed=i == 5) for i in range(1, 8)], 3, ASSIGNEES
+        )
+
+        assert sorted(before) == [0, 1, 2]
+        assert [key for key in before if before[key] != after[key]] == [1]
+
+    def test_order_of_todos_does_not_matter(self):
+        todos = [todo(i) for i in range(1, 5)]
+        assert chunk_hashes(todos, 2, ASSIGNEES) == chunk_hashes(
+            todos[::-1], 2, ASSIGNEES
+        )
+
+    def test_assignee_rename_changes_range(self):
+        todos = [todo(i) for i in range(1, 5)]
+        before = chunk_hashes(todos, 2, ASSIGNEES)
+        after = chunk_hashes(todos, 2, {1: "hk_renamed"})
+        assert all(before[key] != after[key] for key in before)
+
+
+class TestStoreSync:
+    """Test klasa za StoreSync"""
+
+    @pytest.mark.asyncio
+    async def test_first_run_is_full_baseline(self, sync):
+        sync.store.fetch_all_todos.return_value = [todo(i) for i in range(1, 8)]
+
+        assert await sync.run() == []
+        assert len(sync.store) == 7
+        assert transformed_ids(sync) == list(range(1, 8))
+
+    @pytest.mark.asyncio
+    async def test_only_changed_ranges_are_transformed(self, sync):
+        sync.store.fetch_all_todos.return_value = [todo(i) for i in range(1, 8)]
+        await sync.run()
+        untouched = sync.store.get(1)
+
+        sync.store.fetch_all_todos.return_value = [
+            todo(i, completed=i == 5) for i in range(1, 8) if i != 6
+        ] + [todo(8)]
+        changes = await sync.run()
+
+        assert [(kind, ticket_id) for kind, ticket_id, _ in changes] == [
+            ("updated", 5),
+            ("created", 8),
+            ("deleted", 6),
+        ]
+        assert transformed_ids(sync) == [4, 5, 7, 8]
+        assert sync.store.get(5).status == StatusEnum.CLOSED
+        assert sync.store.get(6) is None
+        assert sync.store.get(1) is untouched
+        assert len(sync.store) == 7
+
+    @pytest.mark.asyncio
+    async def test_unchanged_upstream_keeps_store_version(self, sync):
+        sync.store.fetch_all_todos.return_value = [todo(i) for i in range(1, 8)]
+        await sync.run()
+        version = sync.store.version
+        calls = sync.store.transform_service.transform_todos_to_tickets.await_count
+
+        assert await sync.run() == []
+        assert sync.store.version == version
+        assert sync.store.is_fresh
+        assert (
+            sync.store.transform_service.transform_todos_to_tickets.await_count == calls
+        )
+
+    @pytest.mark.asyncio
+    async def test_user_rename_is_synced(self, sync, monkeypatch):
+        sync.store.fetch_all_todos.return_value = [
+            todo(i, user_id=1 if i < 4 else 2) for i in range(1, 7)
+        ]
+        await sync.run()
+
+        monkeypatch.setitem(USERNAMES, 2, "emily_s")
+        changes = await sync.run()
+
+        assert [(kind, ticket_id) for kind, ticket_id, _ in changes] == [
+            ("updated", 4),
+            ("updated", 5),
+            ("updated", 6),
+        ]
+        assert transformed_ids(sync) == [4, 5, 6]
+        assert sync.store.get(4).assignee == "emily_s"
+
+    @pytest.mark.asyncio
+    async def test_store_loaded_elsewhere_is_diffed_against_last_sync(self, sync):
+        sync.store.fetch_all_todos.return_value = [todo(i) for i in range(1, 4)]
+        await sync.run()
+
+        # Lijeni reload (ensure_fresh) je već učitao novo stanje upstreama
+        sync.store.fetch_all_todos.return_value = [
+            todo(i, completed=i == 2) for i in range(1, 3)
+        ]
+        sync.store.load(await transform(sync.store.fetch_all_todos.return_value))
+        changes = await sync.run()
+
+        assert [(kind, ticket_id) for kind, ticket_id, _ in changes] == [
+            ("updated", 2),
+            ("deleted", 3),
+        ]
+        assert len(sync.store) == 2
@@ -0,0 +1,203 @@
+"""
+Unit testovi za lokalni ticket store
+"""
+
+import random
+
+import pytest
+from src.models.record import TicketRecord
+from src.models.ticket import SORT_FIELDS, TicketFilters
+from src.services import bitmap
+from src.services.ticket_store import INDEXED_FIELDS, TicketStore
+
+
+def make_ticket(ticket_id, title, status, priority, assignee):
+    return TicketRecord(ticket_id, title, status, priority, assignee, user_id=1)
+
+
+@pytest.fixture
+def store():
+    """Store napunjen s nekoliko ticketa (bez vanjskih poziva)"""
+    ticket_store = TicketStore(transform_service=None, ttl=60)
+    ticket_store.load(
+        [
+            make_ticket(3, "Charlie task", "open", "low", "emilys"),
+            make_ticket(1, "alpha task", "closed", "medium", "michaelw"),
+            make_ticket(2, "Bravo task", "open", "high", "emilys"),
+            make_ticket(4, "delta job", "closed", "medium", "oliviaw"),
+            make_ticket(5, "echo task", "open", "high", "michaelw"),
+        ]
+    )
+    return ticket_store
+
+
+def ids(tickets):
+    return [ticket.id for ticket in tickets]
+
+
+class TestBitmap:
+    """Test klasa za bitmap pomoćne funkcije"""
+
+    def test_roundtrip(self):
+        positions = [0, 3, 8, 9, 64, 100]
+        mask = bitmap.from_positions(positions)
+        assert list(bitmap.iter_positions(mask)) == positions
+        assert bitmap.count(mask) == len(positions)
+
+    def test_empty_mask(self):
+        assert list(bitmap.iter_positions(0)) == []
+
+
+class TestTicketStoreSorting:
+    """Test klasa za sortiranje iz precomputed permutacija"""
+
+    def test_default_order_is_by_id(self, store):
+        tickets, total = store.query(TicketFilters())
+        assert ids(tickets) == [1, 2, 3, 4, 5]
+        assert total == 5
+
+    def test_sort_by_title_is_case_insensitive(self, store):
+        tickets, _ = store.query(TicketFilters(sort="title"))
+        assert ids(tickets) == [1, 2, 3, 4, 5]
+
+    def test_sort_by_priority_uses_enum_order(self, store):
+        tickets, _ = store.query(TicketFilters(sort="priority"))
+        assert ids(tickets) == [3, 1, 4, 2, 5]
+
+    def test_descending_keeps_ties_ordered_by_id(self, store):
+        tickets, _ = store.query(TicketFilters(sort="-priority"))
+        assert ids(tickets) == [2, 5, 1, 4, 3]
+
+    def test_sorted_pagination(self, store):
+        tickets, total = store.query(TicketFilters(sort="-id", page=2, per_page=2))
+        assert ids(tickets) == [3, 2]
+        assert total == 5
+
+    def test_sort_with_filters(self, store):
+        filters = TicketFilters(status="open", sort="-assignee", per_page=2)
+        tickets, total = store.query(filters)
+        assert ids(tickets) == [5, 2]
+        assert total == 3
+
+    def test_search_is_substring_match(self, store):
+        tickets, total = store.query(TicketFilters(search="TASK", sort="-title"))
+        assert ids(tickets) == [5, 3, 2, 1]
+        assert total == 4
+
+    def test_fuzzy_search_tolerates_typos(self, store):
+        filters = TicketFilters(search="delat jbo", fuzzy=True, fuzzy_threshold=0.3)
+        tickets, total = store.query(filters)
+        assert ids(tickets) == [4]
+        assert total == 1
+
+    def test_fuzzy_search_respects_filters_and_sort(self, store):
+        filters = TicketFilters(
+            search="taks", fuzzy=True, fuzzy_threshold=0.3, status="open", sort="-id"
+        )
+        tickets, total = store.query(filters)
+        assert ids(tickets) == [5, 3, 2]
+        assert total == 3
+
+    def test_invalid_sort_field(self):
+        with pytest.raises(ValueError):
+            TicketFilters(sort="unknown")
+
+    def test_reload_bumps_version(self, store):
+        version = store.version
+        store.load([make_ticket(1, "only", "open", "low", "emilys")])
+        assert store.version == version + 1
+        assert len(store) == 1
+
+
+class TestTicketStoreFacets:
+    """Test klasa za facet brojeve iz bitmap indeksa"""
+
+    def test_facets_for_all_tickets(self, store):
+        facets = store.facet_counts(TicketFilters(facets=["status", "priority"]))
+        assert facets == {
+            "status": {"open": 3, "closed": 2},
+            "priority": {"low": 1, "medium": 2, "high": 2},
+        }
+
+    def test_facets_follow_current_filters(self, store):
+        filters = TicketFilters(status="open", facets=["priority", "assignee"])
+        facets = store.facet_counts(filters)
+        assert facets["priority"] == {"low": 1, "medium": 0, "high": 2}
+        assert facets["assignee"] == {"emilys": 2, "michaelw": 1}
+
+    def test_facets_with_fuzzy_search(self, store):
+        filters = TicketFilters(
+            search="delat jbo", fuzzy=True, fuzzy_threshold=0.3, facets=["status"]
+        )
+        assert store.facet_counts(filters) == {"status": {"open": 0, "closed": 1}}
+
+
+def store_view(store):
+    """Sve što upiti vide: poredak za svako sortiranje, facete i pretrage"""
+    view = {
+        spec: ids(store.query(TicketFilters(sort=spec, per_page=100))[0])
+        for field in SORT_FIELDS
+        for spec in (field, f"-{field}")
+    }
+    view["facets"] = store.facet_counts(TicketFilters(facets=list(INDEXED_FIELDS)))
+    for query in ("task", "tsak alpah", "job"):
+        filters = TicketFilters(search=query, per_page=100)
+        view[query] = ids(store.query(filters)[0])
+        fuzzy = TicketFilters(search=query, fuzzy=True, per_page=100)
+        view[f"~{query}"] = ids(store.query(fuzzy)[0])
+    view["range"] = list(bitmap.iter_positions(store.id_range_mask(3, 30)))
+    return view
+
+
+class TestTicketStoreChanges:
+    """Test klasa za inkrementalne promjene bez ponovne izgradnje indeksa"""
+
+    def test_changes_match_full_load(self, store):
+        rng = random.Random(7)
+        words = ["alpha", "bravo", "task", "job", "charlie"]
+        tickets = {ticket.id: ticket for ticket in store.snapshot()}
+        for _ in range(40):
+            upserts = [
+                make_ticket(
+                    rng.randint(1, 40),
+                    " ".join(rng.sample(words, 2)),
+                    rng.choice(["open", "closed"]),
+                    rng.choice(["low", "medium", "high"]),
+                    rng.choice(["emilys", "michaelw", "oliviaw", "sophiab"]),
+                )
+                for _ in range(rng.randint(0, 3))
+            ]
+            upserts = list({ticket.id: ticket for ticket in upserts}.values())
+            deleted = [
+                ticket_id
+                for ticket_id in rng.sample(sorted(tickets), min(2, len(tickets)))
+                if ticket_id not in {ticket.id for ticket in upserts}
+            ][: rng.randint(0, 2)]
+
+            store.apply_changes(upserts, deleted)
+            for ticket_id in deleted:
+                del tickets[ticket_id]
+            tickets.update((ticket.id, ticket) for ticket in upserts)
+
+            expected = TicketStore(transform_service=None, ttl=60)
+            expected.load(list(tickets.values()))
+            assert store_view(store) == store_view(expected)
+            assert store.snapshot() == expected.snapshot()
+
+    def test_unchanged_records_and_version_are_kept(self, store):
+        version = store.version
+        before = store.snapshot()
+        store.apply_changes([make_ticket(2, "Bravo task", "closed", "high", "x")], [])
+
+        assert store.version == version
+        assert store.get(2).status.value == "closed"
+        assert all(store.get(t.id) is t for t in before if t.id != 2)
+        # Snapshot uzet prije promjene ostaje nepromijenjen
+        assert before[1].status.value == "open"
+
+    def test_iteration_started_before_changes_sees_old_state(self, store):
+        batches = store.iter_batches(TicketFilters(sort="id"), batch_size=2)
+        assert ids(next(batches)) == [1, 2]
+        store.apply_changes([make_ticket(6, "new", "open", "low", "emilys")], [3])
+        assert [ids(batch) for batch in batches] == [[3, 4], [5]]
+        assert ids(store.query(TicketFilters(sort="id"))[0]) == [1, 2, 4, 5, 6]
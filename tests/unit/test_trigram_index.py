@@ -0,0 +1,57 @@
+"""
+Unit testovi za trigram indeks (fuzzy pretraga)
+"""
+
+from src.services.trigram_index import TrigramIndex, trigrams
+
+TITLES = [
+    "Memorize the fifty states and their capitals",
+    "Do something nice for someone I care about",
+    "Watch a classic movie",
+    "Memorize a poem",
+]
+
+
+class TestTrigrams:
+    """Test klasa za razlaganje na trigrame"""
+
+    def test_word_padding(self):
+        assert trigrams("Cat") == {"  c", " ca", "cat", "at "}
+
+    def test_punctuation_is_ignored(self):
+        assert trigrams("cat!") == trigrams("CAT")
+
+    def test_empty_text(self):
+        assert trigrams("  ...  ") == set()
+
+
+class TestTrigramIndex:
+    """Test klasa za pretragu trigram indeksa"""
+
+    def test_typo_still_matches(self):
+        index = TrigramIndex(TITLES)
+        positions = [position for position, _ in index.search("memorise", 0.5)]
+        assert positions == [0, 3]
+
+    def test_ranked_by_similarity(self):
+        index = TrigramIndex(TITLES)
+        results = index.search("clasic movei", 0.3)
+        assert results[0][0] == 2
+        assert all(
+            earlier[1] >= later[1] for earlier, later in zip(results, results[1:])
+        )
+
+    def test_threshold_filters_weak_matches(self):
+        index = TrigramIndex(TITLES)
+        assert index.search("memorise", 1.0) == []
+        assert index.search("zzzz", 0.1) == []
+
+    def test_candidates_are_bounded(self):
+        index = TrigramIndex(["task number %d" % i for i in range(50)], 5)
+        assert len(index.search("task", 0.5)) == 5
+
+    def test_bounded_candidates_keep_best_matches(self):
+        titles = ["task alpha"] * 25 + ["one alpha"] * 25 + ["task one"]
+        index = TrigramIndex(titles, 5)
+        results = index.search("task one", 0.5)
+        assert results[0] == (50, 1.0)
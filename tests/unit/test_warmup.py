@@ -0,0 +1,78 @@
+"""
+Unit testovi za zagrijavanje cacheova pri startu
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from src.models.record import TicketRecord
+from src.services.warmup import COLD, WARM, WARMING, Warmup
+
+
+class TestWarmup:
+    """Test klasa za stanje zagrijavanja"""
+
+    @pytest.mark.asyncio
+    async def test_not_ready_while_warming(self):
+        warmup = Warmup()
+        release = asyncio.Event()
+
+        warmup.start(release.wait, timeout=5)
+        assert (warmup.state, warmup.ready) == (WARMING, False)
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert (warmup.state, warmup.ready) == (WARM, True)
+        await warmup.stop()
+
+    @pytest.mark.asyncio
+    async def test_failure_and_timeout_leave_instance_ready_but_cold(self):
+        async def failing():
+            raise RuntimeError("upstream down")
+
+        warmup = Warmup()
+        await warmup.run(failing, timeout=5)
+        assert (warmup.state, warmup.ready) == (COLD, True)
+
+        await warmup.run(asyncio.Event().wait, timeout=0.01)
+        assert (warmup.state, warmup.ready) == (COLD, True)
+
+
+class TestWarmCaches:
+    """Test klasa za zagrijavanje korisnika, stranica i statistika"""
+
+    @pytest.mark.asyncio
+    @patch("src.api.tickets.store_sync.run", new_callable=AsyncMock)
+    @patch("src.services.external_api.ticket_transform_service.dummy_json_service")
+    async def test_warms_users_pages_and_stats(self, mock_service, mock_sync):
+        from src.api.tickets import stats_summary, warm_caches
+        from src.services.external_api import ticket_transform_service
+        from src.services.fragment_cache import fragment_cache
+        from src.services.ticket_store import ticket_store
+
+        mock_service.get_users = AsyncMock(
+            return_value={
+                "users": [
+                    {
+                        "id": 7,
+                        "username": "warm",
+                        "firstName": "W",
+                        "lastName": "U",
+                        "email": "w@example.com",
+                    }
+                ]
+            }
+        )
+        mock_sync.side_effect = lambda: ticket_store.load(
+            [TicketRecord(i, f"T{i}", "open", "low", "warm") for i in range(1, 41)]
+        )
+
+        with patch.dict(ticket_transform_service._user_cache):
+            await warm_caches(pages=2)
+            assert ticket_transform_service._user_cache[7].username == "warm"
+
+        mock_service.get_users.assert_awaited_once_with(limit=0)
+        mock_sync.assert_awaited_once()
+        assert len(fragment_cache) >= 40
+        assert stats_summary.is_fresh